@@ -2,12 +2,18 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
+import time
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
 
 from homeassistant import data_entry_flow
-from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
+from homeassistant.auth.const import (
+    ACCESS_TOKEN_EXPIRATION,
+    ACCESS_TOKEN_LEEWAY,
+    MAX_VALIDATED_ACCESS_TOKENS,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
@@ -153,6 +159,11 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Hash of validated access tokens to the id of their refresh token
+        # and the time they expire
+        self._validated_access_tokens: "OrderedDict[bytes, Tuple[str, float]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -446,6 +457,12 @@ class AuthManager:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
 
+        for token_hash, (refresh_token_id, _) in list(
+            self._validated_access_tokens.items()
+        ):
+            if refresh_token_id == refresh_token.id:
+                del self._validated_access_tokens[token_hash]
+
     @callback
     def async_create_access_token(
         self, refresh_token: models.RefreshToken, remote_ip: Optional[str] = None
@@ -504,6 +521,19 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        token_hash = hashlib.sha256(token.encode()).digest()
+        validated = self._validated_access_tokens.get(token_hash)
+
+        if validated is not None:
+            refresh_token_id, expires = validated
+            refresh_token = None
+            if time.time() <= expires:
+                # None once the refresh token or its user was removed
+                refresh_token = await self.async_get_refresh_token(refresh_token_id)
+            if refresh_token is not None:
+                return refresh_token if refresh_token.user.is_active else None
+            self._validated_access_tokens.pop(token_hash, None)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -521,11 +551,28 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
+            )
         except jwt.InvalidTokenError:
             return None
 
-        if refresh_token is None or not refresh_token.user.is_active:
+        if refresh_token is None:
+            return None
+
+        if "exp" in claims:
+            self._validated_access_tokens[token_hash] = (
+                refresh_token.id,
+                claims["exp"] + ACCESS_TOKEN_LEEWAY,
+            )
+            if len(self._validated_access_tokens) > MAX_VALIDATED_ACCESS_TOKENS:
+                self._validated_access_tokens.popitem(last=False)
+
+        if not refresh_token.user.is_active:
             return None
 
         return refresh_token
@@ -2,6 +2,7 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any, Dict, List, Optional
@@ -35,6 +36,9 @@ class AuthStore:
         """Initialize the auth store."""
         self.hass = hass
         self._users: Optional[Dict[str, models.User]] = None
+        # Refresh tokens of all users by id and by the hash of their token
+        self._refresh_tokens: Dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_hash: Dict[bytes, models.RefreshToken] = {}
         self._groups: Optional[Dict[str, models.Group]] = None
         self._perm_lookup: Optional[PermissionLookup] = None
         self._store = hass.helpers.storage.Store(
@@ -141,6 +145,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -225,6 +231,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_index_refresh_token(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -239,6 +246,7 @@ class AuthStore:
 
         for user in self._users.values():
             if user.refresh_tokens.pop(refresh_token.id, None):
+                self._async_unindex_refresh_token(refresh_token)
                 self._async_schedule_save()
                 break
 
@@ -250,12 +258,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -265,14 +268,25 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        found = self._refresh_tokens_by_hash.get(_token_hash(token))
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        # Only the hash was compared so far
+        if found is not None and hmac.compare_digest(found.token, token):
+            return found
 
-        return found
+        return None
+
+    @callback
+    def _async_index_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the lookup tables."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_hash[_token_hash(refresh_token.token)] = refresh_token
+
+    @callback
+    def _async_unindex_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the lookup tables."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        self._refresh_tokens_by_hash.pop(_token_hash(refresh_token.token), None)
 
     @callback
     def async_log_refresh_token_usage(
@@ -476,6 +490,7 @@ class AuthStore:
                 version=rt_dict.get("version"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_index_refresh_token(token)
 
         self._groups = groups
         self._users = users
@@ -605,3 +620,8 @@ def _system_read_only_group() -> models.Group:
         policy=system_policies.READ_ONLY_POLICY,
         system_generated=True,
     )
+
+
+def _token_hash(token: str) -> bytes:
+    """Return the hash refresh tokens are looked up by."""
+    return hashlib.sha256(token.encode()).digest()
@@ -4,6 +4,12 @@ from datetime import timedelta
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 
+# Seconds of clock skew accepted when validating access tokens
+ACCESS_TOKEN_LEEWAY = 10
+
+# Number of validated access tokens remembered
+MAX_VALIDATED_ACCESS_TOKENS = 1024
+
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
 GROUP_ID_READ_ONLY = "system-read-only"
@@ -21,6 +21,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_get_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -48,6 +49,9 @@ COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
 
+# Name used for the bootstrap stages in the setup timeline
+TIMELINE_DOMAIN = "bootstrap"
+
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = ("homeassistant", "persistent_notification")
 LOGGING_INTEGRATIONS = {
@@ -428,46 +432,48 @@ async def _async_set_up_integrations(
 ) -> None:
     """Set up all the integrations."""
     setup_started = hass.data[DATA_SETUP_STARTED] = {}
+    timeline = async_get_setup_timeline(hass)
     domains_to_setup = _get_domains(hass, config)
 
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start rightaway
     integration_cache: Dict[str, loader.Integration] = {}
     to_resolve = domains_to_setup
-    while to_resolve:
-        old_to_resolve = to_resolve
-        to_resolve = set()
-
-        integrations_to_process = [
-            int_or_exc
-            for int_or_exc in await gather_with_concurrency(
-                loader.MAX_LOAD_CONCURRENTLY,
-                *(
-                    loader.async_get_integration(hass, domain)
-                    for domain in old_to_resolve
-                ),
-                return_exceptions=True,
-            )
-            if isinstance(int_or_exc, loader.Integration)
-        ]
-        resolve_dependencies_tasks = [
-            itg.resolve_dependencies()
-            for itg in integrations_to_process
-            if not itg.all_dependencies_resolved
-        ]
+    with timeline.async_phase(hass, TIMELINE_DOMAIN, "resolve"):
+        while to_resolve:
+            old_to_resolve = to_resolve
+            to_resolve = set()
+
+            integrations_to_process = [
+                int_or_exc
+                for int_or_exc in await gather_with_concurrency(
+                    loader.MAX_LOAD_CONCURRENTLY,
+                    *(
+                        loader.async_get_integration(hass, domain)
+                        for domain in old_to_resolve
+                    ),
+                    return_exceptions=True,
+                )
+                if isinstance(int_or_exc, loader.Integration)
+            ]
+            resolve_dependencies_tasks = [
+                itg.resolve_dependencies()
+                for itg in integrations_to_process
+                if not itg.all_dependencies_resolved
+            ]
 
-        if resolve_dependencies_tasks:
-            await asyncio.gather(*resolve_dependencies_tasks)
+            if resolve_dependencies_tasks:
+                await asyncio.gather(*resolve_dependencies_tasks)
 
-        for itg in integrations_to_process:
-            integration_cache[itg.domain] = itg
+            for itg in integrations_to_process:
+                integration_cache[itg.domain] = itg
 
-            for dep in itg.all_dependencies:
-                if dep in domains_to_setup:
-                    continue
+                for dep in itg.all_dependencies:
+                    if dep in domains_to_setup:
+                        continue
 
-                domains_to_setup.add(dep)
-                to_resolve.add(dep)
+                    domains_to_setup.add(dep)
+                    to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
@@ -476,14 +482,18 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config, setup_started)
+        with timeline.async_phase(hass, TIMELINE_DOMAIN, "logging"):
+            await async_setup_multi_components(
+                hass, logging_domains, config, setup_started
+            )
 
     # Start up debuggers. Start these first in case they want to wait.
     debuggers = domains_to_setup & DEBUGGER_INTEGRATIONS
 
     if debuggers:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config, setup_started)
+        with timeline.async_phase(hass, TIMELINE_DOMAIN, "debuggers"):
+            await async_setup_multi_components(hass, debuggers, config, setup_started)
 
     # calculate what components to setup in what stage
     stage_1_domains = set()
@@ -519,12 +529,13 @@ async def _async_set_up_integrations(
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(
-                    hass, stage_1_domains, config, setup_started
-                )
+            with timeline.async_phase(hass, TIMELINE_DOMAIN, "stage_1"):
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(
+                        hass, stage_1_domains, config, setup_started
+                    )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -534,19 +545,23 @@ async def _async_set_up_integrations(
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(
-                    hass, stage_2_domains, config, setup_started
-                )
+            with timeline.async_phase(hass, TIMELINE_DOMAIN, "stage_2"):
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(
+                        hass, stage_2_domains, config, setup_started
+                    )
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+        with timeline.async_phase(hass, TIMELINE_DOMAIN, "wrap_up"):
+            async with hass.timeout.async_timeout(
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
+            ):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
@@ -2,13 +2,19 @@
 import asyncio
 import json
 import logging
-from typing import Optional
+from typing import Dict, Optional, Set
 
 import aiohttp
 import async_timeout
 
-from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
-from homeassistant.core import State
+from homeassistant.const import HTTP_ACCEPTED, STATE_ON
+from homeassistant.core import CALLBACK_TYPE, Event, State, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_added_domain,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.significant_change import create_checker
 import homeassistant.util.dt as dt_util
 
@@ -19,6 +25,61 @@ from .messages import AlexaResponse
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 
+# Time to wait for more changes of an entity before reporting its state
+CHANGE_REPORT_DELAY = 1
+
+# Maximum number of ChangeReports sent at the same time
+MAX_PARALLEL_REPORTS = 5
+
+# Signal sent when the entities exposed to Alexa may have changed
+SIGNAL_ALEXA_EXPOSED_UPDATED = "alexa_exposed_updated"
+
+
+class ChangeReporter:
+    """Send the ChangeReports of state changes.
+
+    The latest state of each entity is kept for CHANGE_REPORT_DELAY seconds
+    so that quick successive changes result in a single report. The reports
+    are then sent concurrently, at most MAX_PARALLEL_REPORTS at a time.
+    """
+
+    def __init__(self, hass, smart_home_config):
+        """Initialize the reporter."""
+        self.hass = hass
+        self.config = smart_home_config
+        self._pending: Dict[str, AlexaEntity] = {}
+        self._unsub_send: Optional[CALLBACK_TYPE] = None
+        self._semaphore = asyncio.Semaphore(MAX_PARALLEL_REPORTS)
+
+    @callback
+    def async_add(self, alexa_entity: AlexaEntity) -> None:
+        """Queue the ChangeReport of an entity."""
+        self._pending[alexa_entity.entity_id] = alexa_entity
+        if self._unsub_send is None:
+            self._unsub_send = async_call_later(
+                self.hass, CHANGE_REPORT_DELAY, self.async_send
+            )
+
+    async def async_send(self, _now=None) -> None:
+        """Send the queued ChangeReports."""
+        self.async_cancel()
+        pending, self._pending = self._pending, {}
+        await asyncio.gather(
+            *(self._async_send_one(alexa_entity) for alexa_entity in pending.values())
+        )
+
+    async def _async_send_one(self, alexa_entity: AlexaEntity) -> None:
+        """Send a ChangeReport when there is room."""
+        async with self._semaphore:
+            await async_send_changereport_message(self.hass, self.config, alexa_entity)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the queued ChangeReports."""
+        if self._unsub_send is not None:
+            self._unsub_send()
+            self._unsub_send = None
+
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
@@ -29,21 +90,29 @@ async def async_enable_proactive_mode(hass, smart_home_config):
     await smart_home_config.async_get_access_token()
 
     checker = await create_checker(hass, DOMAIN)
+    reporter = ChangeReporter(hass, smart_home_config)
 
-    async def async_entity_state_listener(
-        changed_entity: str,
-        old_state: Optional[State],
-        new_state: Optional[State],
-    ):
-        if not hass.is_running:
+    @callback
+    def async_entity_state_listener(event: Event):
+        # Added entities are reported by async_entity_added_listener
+        if event.data.get("old_state") is None:
             return
 
+        new_state: Optional[State] = event.data.get("new_state")
         if not new_state:
             return
 
+        async_report_state(new_state)
+
+    @callback
+    def async_report_state(new_state: State):
+        if not hass.is_running:
+            return
+
         if new_state.domain not in ENTITY_ADAPTERS:
             return
 
+        changed_entity = new_state.entity_id
         if not smart_home_config.should_expose(changed_entity):
             _LOGGER.debug("Not exposing %s because filtered by config", changed_entity)
             return
@@ -74,22 +143,66 @@ async def async_enable_proactive_mode(hass, smart_home_config):
             return
 
         if should_doorbell:
-            should_report = False
-
-        if should_report:
-            await async_send_changereport_message(
-                hass, smart_home_config, alexa_changed_entity
+            hass.async_create_task(
+                async_send_doorbell_event_message(
+                    hass, smart_home_config, alexa_changed_entity
+                )
             )
+            return
 
-        elif should_doorbell:
-            await async_send_doorbell_event_message(
-                hass, smart_home_config, alexa_changed_entity
-            )
+        reporter.async_add(alexa_changed_entity)
+
+    tracked: Set[str] = set()
+    unsub_tracked: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_track_exposed():
+        """Listen to the state changes of the exposed entities."""
+        nonlocal unsub_tracked
+        exposed = {
+            entity_id
+            for entity_id in hass.states.async_entity_ids(ENTITY_ADAPTERS)
+            if smart_home_config.should_expose(entity_id)
+        }
+        if exposed == tracked and unsub_tracked is not None:
+            return
+        if unsub_tracked is not None:
+            unsub_tracked()
+        tracked.clear()
+        tracked.update(exposed)
+        unsub_tracked = async_track_state_change_event(
+            hass, tracked, async_entity_state_listener
+        )
 
-    return hass.helpers.event.async_track_state_change(
-        MATCH_ALL, async_entity_state_listener
+    @callback
+    def async_entity_added_listener(event: Event):
+        new_state: Optional[State] = event.data.get("new_state")
+        if not new_state:
+            return
+        entity_id = new_state.entity_id
+        if entity_id not in tracked and smart_home_config.should_expose(entity_id):
+            async_track_exposed()
+        async_report_state(new_state)
+
+    async_track_exposed()
+    unsub_added = async_track_state_added_domain(
+        hass, ENTITY_ADAPTERS, async_entity_added_listener
+    )
+    unsub_exposed = async_dispatcher_connect(
+        hass, SIGNAL_ALEXA_EXPOSED_UPDATED, async_track_exposed
     )
 
+    @callback
+    def async_disable():
+        """Stop reporting state changes."""
+        unsub_exposed()
+        unsub_added()
+        if unsub_tracked is not None:
+            unsub_tracked()
+        reporter.async_cancel()
+
+    return async_disable
+
 
 async def async_send_changereport_message(
     hass, config, alexa_entity, *, invalidate_access_token=True
@@ -142,7 +255,7 @@ async def async_send_changereport_message(
 
     if (
         response_json["payload"]["code"] == "INVALID_ACCESS_TOKEN_EXCEPTION"
-        and not invalidate_access_token
+        and invalidate_access_token
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
@@ -1,13 +1,10 @@
 """Component to interface with cameras."""
 import asyncio
 import base64
-import collections
 from contextlib import suppress
 from datetime import timedelta
-import hashlib
 import logging
 import os
-from random import SystemRandom
 
 from aiohttp import web
 import async_timeout
@@ -16,6 +13,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http.auth import (
+    async_sign_entity_token,
+    async_validate_entity_token,
+)
 from homeassistant.components.media_player.const import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -81,10 +82,11 @@ SUPPORT_ON_OFF = 1
 SUPPORT_STREAM = 2
 
 DEFAULT_CONTENT_TYPE = "image/jpeg"
+ENTITY_PICTURE_URL = "/api/camera_proxy/{0}"
 ENTITY_IMAGE_URL = "/api/camera_proxy/{0}?token={1}"
 
-TOKEN_CHANGE_INTERVAL = timedelta(minutes=5)
-_RND = SystemRandom()
+# Signed tokens for the proxy views are handed out on request, valid this long
+TOKEN_VALIDITY = timedelta(minutes=15)
 
 MIN_STREAM_INTERVAL = 0.5  # seconds
 
@@ -164,6 +166,15 @@ async def async_get_image(hass, entity_id, timeout=10):
     raise HomeAssistantError("Unable to get image")
 
 
+@callback
+@bind_hass
+def async_sign_image_url(hass, entity_id):
+    """Return the url of the image of a camera with a signed token."""
+    return ENTITY_IMAGE_URL.format(
+        entity_id, async_sign_entity_token(hass, entity_id, TOKEN_VALIDITY)
+    )
+
+
 @bind_hass
 async def async_get_stream_source(hass, entity_id):
     """Fetch the stream source for a camera entity."""
@@ -257,6 +268,7 @@ async def async_setup(hass, config):
         WS_TYPE_CAMERA_THUMBNAIL, websocket_camera_thumbnail, SCHEMA_WS_CAMERA_THUMBNAIL
     )
     hass.components.websocket_api.async_register_command(ws_camera_stream)
+    hass.components.websocket_api.async_register_command(websocket_access_token)
     hass.components.websocket_api.async_register_command(websocket_get_prefs)
     hass.components.websocket_api.async_register_command(websocket_update_prefs)
 
@@ -278,15 +290,6 @@ async def async_setup(hass, config):
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, preload_stream)
 
-    @callback
-    def update_tokens(time):
-        """Update tokens of the entities."""
-        for entity in component.entities:
-            entity.async_update_token()
-            entity.async_write_ha_state()
-
-    hass.helpers.event.async_track_time_interval(update_tokens, TOKEN_CHANGE_INTERVAL)
-
     component.async_register_entity_service(
         SERVICE_ENABLE_MOTION, CAMERA_SERVICE_SCHEMA, "async_enable_motion_detection"
     )
@@ -332,8 +335,6 @@ class Camera(Entity):
         self.is_streaming = False
         self.stream_options = {}
         self.content_type = DEFAULT_CONTENT_TYPE
-        self.access_tokens: collections.deque = collections.deque([], 2)
-        self.async_update_token()
 
     @property
     def should_poll(self):
@@ -343,7 +344,7 @@ class Camera(Entity):
     @property
     def entity_picture(self):
         """Return a link to the camera feed as entity picture."""
-        return ENTITY_IMAGE_URL.format(self.entity_id, self.access_tokens[-1])
+        return ENTITY_PICTURE_URL.format(self.entity_id)
 
     @property
     def supported_features(self):
@@ -450,7 +451,7 @@ class Camera(Entity):
     @property
     def state_attributes(self):
         """Return the camera state attributes."""
-        attrs = {"access_token": self.access_tokens[-1]}
+        attrs = {}
 
         if self.model:
             attrs["model_name"] = self.model
@@ -463,13 +464,6 @@ class Camera(Entity):
 
         return attrs
 
-    @callback
-    def async_update_token(self):
-        """Update the used token."""
-        self.access_tokens.append(
-            hashlib.sha256(_RND.getrandbits(256).to_bytes(32, "little")).hexdigest()
-        )
-
 
 class CameraView(HomeAssistantView):
     """Base CameraView."""
@@ -487,9 +481,8 @@ class CameraView(HomeAssistantView):
         if camera is None:
             raise web.HTTPNotFound()
 
-        authenticated = (
-            request[KEY_AUTHENTICATED]
-            or request.query.get("token") in camera.access_tokens
+        authenticated = request[KEY_AUTHENTICATED] or async_validate_entity_token(
+            request.app["hass"], entity_id, request.query.get("token")
         )
 
         if not authenticated:
@@ -615,6 +608,29 @@ async def ws_camera_stream(hass, connection, msg):
         )
 
 
+@callback
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "camera/access_token",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+def websocket_access_token(hass, connection, msg):
+    """Handle request for a signed token of the proxy views of a camera."""
+    entity_id = msg["entity_id"]
+    if hass.data[DOMAIN].get_entity(entity_id) is None:
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "Camera not found"
+        )
+        return
+
+    token = async_sign_entity_token(hass, entity_id, TOKEN_VALIDITY)
+    connection.send_result(
+        msg["id"],
+        {"access_token": token, "url": ENTITY_IMAGE_URL.format(entity_id, token)},
+    )
+
+
 @websocket_api.async_response
 @websocket_api.websocket_command(
     {vol.Required("type"): "camera/get_prefs", vol.Required("entity_id"): cv.entity_id}
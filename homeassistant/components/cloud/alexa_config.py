@@ -16,6 +16,7 @@ from homeassistant.components.alexa import (
 from homeassistant.const import CLOUD_NEVER_EXPOSED_ENTITIES, HTTP_BAD_REQUEST
 from homeassistant.core import HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.dt import utcnow
 
@@ -177,6 +178,10 @@ class AlexaConfig(alexa_config.AbstractConfig):
         ):
             return
 
+        async_dispatcher_send(
+            self.hass, alexa_state_report.SIGNAL_ALEXA_EXPOSED_UPDATED
+        )
+
         if self._alexa_sync_unsub:
             self._alexa_sync_unsub()
             self._alexa_sync_unsub = None
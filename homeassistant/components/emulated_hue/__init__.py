@@ -185,7 +185,10 @@ class Config:
         self.hass = hass
         self.type = conf.get(CONF_TYPE)
         self.numbers = None
+        self._numbers_by_entity_id = {}
+        self._indexed_numbers = None
         self.cached_states = {}
+        self.cached_json = {}
         self._exposed_cache = {}
 
         if self.type == TYPE_ALEXA:
@@ -262,14 +265,21 @@ class Config:
             self.numbers = _load_json(self.hass.config.path(NUMBERS_FILE))
 
         # Google Home
-        for number, ent_id in self.numbers.items():
-            if entity_id == ent_id:
-                return number
+        if self._indexed_numbers is not self.numbers:
+            self._indexed_numbers = self.numbers
+            self._numbers_by_entity_id = {}
+            for number, ent_id in self.numbers.items():
+                self._numbers_by_entity_id.setdefault(ent_id, number)
+
+        number = self._numbers_by_entity_id.get(entity_id)
+        if number is not None:
+            return number
 
         number = "1"
         if self.numbers:
             number = str(max(int(k) for k in self.numbers) + 1)
         self.numbers[number] = entity_id
+        self._numbers_by_entity_id[entity_id] = number
         save_json(self.hass.config.path(NUMBERS_FILE), self.numbers)
         return number
 
@@ -2,9 +2,12 @@
 import asyncio
 import hashlib
 from ipaddress import ip_address
+import json
 import logging
 import time
 
+from aiohttp import web
+
 from homeassistant import core
 from homeassistant.components import (
     climate,
@@ -55,6 +58,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
     HTTP_UNAUTHORIZED,
@@ -68,6 +72,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
 )
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util.network import is_local
 
 _LOGGER = logging.getLogger(__name__)
@@ -212,7 +217,7 @@ class HueAllLightsStateView(HomeAssistantView):
         if not is_local(ip_address(request.remote)):
             return self.json_message("Only local IPs allowed", HTTP_UNAUTHORIZED)
 
-        return self.json(create_list_of_entities(self.config, request))
+        return create_json_response(create_list_of_entities(self.config, request))
 
 
 class HueFullStateView(HomeAssistantView):
@@ -234,12 +239,12 @@ class HueFullStateView(HomeAssistantView):
         if username != HUE_API_USERNAME:
             return self.json(UNAUTHORIZED_USER)
 
-        json_response = {
-            "lights": create_list_of_entities(self.config, request),
-            "config": create_config_model(self.config, request),
-        }
+        lights = create_list_of_entities(self.config, request)
+        config_model = json.dumps(
+            create_config_model(self.config, request), cls=JSONEncoder
+        )
 
-        return self.json(json_response)
+        return create_json_response(f'{{"lights":{lights},"config":{config_model}}}')
 
 
 class HueConfigView(HomeAssistantView):
@@ -692,8 +697,33 @@ def get_entity_state(config, entity):
     return data
 
 
+def _entity_json_entry(config, entity):
+    """Return the state, Hue representation and numbered light of an entity.
+
+    The representation only depends on the state of the entity, unless a state
+    was just set through the API, so it is kept until the entity changes.
+    """
+    entity_id = entity.entity_id
+    if entity_id in config.cached_states:
+        return [entity, _entity_to_json(config, entity), None]
+
+    entry = config.cached_json.get(entity_id)
+    if entry is None or entry[0] is not entity:
+        entry = config.cached_json[entity_id] = [
+            entity,
+            _entity_to_json(config, entity),
+            None,
+        ]
+    return entry
+
+
 def entity_to_json(config, entity):
     """Convert an entity to its Hue bridge JSON representation."""
+    return _entity_json_entry(config, entity)[1]
+
+
+def _entity_to_json(config, entity):
+    """Build the Hue bridge JSON representation of an entity."""
     entity_features = entity.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
     unique_id = hashlib.md5(entity.entity_id.encode()).hexdigest()
     unique_id = f"00:{unique_id[0:2]}:{unique_id[2:4]}:{unique_id[4:6]}:{unique_id[6:8]}:{unique_id[8:10]}:{unique_id[10:12]}:{unique_id[12:14]}-{unique_id[14:16]}"
@@ -810,15 +840,37 @@ def create_config_model(config, request):
 
 
 def create_list_of_entities(config, request):
-    """Create a list of all entities."""
+    """Create the serialized list of all entities.
+
+    Entities that did not change since the last list reuse their serialized
+    JSON, unless their number changed. Entities no longer in the list are
+    removed from the cache.
+    """
     hass = request.app["hass"]
-    json_response = {}
+    lights = []
+    seen = set()
 
     for entity in config.filter_exposed_entities(hass.states.async_all()):
+        seen.add(entity.entity_id)
+        entry = _entity_json_entry(config, entity)
         number = config.entity_id_to_number(entity.entity_id)
-        json_response[number] = entity_to_json(config, entity)
+        if entry[2] is None or entry[2][0] != number:
+            light = json.dumps({number: entry[1]}, cls=JSONEncoder, allow_nan=False)
+            # Strip the braces, the light is joined with the others
+            entry[2] = (number, light[1:-1])
+        lights.append(entry[2][1])
+
+    for entity_id in config.cached_json.keys() - seen:
+        del config.cached_json[entity_id]
+
+    return f"{{{','.join(lights)}}}"
+
 
-    return json_response
+def create_json_response(body):
+    """Create a response with a serialized JSON body."""
+    response = web.Response(body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON)
+    response.enable_compression()
+    return response
 
 
 def hue_brightness_to_hass(value):
@@ -5,7 +5,6 @@ from datetime import timedelta
 from functools import partial
 import logging
 from numbers import Number
-import statistics
 from typing import Optional
 
 import voluptuous as vol
@@ -35,6 +34,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util.decorator import Registry
 import homeassistant.util.dt as dt_util
+from homeassistant.util.sample_window import SampleWindow
 
 from . import DOMAIN, PLATFORMS
 
@@ -78,8 +78,8 @@ FILTER_SCHEMA = vol.Schema(
 FILTER_OUTLIER_SCHEMA = FILTER_SCHEMA.extend(
     {
         vol.Required(CONF_FILTER_NAME): FILTER_NAME_OUTLIER,
-        vol.Optional(CONF_FILTER_WINDOW_SIZE, default=DEFAULT_WINDOW_SIZE): vol.Coerce(
-            int
+        vol.Optional(CONF_FILTER_WINDOW_SIZE, default=DEFAULT_WINDOW_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
         ),
         vol.Optional(CONF_FILTER_RADIUS, default=DEFAULT_FILTER_RADIUS): vol.Coerce(
             float
@@ -90,8 +90,8 @@ FILTER_OUTLIER_SCHEMA = FILTER_SCHEMA.extend(
 FILTER_LOWPASS_SCHEMA = FILTER_SCHEMA.extend(
     {
         vol.Required(CONF_FILTER_NAME): FILTER_NAME_LOWPASS,
-        vol.Optional(CONF_FILTER_WINDOW_SIZE, default=DEFAULT_WINDOW_SIZE): vol.Coerce(
-            int
+        vol.Optional(CONF_FILTER_WINDOW_SIZE, default=DEFAULT_WINDOW_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
         ),
         vol.Optional(
             CONF_FILTER_TIME_CONSTANT, default=DEFAULT_FILTER_TIME_CONSTANT
@@ -122,8 +122,8 @@ FILTER_TIME_SMA_SCHEMA = FILTER_SCHEMA.extend(
 FILTER_THROTTLE_SCHEMA = FILTER_SCHEMA.extend(
     {
         vol.Required(CONF_FILTER_NAME): FILTER_NAME_THROTTLE,
-        vol.Optional(CONF_FILTER_WINDOW_SIZE, default=DEFAULT_WINDOW_SIZE): vol.Coerce(
-            int
+        vol.Optional(CONF_FILTER_WINDOW_SIZE, default=DEFAULT_WINDOW_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
         ),
     }
 )
@@ -523,11 +523,13 @@ class OutlierFilter(Filter):
         self._radius = radius
         self._stats_internal = Counter()
         self._store_raw = True
+        self._window = SampleWindow(window_size)
 
     def _filter_state(self, new_state):
         """Implement the outlier filter."""
 
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
+        median = self._window.median() if self._window else 0
+        self._window.append(new_state.state)
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state.state - median) > self._radius
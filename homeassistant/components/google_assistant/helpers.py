@@ -90,6 +90,7 @@ class AbstractConfig(ABC):
     """Hold the configuration for Google Assistant."""
 
     _unsub_report_state = None
+    report_state_aggregator = None
 
     def __init__(self, hass):
         """Initialize abstract config."""
@@ -1,8 +1,9 @@
 """Google Report State implementation."""
 import logging
+from typing import Dict, Optional
 
 from homeassistant.const import MATCH_ALL
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.significant_change import create_checker
 
@@ -14,14 +15,79 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes that are reported together
+REPORT_STATE_WINDOW = 1
+
+# Maximum number of entities in a single report
+MAX_REPORT_STATE_ENTITIES = 100
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class ReportStateAggregator:
+    """Collect the states to report and report them together."""
+
+    def __init__(self, hass: HomeAssistant, google_config: AbstractConfig):
+        """Initialize the aggregator."""
+        self.hass = hass
+        self.google_config = google_config
+        self._pending: Dict[str, dict] = {}
+        self._unsub_report: Optional[CALLBACK_TYPE] = None
+        # Number of reports sent, states reported and states replaced by a
+        # newer state of the same entity before they were reported
+        self.reports = 0
+        self.states = 0
+        self.merged = 0
+
+    @callback
+    def async_add(self, entity_id: str, entity_data: dict) -> None:
+        """Add the state of an entity to the next report."""
+        if entity_id in self._pending:
+            self.merged += 1
+        self._pending[entity_id] = entity_data
+
+        if len(self._pending) >= MAX_REPORT_STATE_ENTITIES:
+            self.hass.async_create_task(self.async_report())
+        elif self._unsub_report is None:
+            self._unsub_report = async_call_later(
+                self.hass, REPORT_STATE_WINDOW, self.async_report
+            )
+
+    async def async_report(self, _now=None) -> None:
+        """Report the collected states."""
+        self.async_cancel()
+        pending, self._pending = self._pending, {}
+        await self.async_report_states(pending)
+
+    async def async_report_states(self, states: Dict[str, dict]) -> None:
+        """Report states, split over reports of a limited size."""
+        entity_ids = list(states)
+        for index in range(0, len(entity_ids), MAX_REPORT_STATE_ENTITIES):
+            chunk = {
+                entity_id: states[entity_id]
+                for entity_id in entity_ids[index : index + MAX_REPORT_STATE_ENTITIES]
+            }
+            self.reports += 1
+            self.states += len(chunk)
+            await self.google_config.async_report_state_all(
+                {"devices": {"states": chunk}}
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the scheduled report."""
+        if self._unsub_report is not None:
+            self._unsub_report()
+            self._unsub_report = None
+
+
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
     checker = None
+    aggregator = google_config.report_state_aggregator = ReportStateAggregator(
+        hass, google_config
+    )
 
     async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
@@ -49,9 +115,7 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
         _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        aggregator.async_add(changed_entity, entity_data)
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -77,7 +141,7 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
-        await google_config.async_report_state_all({"devices": {"states": entities}})
+        await aggregator.async_report_states(entities)
 
         unsub = hass.helpers.event.async_track_state_change(
             MATCH_ALL, async_entity_state_listener
@@ -85,5 +149,10 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    # pylint: disable=unnecessary-lambda
-    return lambda: unsub()
+    @callback
+    def async_disable():
+        """Stop reporting states."""
+        unsub()
+        aggregator.async_cancel()
+
+    return async_disable
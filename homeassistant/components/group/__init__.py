@@ -34,6 +34,8 @@ from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import bind_hass
 
+from .util import StateCounter
+
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 
 DOMAIN = "group"
@@ -441,9 +443,10 @@ class Group(Entity):
         self._state = None
         self._icon = icon
         self._set_tracked(entity_ids)
-        self._on_off = None
-        self._assumed = None
-        self._on_states = None
+        self._on_off = StateCounter()
+        self._assumed = StateCounter()
+        # The on states each member contributed since it was counted
+        self._on_states = StateCounter()
         self.user_defined = user_defined
         self.mode = any
         if mode:
@@ -667,16 +670,16 @@ class Group(Entity):
 
         if new_state is None:
             # The state was removed from the state machine
-            self._reset_tracked_state()
+            self._forget_state(event.data["entity_id"])
 
         self._async_update_group_state(new_state)
         self.async_write_ha_state()
 
     def _reset_tracked_state(self):
         """Reset tracked state."""
-        self._on_off = {}
-        self._assumed = {}
-        self._on_states = set()
+        self._on_off.clear()
+        self._assumed.clear()
+        self._on_states.clear()
 
         for entity_id in self.trackable:
             state = self.hass.states.get(entity_id)
@@ -690,20 +693,35 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        self._assumed.set(entity_id, bool(new_state.attributes.get(ATTR_ASSUMED_STATE)))
+
+        on_states = self._on_states.get(entity_id) or frozenset()
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
             if state in registry.on_off_mapping:
-                self._on_states.add(state)
+                on_states = on_states | {state}
             elif state in registry.off_on_mapping:
-                self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+                on_states = on_states | {registry.off_on_mapping[state]}
+            self._on_off.set(entity_id, state in registry.on_off_mapping)
         else:
             entity_on_state = registry.on_states_by_domain[domain]
-            if domain in self.hass.data[REG_KEY].on_states_by_domain:
-                self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            on_states = on_states | entity_on_state
+            self._on_off.set(entity_id, state in entity_on_state)
+
+        self._on_states.set(entity_id, frozenset(on_states))
+
+    def _forget_state(self, entity_id):
+        """Stop counting a member that was removed."""
+        self._on_off.remove(entity_id)
+        self._assumed.remove(entity_id)
+        self._on_states.remove(entity_id)
+
+    def _mode_matches(self, counter):
+        """Return if the members counted as True satisfy the group mode."""
+        if self.mode is all:
+            return counter.all(True)
+        return counter.any(True)
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -726,17 +744,19 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_matches(self._assumed)
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
 
-        num_on_states = len(self._on_states)
+        # Members of the same domains contribute the same on states
+        on_states = set().union(*self._on_states.keys())
+        num_on_states = len(on_states)
         # If all the entity domains we are tracking
         # have the same on state we use this state
         # and its hass.data[REG_KEY].on_off_mapping to off
         if num_on_states == 1:
-            on_state = list(self._on_states)[0]
+            on_state = list(on_states)[0]
         # If we do not have an on state for any domains
         # we use None (which will be STATE_UNKNOWN)
         elif num_on_states == 0:
@@ -746,7 +766,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_matches(self._on_off)
         if group_is_on:
             self._state = on_state
         else:
@@ -0,0 +1,70 @@
+"""Utilities for aggregating the state of group members."""
+from typing import Dict, Hashable, KeysView, Optional
+
+
+class StateCounter:
+    """Count the members of a group per key derived from their state.
+
+    The counts are updated on every member transition so the aggregated
+    state of a group can be found without scanning all members.
+    """
+
+    __slots__ = ("_keys", "_counts")
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self._keys: Dict[str, Hashable] = {}
+        self._counts: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of members counted."""
+        return len(self._keys)
+
+    def clear(self) -> None:
+        """Forget all members."""
+        self._keys.clear()
+        self._counts.clear()
+
+    def set(self, entity_id: str, key: Hashable) -> None:
+        """Set the key of a member."""
+        keys = self._keys
+        if entity_id in keys:
+            old_key = keys[entity_id]
+            if old_key == key:
+                return
+            self._decrement(old_key)
+        keys[entity_id] = key
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def get(self, entity_id: str) -> Optional[Hashable]:
+        """Return the key of a member, None if it is not counted."""
+        return self._keys.get(entity_id)
+
+    def keys(self) -> KeysView[Hashable]:
+        """Return the distinct keys of the members."""
+        return self._counts.keys()
+
+    def remove(self, entity_id: str) -> None:
+        """Stop counting a member."""
+        if entity_id in self._keys:
+            self._decrement(self._keys.pop(entity_id))
+
+    def count(self, key: Hashable) -> int:
+        """Return the number of members with key."""
+        return self._counts.get(key, 0)
+
+    def any(self, key: Hashable) -> bool:
+        """Return if any member has key."""
+        return key in self._counts
+
+    def all(self, key: Hashable) -> bool:
+        """Return if all members have key."""
+        return self._counts.get(key, 0) == len(self._keys)
+
+    def _decrement(self, key: Hashable) -> None:
+        """Decrement the count of key."""
+        count = self._counts[key] - 1
+        if count:
+            self._counts[key] = count
+        else:
+            del self._counts[key]
@@ -3,7 +3,7 @@ import asyncio
 from ipaddress import ip_address
 import logging
 import os
-from typing import Dict, Union
+from typing import AsyncIterator, Dict, Union
 
 import aiohttp
 from aiohttp import hdrs, web
@@ -18,6 +18,13 @@ from .const import X_HASSIO, X_INGRESS_PATH
 
 _LOGGER = logging.getLogger(__name__)
 
+# Responses up to this size are read at once, larger ones are streamed
+MAX_SIMPLE_RESPONSE_SIZE = 65536
+
+# Request bodies are streamed to the add-on, this leaves room for uploading
+# large backups
+MAX_REQUEST_BODY_SIZE = 64 * 1024 ** 3
+
 
 @callback
 def async_setup_ingress_view(hass: HomeAssistantType, host: str):
@@ -117,9 +124,14 @@ class HassIOIngress(HomeAssistantView):
     ) -> Union[web.Response, web.StreamResponse]:
         """Ingress route for request."""
         url = self._create_url(token, path)
-        data = await request.read()
         source_header = _init_header(request, token)
 
+        data = None
+        if request.body_exists:
+            data = _request_body(request)
+            if data is request.content:
+                source_header[hdrs.CONTENT_LENGTH] = str(request.content_length)
+
         async with self._websession.request(
             request.method,
             url,
@@ -129,11 +141,12 @@ class HassIOIngress(HomeAssistantView):
             data=data,
         ) as result:
             headers = _response_header(result)
+            content_length = result.headers.get(hdrs.CONTENT_LENGTH)
 
             # Simple request
             if (
-                hdrs.CONTENT_LENGTH in result.headers
-                and int(result.headers.get(hdrs.CONTENT_LENGTH, 0)) < 4194000
+                content_length is not None
+                and int(content_length) <= MAX_SIMPLE_RESPONSE_SIZE
             ):
                 # Return Response
                 body = await result.read()
@@ -147,11 +160,19 @@ class HassIOIngress(HomeAssistantView):
             # Stream response
             response = web.StreamResponse(status=result.status, headers=headers)
             response.content_type = result.content_type
+            if (
+                content_length is not None
+                and hdrs.CONTENT_ENCODING not in result.headers
+            ):
+                response.content_length = int(content_length)
 
             try:
                 await response.prepare(request)
-                async for data in result.content.iter_chunked(4096):
-                    await response.write(data)
+                # Forward the chunks as received, as large as the upstream
+                # delivers them. write waits while the client is behind, which
+                # in turn stops reading from the upstream.
+                async for chunk, _ in result.content.iter_chunks():
+                    await response.write(chunk)
 
             except (aiohttp.ClientError, aiohttp.ClientPayloadError) as err:
                 _LOGGER.debug("Stream error %s / %s: %s", token, path, err)
@@ -170,6 +191,7 @@ def _init_header(
         if name in (
             hdrs.CONTENT_LENGTH,
             hdrs.CONTENT_ENCODING,
+            hdrs.TRANSFER_ENCODING,
             hdrs.SEC_WEBSOCKET_EXTENSIONS,
             hdrs.SEC_WEBSOCKET_PROTOCOL,
             hdrs.SEC_WEBSOCKET_VERSION,
@@ -208,6 +230,39 @@ def _init_header(
     return headers
 
 
+def _request_body(
+    request: web.Request,
+) -> Union[aiohttp.StreamReader, AsyncIterator[bytes]]:
+    """Return the body of a request to stream to the add-on.
+
+    A body of a known length is refused at once when it is larger than
+    MAX_REQUEST_BODY_SIZE, its content stops at that length. Chunked and
+    compressed bodies are checked while they are forwarded, compressed ones
+    on their decompressed size.
+    """
+    content_length = request.content_length
+    if content_length is None or hdrs.CONTENT_ENCODING in request.headers:
+        return _limited_body(request.content)
+
+    if content_length > MAX_REQUEST_BODY_SIZE:
+        raise web.HTTPRequestEntityTooLarge(
+            max_size=MAX_REQUEST_BODY_SIZE, actual_size=content_length
+        )
+    return request.content
+
+
+async def _limited_body(content: aiohttp.StreamReader) -> AsyncIterator[bytes]:
+    """Forward the chunks of content up to MAX_REQUEST_BODY_SIZE."""
+    size = 0
+    async for chunk in content.iter_any():
+        size += len(chunk)
+        if size > MAX_REQUEST_BODY_SIZE:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=MAX_REQUEST_BODY_SIZE, actual_size=size
+            )
+        yield chunk
+
+
 def _response_header(response: aiohttp.ClientResponse) -> Dict[str, str]:
     """Create response header."""
     headers = {}
@@ -1,4 +1,5 @@
 """Component to make instant statistics about your history."""
+from bisect import bisect_right
 import datetime
 import logging
 import math
@@ -46,6 +47,9 @@ UNITS = {
 }
 ICON = "mdi:chart-line"
 
+# The state changes measured are folded into totals once more are kept
+MAX_KEPT_CHANGES = 1000
+
 ATTR_VALUE = "value"
 
 
@@ -122,6 +126,13 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # Once state changes are tracked, the changes since the start of the
+        # window are kept and updated from the state changed events
+        self._tracking = False
+        self._changed = False
+        self._history = None
+        self._pending = []
+
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
 
@@ -134,10 +145,31 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the state change and refresh."""
+                old_state = event.data.get("old_state")
+                new_state = event.data.get("new_state")
+                if new_state is not None and (
+                    old_state is None or old_state.state != new_state.state
+                ):
+                    change = (
+                        new_state.last_changed.timestamp(),
+                        new_state.state in self._entity_states,
+                    )
+                    self._changed = True
+                    if self._history is not None:
+                        self._history[1].append(change)
+                    else:
+                        # The database might not have the change yet
+                        self._pending.append(change)
+                force_refresh()
+
+            self._tracking = True
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -187,8 +219,67 @@ class HistoryStatsSensor(Entity):
         """Return the icon to use in the frontend, if any."""
         return ICON
 
+    async def async_update(self):
+        """Get the latest data and updates the states.
+
+        The state changes of the window are loaded once and then kept up to
+        date from the state changed events. The database is only queried
+        again if the window starts before the changes kept.
+        """
+        if not self._tracking:
+            await self.hass.async_add_executor_job(self.update)
+            return
+
+        changed, self._changed = self._changed, False
+        window = await self.hass.async_add_executor_job(self._update_window, changed)
+        if window is None:
+            return
+        start, start_timestamp, end_timestamp, now_timestamp = window
+
+        if self._history is not None and start_timestamp > self._history[0][0]:
+            self._history = self._trim_history(self._history, start_timestamp)
+
+        if self._history is None or start_timestamp < self._history[0][0]:
+            self._history = None
+            try:
+                history = await self.hass.async_add_executor_job(
+                    self._load_history, start, dt_util.utcnow()
+                )
+            finally:
+                pending, self._pending = self._pending, []
+            if history is None:
+                return
+            last_time = history[1][-1][0] if history[1] else history[0][1]
+            history[1].extend(change for change in pending if change[0] > last_time)
+            self._history = history
+
+        self._measure(self._history, start_timestamp, end_timestamp, now_timestamp)
+
+        if len(self._history[1]) > MAX_KEPT_CHANGES:
+            # Like measuring, only skip the changes after the end of a past window
+            self._history = self._fold_history(
+                self._history,
+                end_timestamp if end_timestamp < now_timestamp else math.inf,
+            )
+
     def update(self):
         """Get the latest data and updates the states."""
+        window = self._update_window()
+        if window is None:
+            return
+        start, start_timestamp, end_timestamp, now_timestamp = window
+
+        history = self._load_history(start, dt_util.as_utc(self._period[1]))
+        if history is None:
+            return
+
+        self._measure(history, start_timestamp, end_timestamp, now_timestamp)
+
+    def _update_window(self, changed=False):
+        """Update the period and return its start and timestamps.
+
+        Returns None if the value cannot have changed since the last update.
+        """
         # Get previous values of start and end
         p_start, p_end = self._period
 
@@ -212,32 +303,83 @@ class HistoryStatsSensor(Entity):
 
         # If period has not changed and current time after the period end...
         if (
-            start_timestamp == p_start_timestamp
+            not changed
+            and start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
         ):
             # Don't compute anything as the value cannot have changed
-            return
+            return None
+
+        return start, start_timestamp, end_timestamp, now_timestamp
 
+    def _load_history(self, start, end):
+        """Load the state changes between start and end from the database.
+
+        Returns the totals of the window, and the list of timestamps of the
+        changes with if the entity was in one of the states after them. The
+        totals are the timestamp of start, the timestamp and state up to which
+        the changes are folded into the totals, the time in the states and the
+        number of times the entity entered them.
+        """
         # Get history between start and end
         history_list = history.state_changes_during_period(
             self.hass, start, end, str(self._entity_id)
         )
 
         if self._entity_id not in history_list:
-            return
+            return None
 
         # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
+        first_state = history.get_state(self.hass, start, self._entity_id)
+        first_state = (
+            first_state is not None and first_state.state in self._entity_states
+        )
+
+        changes = [
+            (item.last_changed.timestamp(), item.state in self._entity_states)
+            for item in history_list.get(self._entity_id)
+        ]
+        start_timestamp = math.floor(dt_util.as_timestamp(start))
+        return (start_timestamp, start_timestamp, first_state, 0, 0), changes
+
+    @staticmethod
+    def _trim_history(history, start_timestamp):
+        """Drop the state changes before the start of the window.
+
+        Returns None if changes after the start were folded into the totals.
+        """
+        (window_start, last_time, last_state, _, _), changes = history
+        if last_time > window_start:
+            return None
+        index = bisect_right(changes, (start_timestamp, True))
+        if index:
+            last_state = changes[index - 1][1]
+        return (start_timestamp, start_timestamp, last_state, 0, 0), changes[index:]
+
+    @staticmethod
+    def _fold_history(history, until):
+        """Fold the state changes up to until into the totals of the window."""
+        (window_start, last_time, last_state, elapsed, count), changes = history
+        index = bisect_right(changes, (until, True))
+        for current_time, current_state in changes[:index]:
+            if last_state:
+                elapsed += current_time - last_time
+            if current_state and not last_state:
+                count += 1
+            last_state = current_state
+            last_time = current_time
+        return (window_start, last_time, last_state, elapsed, count), changes[index:]
+
+    def _measure(self, history, start_timestamp, end_timestamp, now_timestamp):
+        """Measure the time and number of times in the states during the window."""
+        (_, last_time, last_state, elapsed, count), changes = history
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in changes:
+            if end_timestamp < now_timestamp and current_time > end_timestamp:
+                # Changes after the end of a past window
+                break
 
             if last_state:
                 elapsed += current_time - last_time
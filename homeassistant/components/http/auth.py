@@ -1,4 +1,6 @@
 """Authentication for HTTP component."""
+import hashlib
+import hmac
 import logging
 import secrets
 
@@ -17,6 +19,7 @@ _LOGGER = logging.getLogger(__name__)
 
 DATA_API_PASSWORD = "api_password"
 DATA_SIGN_SECRET = "http.auth.sign_secret"
+DATA_ENTITY_SIGN_SECRET = "http.auth.entity_sign_secret"
 SIGN_QUERY_PARAM = "authSig"
 
 
@@ -37,6 +40,47 @@ def async_sign_path(hass, refresh_token_id, path, expiration):
     return f"{path}?{SIGN_QUERY_PARAM}=" f"{encoded.decode()}"
 
 
+@callback
+def _async_entity_token_signature(hass, entity_id, expires):
+    """Return the signature of the token of an entity expiring at expires."""
+    secret = hass.data.get(DATA_ENTITY_SIGN_SECRET)
+
+    if secret is None:
+        secret = hass.data[DATA_ENTITY_SIGN_SECRET] = secrets.token_bytes(32)
+
+    return hmac.new(
+        secret, f"{entity_id}.{expires}".encode(), hashlib.sha256
+    ).hexdigest()
+
+
+@callback
+def async_sign_entity_token(hass, entity_id, expiration):
+    """Return a token for the proxy views of an entity, valid for expiration.
+
+    The token holds its expiry and a signature of it and the entity id, so it
+    is validated without keeping any state.
+    """
+    expires = int((dt_util.utcnow() + expiration).timestamp())
+    return f"{expires}.{_async_entity_token_signature(hass, entity_id, expires)}"
+
+
+@callback
+def async_validate_entity_token(hass, entity_id, token):
+    """Return if token is an unexpired token signed for entity_id."""
+    try:
+        expires, signature = token.split(".", 1)
+        expires = int(expires)
+    except (AttributeError, ValueError):
+        return False
+
+    if expires < dt_util.utcnow().timestamp():
+        return False
+
+    return hmac.compare_digest(
+        signature, _async_entity_token_signature(hass, entity_id, expires)
+    )
+
+
 @callback
 def setup_auth(hass, app):
     """Create auth middleware for the app."""
@@ -1,8 +1,13 @@
 """Static file handling for HTTP component."""
+import asyncio
+from functools import lru_cache, partial
+import mimetypes
 from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.web import BaseRequest, FileResponse, Request, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
@@ -11,12 +16,105 @@ from aiohttp.web_urldispatcher import StaticResource
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Maximum number of resolved files kept per static resource
+MAX_CACHED_FILES = 4096
+
+# Precompressed variants we look for next to a file, in order of preference
+ENCODING_EXTENSIONS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class StaticFile(NamedTuple):
+    """A resolved static file with its precompressed variants."""
+
+    content_type: str
+    path: Path
+    encoded: Dict[str, Path]
+
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> FrozenSet[str]:
+    """Return the content codings an Accept-Encoding header accepts."""
+    accepted = set()
+    rejected = set()
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == "*":
+            wildcard = quality > 0
+        elif quality > 0:
+            accepted.add(coding)
+        else:
+            rejected.add(coding)
+
+    if wildcard:
+        accepted.update(
+            encoding for encoding, _ in ENCODING_EXTENSIONS if encoding not in rejected
+        )
+    return frozenset(accepted)
+
+
+class StaticFileResponse(FileResponse):
+    """A FileResponse for a resolved variant of a static file."""
+
+    def __init__(
+        self, path: Path, on_missing: Callable[[], Any], **kwargs: Any
+    ) -> None:
+        """Initialize the response."""
+        super().__init__(path, **kwargs)
+        self._on_missing = on_missing
+
+    async def prepare(self, request: BaseRequest) -> Optional[AbstractStreamWriter]:
+        """Send the file, or a 404 if it was removed since it was resolved."""
+        if "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, ""):
+            # The variant was chosen already, keep FileResponse from
+            # looking for a .gz file next to it
+            headers = request.headers.copy()
+            del headers[hdrs.ACCEPT_ENCODING]
+            request = request.clone(headers=headers)
+
+        try:
+            return await super().prepare(request)
+        except FileNotFoundError:
+            if self.prepared:
+                raise
+        self._on_missing()
+        for name in (hdrs.CACHE_CONTROL, hdrs.CONTENT_ENCODING, hdrs.VARY):
+            self.headers.pop(name, None)
+        self.set_status(HTTPNotFound.status_code)
+        self.content_length = 0
+        return await StreamResponse.prepare(self, request)
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
 
-    async def _handle(self, request):
-        rel_url = request.match_info["filename"]
+    Files and their precompressed .br and .gz variants are resolved once in
+    the executor and kept in memory, the chosen variant is served with a
+    FileResponse so changes to its content are picked up. A file removed
+    since it was resolved is resolved again on the next request.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._files: Dict[str, StaticFile] = {}
+
+    def _resolve_file(self, rel_url: str) -> Optional[StaticFile]:
+        """Resolve rel_url to a file in the directory.
+
+        Returns None if it is a directory. Must run in the executor.
+        """
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -30,19 +128,62 @@ class CachingStaticResource(StaticResource):
         except (ValueError, FileNotFoundError) as error:
             # relatively safe
             raise HTTPNotFound() from error
-        except Exception as error:
-            # perm error or other kind!
-            request.app.logger.exception(error)
-            raise HTTPNotFound() from error
 
         # on opening a dir, load its contents if allowed
         if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+            return None
+
+        if not filepath.is_file():
+            raise HTTPNotFound
+
+        encoded = {}
+        for encoding, extension in ENCODING_EXTENSIONS:
+            variant = filepath.with_name(filepath.name + extension)
+            if variant.is_file():
+                encoded[encoding] = variant
+
+        content_type = mimetypes.guess_type(filepath.name)[0]
+        return StaticFile(content_type or "application/octet-stream", filepath, encoded)
+
+    async def _handle(self, request: Request) -> StreamResponse:
+        rel_url = request.match_info["filename"]
+        static_file = self._files.get(rel_url)
+
+        if static_file is None:
+            try:
+                static_file = await asyncio.get_running_loop().run_in_executor(
+                    None, self._resolve_file, rel_url
+                )
+            except (HTTPForbidden, HTTPNotFound):
+                raise
+            except Exception as error:
+                # perm error or other kind!
+                request.app.logger.exception(error)
+                raise HTTPNotFound() from error
+
+            if static_file is None:
+                return await super()._handle(request)
+
+            if len(self._files) >= MAX_CACHED_FILES:
+                del self._files[next(iter(self._files))]
+            self._files[rel_url] = static_file
+
+        headers = {**CACHE_HEADERS, hdrs.CONTENT_TYPE: static_file.content_type}
+        path = static_file.path
+        if static_file.encoded:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+            accepted = _accepted_encodings(
+                request.headers.get(hdrs.ACCEPT_ENCODING, "")
             )
-        raise HTTPNotFound
+            for encoding, encoded_path in static_file.encoded.items():
+                if encoding in accepted:
+                    headers[hdrs.CONTENT_ENCODING] = encoding
+                    path = encoded_path
+                    break
+
+        return StaticFileResponse(
+            path,
+            partial(self._files.pop, rel_url, None),
+            chunk_size=self._chunk_size,
+            headers=headers,
+        )
@@ -5,6 +5,7 @@ import logging
 
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, CONF_ENTITY_ID, CONF_NAME
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
@@ -14,6 +15,8 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.util.async_ import run_callback_threadsafe
 
+from .batch import async_get_statistics
+
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,10 +87,20 @@ async def async_setup(hass, config):
     hass.services.async_register(
         DOMAIN, SERVICE_SCAN, async_scan_service, schema=make_entity_service_schema({})
     )
+    hass.components.websocket_api.async_register_command(websocket_inference_statistics)
 
     return True
 
 
+@callback
+@websocket_api.websocket_command(
+    {vol.Required("type"): "image_processing/inference_statistics"}
+)
+def websocket_inference_statistics(hass, connection, msg):
+    """Return the statistics of the models processing images in batches."""
+    connection.send_result(msg["id"], async_get_statistics(hass))
+
+
 class ImageProcessingEntity(Entity):
     """Base entity class for image processing."""
 
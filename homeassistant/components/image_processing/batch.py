@@ -0,0 +1,129 @@
+"""Process the images of several image processing entities in batches."""
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_INFERENCE_QUEUES = "image_processing_inference_queues"
+
+# Images queued within this many seconds of the first one share a batch
+BATCH_DELAY = 0.1
+
+# Largest number of images processed at once
+MAX_BATCH_SIZE = 16
+
+BatchFunction = Callable[[Sequence[Any]], Sequence[Any]]
+
+
+class InferenceQueue:
+    """Queue the images of the entities sharing a model.
+
+    The images queued within the batch delay are handed to process_batch at
+    once, in the executor, so a model runs one inference per batch instead of
+    one per entity. process_batch returns a result per image, in order.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        process_batch: BatchFunction,
+        batch_delay: float = BATCH_DELAY,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.name = name
+        self._process_batch = process_batch
+        self._batch_delay = batch_delay
+        self._max_batch_size = max_batch_size
+        self._pending: List[Tuple[Any, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+        self.images = 0
+        self.process_time = 0.0
+        self.queue_time = 0.0
+        hass.data.setdefault(DATA_INFERENCE_QUEUES, []).append(self)
+
+    async def async_process(self, image: Any) -> Any:
+        """Queue an image and return its result once its batch ran."""
+        future = self.hass.loop.create_future()
+        self._pending.append((image, future, monotonic()))
+        if len(self._pending) >= self._max_batch_size:
+            self._async_flush()
+        elif self._timer is None:
+            self._timer = self.hass.loop.call_later(
+                self._batch_delay, self._async_flush
+            )
+        return await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Start processing the queued images."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self.hass.async_create_task(self._async_run(batch))
+
+    async def _async_run(self, batch: List[Tuple[Any, asyncio.Future, float]]) -> None:
+        """Process a batch in the executor and hand out the results."""
+        start = monotonic()
+        try:
+            results = await self.hass.async_add_executor_job(
+                self._process_batch, [image for image, _, _ in batch]
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        process_time = monotonic() - start
+        queue_time = sum(start - queued for _, _, queued in batch)
+        self.batches += 1
+        self.images += len(batch)
+        self.process_time += process_time
+        self.queue_time += queue_time
+        _LOGGER.debug(
+            "Processed %d images of %s in %.3f seconds, queued for %.3f seconds",
+            len(batch),
+            self.name,
+            process_time,
+            queue_time / len(batch),
+        )
+
+        for (_, future, _), result in zip(batch, results):
+            # The entity might have stopped waiting
+            if not future.done():
+                future.set_result(result)
+
+    @callback
+    def async_statistics(self) -> Dict[str, Any]:
+        """Return the throughput and queue latency of the model."""
+        return {
+            "batches": self.batches,
+            "images": self.images,
+            "mean_batch_size": round(self.images / self.batches, 2)
+            if self.batches
+            else 0.0,
+            "images_per_second": round(self.images / self.process_time, 2)
+            if self.process_time
+            else 0.0,
+            "mean_queue_time": round(self.queue_time / self.images, 6)
+            if self.images
+            else 0.0,
+        }
+
+
+@callback
+def async_get_statistics(hass: HomeAssistant) -> List[Dict[str, Any]]:
+    """Return the statistics of the inference queues."""
+    return [
+        {"name": queue.name, **queue.async_statistics()}
+        for queue in hass.data.get(DATA_INFERENCE_QUEUES, [])
+    ]
@@ -1,7 +1,6 @@
 """Component to interface with various media players."""
 import asyncio
 import base64
-import collections
 from datetime import timedelta
 import functools as ft
 import hashlib
@@ -19,6 +18,10 @@ from yarl import URL
 
 from homeassistant.components import websocket_api
 from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http.auth import (
+    async_sign_entity_token,
+    async_validate_entity_token,
+)
 from homeassistant.components.websocket_api.const import (
     ERR_NOT_FOUND,
     ERR_NOT_SUPPORTED,
@@ -49,6 +52,7 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_PLAYING,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import (  # noqa: F401
@@ -116,6 +120,7 @@ from .const import (
     SUPPORT_VOLUME_STEP,
 )
 from .errors import BrowseError
+from .image_cache import async_get_image_cache
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -123,15 +128,13 @@ _LOGGER = logging.getLogger(__name__)
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
-CACHE_IMAGES = "images"
-CACHE_MAXSIZE = "maxsize"
-CACHE_LOCK = "lock"
-CACHE_URL = "url"
-CACHE_CONTENT = "content"
-ENTITY_IMAGE_CACHE = {CACHE_IMAGES: collections.OrderedDict(), CACHE_MAXSIZE: 16}
 
 SCAN_INTERVAL = timedelta(seconds=10)
 
+# The urls of media browser images are signed and valid this long. They are
+# not part of the state, the entity picture keeps using the access token.
+BROWSE_IMAGE_TOKEN_VALIDITY = timedelta(hours=1)
+
 DEVICE_CLASS_TV = "tv"
 DEVICE_CLASS_SPEAKER = "speaker"
 DEVICE_CLASS_RECEIVER = "receiver"
@@ -213,6 +216,9 @@ async def async_setup(hass, config):
 
     hass.components.websocket_api.async_register_command(websocket_handle_thumbnail)
     hass.components.websocket_api.async_register_command(websocket_browse_media)
+    hass.components.websocket_api.async_register_command(
+        websocket_image_cache_statistics
+    )
     hass.http.register_view(MediaPlayerImageView(component))
 
     await component.async_setup(config)
@@ -862,29 +868,12 @@ class MediaPlayerEntity(Entity):
     async def _async_fetch_image_from_cache(self, url):
         """Fetch image.
 
-        Images are cached in memory (the images are typically 10-100kB in size).
+        Images are cached in memory, shared by all media players.
         """
-        cache_images = ENTITY_IMAGE_CACHE[CACHE_IMAGES]
-        cache_maxsize = ENTITY_IMAGE_CACHE[CACHE_MAXSIZE]
-
         if urlparse(url).hostname is None:
             url = f"{get_url(self.hass)}{url}"
 
-        if url not in cache_images:
-            cache_images[url] = {CACHE_LOCK: asyncio.Lock()}
-
-        async with cache_images[url][CACHE_LOCK]:
-            if CACHE_CONTENT in cache_images[url]:
-                return cache_images[url][CACHE_CONTENT]
-
-        (content, content_type) = await self._async_fetch_image(url)
-
-        async with cache_images[url][CACHE_LOCK]:
-            cache_images[url][CACHE_CONTENT] = content, content_type
-            while len(cache_images) > cache_maxsize:
-                cache_images.popitem(last=False)
-
-        return content, content_type
+        return await async_get_image_cache(self.hass).async_get(url)
 
     async def _async_fetch_image(self, url):
         """Retrieve an image."""
@@ -920,7 +909,11 @@ class MediaPlayerEntity(Entity):
             f"/{media_content_type}/{media_content_id}"
         )
 
-        url_query = {"token": self.access_token}
+        url_query = {
+            "token": async_sign_entity_token(
+                self.hass, self.entity_id, BROWSE_IMAGE_TOKEN_VALIDITY
+            )
+        }
         if media_image_id:
             url_query["media_image_id"] = media_image_id
 
@@ -954,9 +947,11 @@ class MediaPlayerImageView(HomeAssistantView):
             status = HTTP_NOT_FOUND if request[KEY_AUTHENTICATED] else HTTP_UNAUTHORIZED
             return web.Response(status=status)
 
+        token = request.query.get("token")
         authenticated = (
             request[KEY_AUTHENTICATED]
-            or request.query.get("token") == player.access_token
+            or token == player.access_token
+            or async_validate_entity_token(request.app["hass"], entity_id, token)
         )
 
         if not authenticated:
@@ -1093,6 +1088,15 @@ async def websocket_browse_media(hass, connection, msg):
     connection.send_result(msg["id"], payload)
 
 
+@callback
+@websocket_api.websocket_command(
+    {vol.Required("type"): "media_player/image_cache_statistics"}
+)
+def websocket_image_cache_statistics(hass, connection, msg):
+    """Return the statistics of the cache of the proxied images."""
+    connection.send_result(msg["id"], async_get_image_cache(hass).async_statistics())
+
+
 class MediaPlayerDevice(MediaPlayerEntity):
     """ABC for media player devices (for backwards compatibility)."""
 
@@ -0,0 +1,203 @@
+"""Cache of the images proxied for media players."""
+import asyncio
+from collections import OrderedDict
+import logging
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+from aiohttp.hdrs import (
+    CONTENT_TYPE,
+    ETAG,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    LAST_MODIFIED,
+)
+import async_timeout
+
+from homeassistant.const import HTTP_OK
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.singleton import singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_IMAGE_CACHE = "media_player_image_cache"
+
+HTTP_NOT_MODIFIED = 304
+
+# Largest number of bytes of images kept, images are typically 10-100kB
+MAX_CACHE_SIZE = 16 * 1024 * 1024
+
+# Images with an ETag or Last-Modified header are revalidated once older
+# than this many seconds. Images without are kept until evicted.
+REVALIDATE_AFTER = 300
+
+FETCH_TIMEOUT = 10
+
+
+class CachedImage:
+    """An image and the headers needed to revalidate it."""
+
+    __slots__ = ("content", "content_type", "etag", "last_modified", "fetched")
+
+    def __init__(
+        self,
+        content: bytes,
+        content_type: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        """Initialize the image."""
+        self.content = content
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched = monotonic()
+
+    @property
+    def stale(self) -> bool:
+        """Return if the image should be revalidated."""
+        return (self.etag is not None or self.last_modified is not None) and (
+            monotonic() - self.fetched > REVALIDATE_AFTER
+        )
+
+
+class MediaImageCache:
+    """Least recently used images of all media players, bounded in bytes.
+
+    Concurrent requests for the same url share a single fetch.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_size: int = MAX_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_size = max_size
+        self.size = 0
+        self._images: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._fetches: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    async def async_get(self, url: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Return the content and content type of the image at url."""
+        image = self._images.get(url)
+        if image is not None and not image.stale:
+            self.hits += 1
+            self._images.move_to_end(url)
+            return image.content, image.content_type
+
+        fetch = self._fetches.get(url)
+        if fetch is not None:
+            self.coalesced += 1
+        else:
+            if image is None:
+                self.misses += 1
+            else:
+                self.revalidations += 1
+            fetch = self._fetches[url] = self.hass.async_create_task(
+                self._async_fetch(url, image)
+            )
+
+        # A request going away must not cancel the fetch shared with others
+        return await asyncio.shield(fetch)
+
+    async def _async_fetch(
+        self, url: str, image: Optional[CachedImage]
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """Fetch an image, or revalidate the cached one, and cache it."""
+        try:
+            response = await self._async_request(url, image)
+        finally:
+            del self._fetches[url]
+
+        if response is None:
+            _LOGGER.warning("Error retrieving proxied image from %s", url)
+            if image is None:
+                return None, None
+            # Serve the image we have rather than none at all
+            return image.content, image.content_type
+
+        if image is not None and response is image:
+            image.fetched = monotonic()
+            if url in self._images:
+                self._images.move_to_end(url)
+            return image.content, image.content_type
+
+        self._async_store(url, response)
+        return response.content, response.content_type
+
+    async def _async_request(
+        self, url: str, image: Optional[CachedImage]
+    ) -> Optional[CachedImage]:
+        """Request an image, returning image if it was not modified."""
+        headers = {}
+        if image is not None:
+            if image.etag is not None:
+                headers[IF_NONE_MATCH] = image.etag
+            if image.last_modified is not None:
+                headers[IF_MODIFIED_SINCE] = image.last_modified
+
+        websession = async_get_clientsession(self.hass)
+        try:
+            async with async_timeout.timeout(FETCH_TIMEOUT):
+                response = await websession.get(url, headers=headers)
+
+                if response.status == HTTP_NOT_MODIFIED and image is not None:
+                    return image
+
+                if response.status != HTTP_OK:
+                    return None
+
+                content = await response.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            return None
+
+        content_type = response.headers.get(CONTENT_TYPE)
+        if content_type:
+            content_type = content_type.split(";")[0]
+
+        return CachedImage(
+            content,
+            content_type,
+            response.headers.get(ETAG),
+            response.headers.get(LAST_MODIFIED),
+        )
+
+    @callback
+    def _async_store(self, url: str, image: CachedImage) -> None:
+        """Store an image, evicting the least recently used ones."""
+        old_image = self._images.pop(url, None)
+        if old_image is not None:
+            self.size -= len(old_image.content)
+
+        self._images[url] = image
+        self.size += len(image.content)
+
+        while self.size > self.max_size and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self.size -= len(evicted.content)
+            self.evictions += 1
+
+    @callback
+    def async_statistics(self) -> Dict[str, Any]:
+        """Return the hit and miss counts of the cache."""
+        return {
+            "images": len(self._images),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
+
+
+@callback
+@singleton(DATA_IMAGE_CACHE)
+def async_get_image_cache(hass: HomeAssistant) -> MediaImageCache:
+    """Return the image cache of the media players."""
+    return MediaImageCache(hass)
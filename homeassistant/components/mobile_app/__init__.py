@@ -21,6 +21,7 @@ from .const import (
     DATA_CONFIG_ENTRIES,
     DATA_DELETED_IDS,
     DATA_DEVICES,
+    DATA_SECRET_BOXES,
     DATA_SENSOR,
     DATA_STORE,
     DOMAIN,
@@ -51,6 +52,7 @@ async def async_setup(hass: HomeAssistantType, config: ConfigType):
         DATA_CONFIG_ENTRIES: {},
         DATA_DELETED_IDS: app_config.get(DATA_DELETED_IDS, []),
         DATA_DEVICES: {},
+        DATA_SECRET_BOXES: {},
         DATA_SENSOR: app_config.get(DATA_SENSOR, {}),
         DATA_STORE: store,
     }
@@ -124,6 +126,7 @@ async def async_unload_entry(hass, entry):
     webhook_unregister(hass, webhook_id)
     del hass.data[DOMAIN][DATA_CONFIG_ENTRIES][webhook_id]
     del hass.data[DOMAIN][DATA_DEVICES][webhook_id]
+    hass.data[DOMAIN][DATA_SECRET_BOXES].pop(webhook_id, None)
     await hass_notify.async_reload(hass, DOMAIN)
 
     return True
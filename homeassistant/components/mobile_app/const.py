@@ -13,6 +13,7 @@ DATA_BINARY_SENSOR = "binary_sensor"
 DATA_CONFIG_ENTRIES = "config_entries"
 DATA_DELETED_IDS = "deleted_ids"
 DATA_DEVICES = "devices"
+DATA_SECRET_BOXES = "secret_boxes"
 DATA_SENSOR = "sensor"
 DATA_STORE = "store"
 DATA_NOTIFY = "notify"
@@ -71,7 +72,7 @@ ATTR_SENSOR_TYPE_SENSOR = "sensor"
 ATTR_SENSOR_UNIQUE_ID = "unique_id"
 ATTR_SENSOR_UOM = "unit_of_measurement"
 
-SIGNAL_SENSOR_UPDATE = f"{DOMAIN}_sensor_update"
+SIGNAL_SENSOR_UPDATE = DOMAIN + "_sensor_update_{}"
 SIGNAL_LOCATION_UPDATE = DOMAIN + "_location_update_{}"
 
 ATTR_CAMERA_ENTITY_ID = "camera_entity_id"
@@ -44,7 +44,9 @@ class MobileAppEntity(Entity):
     async def async_added_to_hass(self):
         """Register callbacks."""
         self.unsub_dispatcher = async_dispatcher_connect(
-            self.hass, SIGNAL_SENSOR_UPDATE, self._handle_update
+            self.hass,
+            SIGNAL_SENSOR_UPDATE.format(self._registration[CONF_WEBHOOK_ID]),
+            self._handle_update,
         )
 
     async def async_will_remove_from_hass(self):
@@ -96,10 +98,10 @@ class MobileAppEntity(Entity):
             return
 
     @callback
-    def _handle_update(self, data):
-        """Handle async event updates."""
-        incoming_id = sensor_id(data[CONF_WEBHOOK_ID], data[ATTR_SENSOR_UNIQUE_ID])
-        if incoming_id != self._sensor_id:
+    def _handle_update(self, updates):
+        """Handle the sensors updated by a webhook call."""
+        data = updates.get(self._sensor_id)
+        if data is None:
             return
 
         self._config = data
@@ -7,7 +7,12 @@ from aiohttp.web import Response, json_response
 from nacl.encoding import Base64Encoder
 from nacl.secret import SecretBox
 
-from homeassistant.const import CONTENT_TYPE_JSON, HTTP_BAD_REQUEST, HTTP_OK
+from homeassistant.const import (
+    CONF_WEBHOOK_ID,
+    CONTENT_TYPE_JSON,
+    HTTP_BAD_REQUEST,
+    HTTP_OK,
+)
 from homeassistant.core import Context
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import HomeAssistantType
@@ -27,6 +32,7 @@ from .const import (
     CONF_USER_ID,
     DATA_BINARY_SENSOR,
     DATA_DELETED_IDS,
+    DATA_SECRET_BOXES,
     DATA_SENSOR,
     DOMAIN,
 )
@@ -60,24 +66,40 @@ def setup_encrypt() -> Tuple[int, Callable]:
     return (SecretBox.KEY_SIZE, encrypt)
 
 
-def _decrypt_payload(key: str, ciphertext: str) -> Dict[str, str]:
+def _secret_box(hass: HomeAssistantType, registration: Dict) -> SecretBox:
+    """Return the SecretBox of a registration.
+
+    The box is kept with the loaded config entry and dropped when it unloads.
+    """
+    secret_boxes = hass.data[DOMAIN][DATA_SECRET_BOXES]
+    webhook_id = registration[CONF_WEBHOOK_ID]
+
+    if webhook_id not in secret_boxes:
+        keylen = SecretBox.KEY_SIZE
+        key = registration[CONF_SECRET].encode("utf-8")
+        key = key[:keylen]
+        key = key.ljust(keylen, b"\0")
+        secret_boxes[webhook_id] = SecretBox(key)
+
+    return secret_boxes[webhook_id]
+
+
+def _decrypt_payload(
+    hass: HomeAssistantType, registration: Dict, ciphertext: str
+) -> Dict[str, str]:
     """Decrypt encrypted payload."""
-    try:
-        keylen, decrypt = setup_decrypt()
-    except OSError:
+    if not supports_encryption():
         _LOGGER.warning("Ignoring encrypted payload because libsodium not installed")
         return None
 
-    if key is None:
+    if registration[CONF_SECRET] is None:
         _LOGGER.warning("Ignoring encrypted payload because no decryption key known")
         return None
 
-    key = key.encode("utf-8")
-    key = key[:keylen]
-    key = key.ljust(keylen, b"\0")
-
     try:
-        message = decrypt(ciphertext, key)
+        message = _secret_box(hass, registration).decrypt(
+            ciphertext, encoder=Base64Encoder
+        )
         message = json.loads(message.decode("utf-8"))
         _LOGGER.debug("Successfully decrypted mobile_app payload")
         return message
@@ -145,19 +167,22 @@ def savable_state(hass: HomeAssistantType) -> Dict:
 
 
 def webhook_response(
-    data, *, registration: Dict, status: int = HTTP_OK, headers: Dict = None
+    hass: HomeAssistantType,
+    data,
+    *,
+    registration: Dict,
+    status: int = HTTP_OK,
+    headers: Dict = None,
 ) -> Response:
     """Return a encrypted response if registration supports it."""
     data = json.dumps(data, cls=JSONEncoder)
 
     if registration[ATTR_SUPPORTS_ENCRYPTION]:
-        keylen, encrypt = setup_encrypt()
-
-        key = registration[CONF_SECRET].encode("utf-8")
-        key = key[:keylen]
-        key = key.ljust(keylen, b"\0")
-
-        enc_data = encrypt(data.encode("utf-8"), key).decode("utf-8")
+        enc_data = (
+            _secret_box(hass, registration)
+            .encrypt(data.encode("utf-8"), encoder=Base64Encoder)
+            .decode("utf-8")
+        )
         data = json.dumps({"encrypted": True, "encrypted_data": enc_data})
 
     return Response(
@@ -79,6 +79,7 @@ from .const import (
     CONF_SECRET,
     DATA_CONFIG_ENTRIES,
     DATA_DELETED_IDS,
+    DATA_SECRET_BOXES,
     DATA_STORE,
     DOMAIN,
     ERR_ENCRYPTION_ALREADY_ENABLED,
@@ -118,6 +119,16 @@ WEBHOOK_PAYLOAD_SCHEMA = vol.Schema(
     }
 )
 
+SENSOR_UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SENSOR_ATTRIBUTES, default={}): dict,
+        vol.Optional(ATTR_SENSOR_ICON, default="mdi:cellphone"): cv.icon,
+        vol.Required(ATTR_SENSOR_STATE): vol.Any(None, bool, str, int, float),
+        vol.Required(ATTR_SENSOR_TYPE): vol.In(SENSOR_TYPES),
+        vol.Required(ATTR_SENSOR_UNIQUE_ID): cv.string,
+    }
+)
+
 
 def validate_schema(schema):
     """Decorate a webhook function with a schema."""
@@ -186,7 +197,7 @@ async def handle_webhook(
 
     if req_data[ATTR_WEBHOOK_ENCRYPTED]:
         enc_data = req_data[ATTR_WEBHOOK_ENCRYPTED_DATA]
-        webhook_payload = _decrypt_payload(config_entry.data[CONF_SECRET], enc_data)
+        webhook_payload = _decrypt_payload(hass, config_entry.data, enc_data)
 
     if webhook_type not in WEBHOOK_COMMANDS:
         _LOGGER.error(
@@ -264,6 +275,7 @@ async def webhook_stream_camera(hass, config_entry, data):
 
     if camera is None:
         return webhook_response(
+            hass,
             {"success": False},
             registration=config_entry.data,
             status=HTTP_BAD_REQUEST,
@@ -281,7 +293,7 @@ async def webhook_stream_camera(hass, config_entry, data):
     else:
         resp["hls_path"] = None
 
-    return webhook_response(resp, registration=config_entry.data)
+    return webhook_response(hass, resp, registration=config_entry.data)
 
 
 @WEBHOOK_COMMANDS.register("render_template")
@@ -303,7 +315,7 @@ async def webhook_render_template(hass, config_entry, data):
         except template.TemplateError as ex:
             resp[key] = {"error": str(ex)}
 
-    return webhook_response(resp, registration=config_entry.data)
+    return webhook_response(hass, resp, registration=config_entry.data)
 
 
 @WEBHOOK_COMMANDS.register("update_location")
@@ -358,6 +370,7 @@ async def webhook_update_registration(hass, config_entry, data):
     await hass_notify.async_reload(hass, DOMAIN)
 
     return webhook_response(
+        hass,
         safe_registration(new_registration),
         registration=new_registration,
     )
@@ -387,6 +400,7 @@ async def webhook_enable_encryption(hass, config_entry, data):
     data = {**config_entry.data, ATTR_SUPPORTS_ENCRYPTION: True, CONF_SECRET: secret}
 
     hass.config_entries.async_update_entry(config_entry, data=data)
+    hass.data[DOMAIN][DATA_SECRET_BOXES].pop(config_entry.data[CONF_WEBHOOK_ID], None)
 
     return json_response({"secret": secret})
 
@@ -434,12 +448,17 @@ async def webhook_register_sensor(hass, config_entry, data):
     )
 
     if existing_sensor:
-        async_dispatcher_send(hass, SIGNAL_SENSOR_UPDATE, data)
+        async_dispatcher_send(
+            hass,
+            SIGNAL_SENSOR_UPDATE.format(config_entry.data[CONF_WEBHOOK_ID]),
+            {unique_store_key: data},
+        )
     else:
         register_signal = f"{DOMAIN}_{data[ATTR_SENSOR_TYPE]}_register"
         async_dispatcher_send(hass, register_signal, data)
 
     return webhook_response(
+        hass,
         {"success": True},
         registration=config_entry.data,
         status=HTTP_CREATED,
@@ -465,19 +484,13 @@ async def webhook_register_sensor(hass, config_entry, data):
     )
 )
 async def webhook_update_sensor_states(hass, config_entry, data):
-    """Handle an update sensor states webhook."""
-    sensor_schema_full = vol.Schema(
-        {
-            vol.Optional(ATTR_SENSOR_ATTRIBUTES, default={}): dict,
-            vol.Optional(ATTR_SENSOR_ICON, default="mdi:cellphone"): cv.icon,
-            vol.Required(ATTR_SENSOR_STATE): vol.Any(None, bool, str, int, float),
-            vol.Required(ATTR_SENSOR_TYPE): vol.In(SENSOR_TYPES),
-            vol.Required(ATTR_SENSOR_UNIQUE_ID): cv.string,
-        }
-    )
+    """Handle an update sensor states webhook.
 
+    The sensors updated are sent to the entities of the device in one signal.
+    """
     device_name = config_entry.data[ATTR_DEVICE_NAME]
     resp = {}
+    updates = {}
     for sensor in data:
         entity_type = sensor[ATTR_SENSOR_TYPE]
 
@@ -501,7 +514,7 @@ async def webhook_update_sensor_states(hass, config_entry, data):
         entry = hass.data[DOMAIN][entity_type][unique_store_key]
 
         try:
-            sensor = sensor_schema_full(sensor)
+            sensor = SENSOR_UPDATE_SCHEMA(sensor)
         except vol.Invalid as err:
             err_msg = vol.humanize.humanize_error(sensor, err)
             _LOGGER.error(
@@ -519,16 +532,22 @@ async def webhook_update_sensor_states(hass, config_entry, data):
         new_state = {**entry, **sensor}
 
         hass.data[DOMAIN][entity_type][unique_store_key] = new_state
-
-        async_dispatcher_send(hass, SIGNAL_SENSOR_UPDATE, new_state)
+        updates[unique_store_key] = new_state
 
         resp[unique_id] = {"success": True}
 
+    if updates:
+        async_dispatcher_send(
+            hass,
+            SIGNAL_SENSOR_UPDATE.format(config_entry.data[CONF_WEBHOOK_ID]),
+            updates,
+        )
+
     hass.data[DOMAIN][DATA_STORE].async_delay_save(
         lambda: savable_state(hass), DELAY_SAVE
     )
 
-    return webhook_response(resp, registration=config_entry.data)
+    return webhook_response(hass, resp, registration=config_entry.data)
 
 
 @WEBHOOK_COMMANDS.register("get_zones")
@@ -538,7 +557,7 @@ async def webhook_get_zones(hass, config_entry, data):
         hass.states.get(entity_id)
         for entity_id in sorted(hass.states.async_entity_ids(ZONE_DOMAIN))
     ]
-    return webhook_response(zones, registration=config_entry.data)
+    return webhook_response(hass, zones, registration=config_entry.data)
 
 
 @WEBHOOK_COMMANDS.register("get_config")
@@ -566,7 +585,7 @@ async def webhook_get_config(hass, config_entry, data):
     except hass.components.cloud.CloudNotAvailable:
         pass
 
-    return webhook_response(resp, registration=config_entry.data)
+    return webhook_response(hass, resp, registration=config_entry.data)
 
 
 @WEBHOOK_COMMANDS.register("scan_tag")
@@ -34,6 +34,7 @@ from .const import (
     ATTR_UNIT,
     ATTR_VALUE,
     CALL_TYPE_COIL,
+    CALL_TYPE_DISCRETE,
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT,
     CONF_BAUDRATE,
@@ -74,6 +75,7 @@ from .const import (
     SERVICE_WRITE_COIL,
     SERVICE_WRITE_REGISTER,
 )
+from .planner import ModbusReadPlanner
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -261,6 +263,7 @@ class ModbusHub:
         # generic configuration
         self._client = None
         self._lock = threading.Lock()
+        self._planner = ModbusReadPlanner(self._read)
         self._config_name = client_config[CONF_NAME]
         self._config_type = client_config[CONF_TYPE]
         self._config_port = client_config[CONF_PORT]
@@ -336,44 +339,62 @@ class ModbusHub:
         with self._lock:
             self._client.connect()
 
+    def register_read(self, call_type, unit, address, count):
+        """Register a range read every cycle, to be read in a block."""
+        self._planner.register(call_type, unit, address, count)
+
+    def unregister_read(self, call_type, unit, address, count):
+        """Unregister a range that is no longer read every cycle."""
+        self._planner.unregister(call_type, unit, address, count)
+
+    def _read(self, call_type, unit, address, count):
+        """Read from the device, with the lock held."""
+        kwargs = {"unit": unit} if unit else {}
+        if call_type == CALL_TYPE_COIL:
+            return self._client.read_coils(address, count, **kwargs)
+        if call_type == CALL_TYPE_DISCRETE:
+            return self._client.read_discrete_inputs(address, count, **kwargs)
+        if call_type == CALL_TYPE_REGISTER_INPUT:
+            return self._client.read_input_registers(address, count, **kwargs)
+        return self._client.read_holding_registers(address, count, **kwargs)
+
     def read_coils(self, unit, address, count):
         """Read coils."""
         with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_coils(address, count, **kwargs)
+            return self._planner.read(CALL_TYPE_COIL, unit, address, count)
 
     def read_discrete_inputs(self, unit, address, count):
         """Read discrete inputs."""
         with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_discrete_inputs(address, count, **kwargs)
+            return self._planner.read(CALL_TYPE_DISCRETE, unit, address, count)
 
     def read_input_registers(self, unit, address, count):
         """Read input registers."""
         with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_input_registers(address, count, **kwargs)
+            return self._planner.read(CALL_TYPE_REGISTER_INPUT, unit, address, count)
 
     def read_holding_registers(self, unit, address, count):
         """Read holding registers."""
         with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_holding_registers(address, count, **kwargs)
+            return self._planner.read(CALL_TYPE_REGISTER_HOLDING, unit, address, count)
 
     def write_coil(self, unit, address, value):
         """Write coil."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_coil(address, value, **kwargs)
+            self._planner.invalidate()
 
     def write_register(self, unit, address, value):
         """Write register."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_register(address, value, **kwargs)
+            self._planner.invalidate()
 
     def write_registers(self, unit, address, values):
         """Write registers."""
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_registers(address, values, **kwargs)
+            self._planner.invalidate()
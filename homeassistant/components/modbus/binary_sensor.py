@@ -84,6 +84,14 @@ class ModbusBinarySensor(BinarySensorEntity):
         self._value = None
         self._available = True
 
+    async def async_added_to_hass(self):
+        """Handle entity which will be added."""
+        self._hub.register_read(self._input_type, self._slave, self._address, 1)
+
+    async def async_will_remove_from_hass(self):
+        """Handle entity which will be removed."""
+        self._hub.unregister_read(self._input_type, self._slave, self._address, 1)
+
     @property
     def name(self):
         """Return the name of the sensor."""
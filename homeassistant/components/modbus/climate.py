@@ -133,13 +133,35 @@ class ModbusThermostat(ClimateEntity):
         self._min_temp = config[CONF_MIN_TEMP]
         self._temp_step = config[CONF_STEP]
         self._available = True
+        # The ranges read every cycle
+        self._reads = [
+            (
+                CALL_TYPE_REGISTER_HOLDING,
+                self._slave,
+                self._target_temperature_register,
+                self._count,
+            ),
+            (
+                self._current_temperature_register_type,
+                self._slave,
+                self._current_temperature_register,
+                self._count,
+            ),
+        ]
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
+        for read in self._reads:
+            self._hub.register_read(*read)
         async_track_time_interval(
             self.hass, lambda arg: self._update(), self._scan_interval
         )
 
+    async def async_will_remove_from_hass(self):
+        """Handle entity which will be removed."""
+        for read in self._reads:
+            self._hub.unregister_read(*read)
+
     @property
     def should_poll(self):
         """Return True if entity has to be polled for state.
@@ -0,0 +1,227 @@
+"""Coalesce the reads of Modbus entities into block reads."""
+from bisect import bisect_right
+import logging
+import threading
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from pymodbus.bit_read_message import ReadCoilsResponse, ReadDiscreteInputsResponse
+from pymodbus.exceptions import ModbusException
+from pymodbus.pdu import ExceptionResponse, ModbusExceptions, ModbusResponse
+from pymodbus.register_read_message import (
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+)
+
+from .const import (
+    CALL_TYPE_COIL,
+    CALL_TYPE_DISCRETE,
+    CALL_TYPE_REGISTER_HOLDING,
+    CALL_TYPE_REGISTER_INPUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Largest number of addresses read at once, as allowed by the Modbus protocol
+MAX_BLOCK_LENGTH = {
+    CALL_TYPE_COIL: 2000,
+    CALL_TYPE_DISCRETE: 2000,
+    CALL_TYPE_REGISTER_HOLDING: 125,
+    CALL_TYPE_REGISTER_INPUT: 125,
+}
+
+# Largest number of unused addresses read to join two ranges into a block
+MAX_BLOCK_GAP = {
+    CALL_TYPE_COIL: 32,
+    CALL_TYPE_DISCRETE: 32,
+    CALL_TYPE_REGISTER_HOLDING: 8,
+    CALL_TYPE_REGISTER_INPUT: 8,
+}
+
+# A block read is shared by the reads within this many seconds
+MAX_BLOCK_AGE = 2.0
+
+RESPONSES = {
+    CALL_TYPE_COIL: ReadCoilsResponse,
+    CALL_TYPE_DISCRETE: ReadDiscreteInputsResponse,
+    CALL_TYPE_REGISTER_HOLDING: ReadHoldingRegistersResponse,
+    CALL_TYPE_REGISTER_INPUT: ReadInputRegistersResponse,
+}
+
+# Exception codes of devices refusing to read the addresses of a block
+BLOCK_REFUSED = (ModbusExceptions.IllegalAddress, ModbusExceptions.IllegalValue)
+
+ReadFunction = Callable[[str, Optional[int], int, int], ModbusResponse]
+
+
+class ReadBlock:
+    """A contiguous range of addresses read at once."""
+
+    __slots__ = ("address", "count", "direct", "result", "read_at", "consumed")
+
+    def __init__(self, address: int, count: int) -> None:
+        """Initialize the block."""
+        self.address = address
+        self.count = count
+        # Ranges of blocks that are not shared are read directly
+        self.direct = False
+        self.result: Optional[ModbusResponse] = None
+        self.read_at = 0.0
+        self.consumed: Set[Tuple[int, int]] = set()
+
+
+def plan_blocks(call_type: str, ranges: Iterable[Tuple[int, int]]) -> List[ReadBlock]:
+    """Group address ranges into blocks, ordered by address."""
+    max_length = MAX_BLOCK_LENGTH[call_type]
+    max_gap = MAX_BLOCK_GAP[call_type]
+    blocks: List[ReadBlock] = []
+    members = 0
+
+    for address, count in sorted(ranges):
+        end = address + count
+        if blocks:
+            block = blocks[-1]
+            block_end = block.address + block.count
+            if (
+                address - block_end <= max_gap
+                and max(end, block_end) - block.address <= max_length
+            ):
+                block.count = max(end, block_end) - block.address
+                members += 1
+                continue
+            block.direct = members == 1
+        blocks.append(ReadBlock(address, count))
+        members = 1
+
+    if blocks:
+        blocks[-1].direct = members == 1
+    return blocks
+
+
+class ModbusReadPlanner:
+    """Read the ranges registered by the entities of a hub in blocks.
+
+    Ranges of the same unit and type close to each other are read with a
+    single request. The response is shared by all ranges of the block until
+    a range is read a second time or the response ages, so the entities of
+    a hub polled in the same cycle cost one round-trip per block.
+    """
+
+    def __init__(self, read: ReadFunction) -> None:
+        """Initialize the planner.
+
+        read is called to talk to the device, with the lock of the hub held.
+        """
+        self._read = read
+        self._lock = threading.Lock()
+        # The number of entities reading each range
+        self._ranges: Dict[Tuple[str, Optional[int]], Dict[Tuple[int, int], int]] = {}
+        self._blocks: Dict[Tuple[str, Optional[int]], List[ReadBlock]] = {}
+        self.round_trips = 0
+
+    def register(
+        self, call_type: str, unit: Optional[int], address: int, count: int
+    ) -> None:
+        """Register a range that is read every cycle."""
+        with self._lock:
+            key = (call_type, unit)
+            ranges = self._ranges.setdefault(key, {})
+            ranges[(address, count)] = ranges.get((address, count), 0) + 1
+            self._blocks.pop(key, None)
+
+    def unregister(
+        self, call_type: str, unit: Optional[int], address: int, count: int
+    ) -> None:
+        """Unregister a range that is no longer read."""
+        with self._lock:
+            key = (call_type, unit)
+            ranges = self._ranges.get(key, {})
+            readers = ranges.get((address, count))
+            if readers is None:
+                return
+            if readers > 1:
+                ranges[(address, count)] = readers - 1
+                return
+            del ranges[(address, count)]
+            if not ranges:
+                del self._ranges[key]
+            self._blocks.pop(key, None)
+
+    def invalidate(self) -> None:
+        """Forget the responses read, after writing to the device."""
+        with self._lock:
+            for blocks in self._blocks.values():
+                for block in blocks:
+                    block.result = None
+
+    def read(
+        self, call_type: str, unit: Optional[int], address: int, count: int
+    ) -> ModbusResponse:
+        """Read a range, from the response of its block if possible."""
+        block = self._find_block(call_type, unit, address, count)
+        if block is None or block.direct:
+            return self._read_device(call_type, unit, address, count)
+
+        key = (address, count)
+        if (
+            block.result is None
+            or key in block.consumed
+            or monotonic() - block.read_at > MAX_BLOCK_AGE
+        ):
+            result = self._read_device(call_type, unit, block.address, block.count)
+            if (
+                isinstance(result, ExceptionResponse)
+                and result.exception_code in BLOCK_REFUSED
+            ):
+                # The device does not allow reading the unused addresses
+                _LOGGER.debug(
+                    "Reading %s %s-%s of unit %s refused, reading its ranges directly",
+                    call_type,
+                    block.address,
+                    block.address + block.count - 1,
+                    unit,
+                )
+                block.direct = True
+            if isinstance(result, (ModbusException, ExceptionResponse)):
+                # Transient errors only read this range directly
+                block.result = None
+                return self._read_device(call_type, unit, address, count)
+            block.result = result
+            block.read_at = monotonic()
+            block.consumed.clear()
+
+        block.consumed.add(key)
+        start = address - block.address
+        if call_type in (CALL_TYPE_COIL, CALL_TYPE_DISCRETE):
+            values = block.result.bits[start : start + count]
+        else:
+            values = block.result.registers[start : start + count]
+        return RESPONSES[call_type](values)
+
+    def _find_block(
+        self, call_type: str, unit: Optional[int], address: int, count: int
+    ) -> Optional[ReadBlock]:
+        """Return the block containing a range."""
+        with self._lock:
+            key = (call_type, unit)
+            ranges = self._ranges.get(key)
+            if not ranges or (address, count) not in ranges:
+                return None
+            blocks = self._blocks.get(key)
+            if blocks is None:
+                blocks = self._blocks[key] = plan_blocks(call_type, ranges)
+
+        index = bisect_right([block.address for block in blocks], address) - 1
+        if index < 0:
+            return None
+        block = blocks[index]
+        if address + count > block.address + block.count:
+            return None
+        return block
+
+    def _read_device(
+        self, call_type: str, unit: Optional[int], address: int, count: int
+    ) -> ModbusResponse:
+        """Read from the device."""
+        self.round_trips += 1
+        return self._read(call_type, unit, address, count)
@@ -196,11 +196,20 @@ class ModbusRegisterSensor(RestoreEntity):
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
+        self._hub.register_read(
+            self._register_type, self._slave, self._register, self._count
+        )
         state = await self.async_get_last_state()
         if not state:
             return
         self._value = state.state
 
+    async def async_will_remove_from_hass(self):
+        """Handle entity which will be removed."""
+        self._hub.unregister_read(
+            self._register_type, self._slave, self._register, self._count
+        )
+
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -1,9 +1,13 @@
 """Support for Prometheus metrics export."""
+from collections import Counter
+from functools import partial
 import logging
 import string
+from types import SimpleNamespace
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -25,6 +29,7 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     ATTR_UNIT_OF_MEASUREMENT,
     CONTENT_TYPE_TEXT_PLAIN,
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     PERCENTAGE,
     STATE_ON,
@@ -42,6 +47,7 @@ _LOGGER = logging.getLogger(__name__)
 API_ENDPOINT = "/api/prometheus"
 
 DOMAIN = "prometheus"
+CONF_COLLECTOR = "collector"
 CONF_FILTER = "filter"
 CONF_PROM_NAMESPACE = "namespace"
 CONF_COMPONENT_CONFIG = "component_config"
@@ -49,6 +55,11 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+
+# Update the metrics on every state change, or compute them on every scrape
+COLLECTOR_EVENT = "event"
+COLLECTOR_SCRAPE = "scrape"
+
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -58,6 +69,9 @@ CONFIG_SCHEMA = vol.Schema(
         DOMAIN: vol.All(
             {
                 vol.Optional(CONF_FILTER, default={}): entityfilter.FILTER_SCHEMA,
+                vol.Optional(CONF_COLLECTOR, default=COLLECTOR_EVENT): vol.In(
+                    [COLLECTOR_EVENT, COLLECTOR_SCRAPE]
+                ),
                 vol.Optional(CONF_PROM_NAMESPACE): cv.string,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
@@ -93,6 +107,26 @@ def setup(hass, config):
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
+    if conf[CONF_COLLECTOR] == COLLECTOR_SCRAPE:
+        collector = PrometheusCollector(
+            hass,
+            entity_filter,
+            namespace,
+            climate_units,
+            component_config,
+            override_metric,
+            default_metric,
+        )
+        prometheus_client.REGISTRY.register(collector)
+
+        def unregister_collector(event):
+            """Stop collecting metrics from this instance."""
+            prometheus_client.REGISTRY.unregister(collector)
+
+        hass.bus.listen(EVENT_STATE_CHANGED, collector.async_count_change)
+        hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, unregister_collector)
+        return True
+
     metrics = PrometheusMetrics(
         prometheus_client,
         entity_filter,
@@ -140,6 +174,12 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self._label_cache = {}
+        self._handlers = {
+            name[len("_handle_") :]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_handle_")
+        }
 
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
@@ -149,22 +189,26 @@ class PrometheusMetrics:
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
         if not self._filter(state.entity_id):
             return
 
-        handler = f"_handle_{domain}"
-
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+        self._handle_state(state)
 
-        labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(**self._labels(state)).inc()
+
+    def _handle_state(self, state):
+        """Update the metrics of a state."""
+        domain, _ = hacore.split_entity_id(state.entity_id)
+        handler = self._handlers.get(domain)
+
+        if handler is not None and state.state != STATE_UNAVAILABLE:
+            handler(state)
 
+        labels = self._labels(state)
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
@@ -231,13 +275,16 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state):
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        labels = self._label_cache.get(state.entity_id)
+        if labels is None or labels["friendly_name"] != friendly_name:
+            labels = self._label_cache[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        return labels
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -473,6 +520,114 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).inc()
 
 
+class ScrapedMetric:
+    """A metric whose samples are computed during a scrape.
+
+    It replaces the prometheus_client metrics for the PrometheusMetrics
+    handlers: labels() selects the sample that set() or inc() update.
+    """
+
+    __slots__ = (
+        "metric_type",
+        "name",
+        "documentation",
+        "labelnames",
+        "samples",
+        "_key",
+    )
+
+    def __init__(self, metric_type, name, documentation, labelnames):
+        """Initialize the metric."""
+        self.metric_type = metric_type
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.samples = {}
+        self._key = None
+
+    def labels(self, **labels):
+        """Select the sample with labels."""
+        self._key = tuple(str(labels[name]) for name in self.labelnames)
+        return self
+
+    def set(self, value):
+        """Set the value of the selected sample."""
+        self.samples[self._key] = float(value)
+
+    def inc(self, amount=1):
+        """Increment the value of the selected sample."""
+        self.samples[self._key] = self.samples.get(self._key, 0.0) + amount
+
+    def family(self):
+        """Return the samples as a metric family."""
+        factory = (
+            CounterMetricFamily if self.metric_type == "counter" else GaugeMetricFamily
+        )
+        family = factory(self.name, self.documentation, labels=self.labelnames)
+        for key, value in self.samples.items():
+            family.add_metric(key, value)
+        return family
+
+
+SCRAPED_METRICS = SimpleNamespace(
+    Counter=partial(ScrapedMetric, "counter"), Gauge=partial(ScrapedMetric, "gauge")
+)
+
+
+class PrometheusCollector(PrometheusMetrics):
+    """Compute the metrics from the state machine when scraped.
+
+    Only the number of state changes of each entity is kept between scrapes,
+    so state changes cost a counter increment instead of updating metrics.
+    """
+
+    def __init__(self, hass, *args):
+        """Initialize the collector."""
+        super().__init__(SCRAPED_METRICS, *args)
+        self.hass = hass
+        self._changes = Counter()
+
+    @hacore.callback
+    def async_count_change(self, event):
+        """Count a state change."""
+        if event.data.get("new_state") is None:
+            self._changes.pop(event.data["entity_id"], None)
+        else:
+            self._changes[event.data["entity_id"]] += 1
+
+    def describe(self):
+        """Return no metrics, the metrics depend on the states when scraped."""
+        return []
+
+    def collect(self):
+        """Return the metrics of the current states."""
+        for metric in self._metrics.values():
+            metric.samples.clear()
+
+        state_change = self._metric(
+            "state_change", self.prometheus_cli.Counter, "The number of state changes"
+        )
+        for state in self.hass.states.async_all():
+            if not self._filter(state.entity_id):
+                continue
+
+            self._handle_state(state)
+            changes = self._changes.get(state.entity_id)
+            if changes:
+                state_change.labels(**self._labels(state)).set(changes)
+
+        return [metric.family() for metric in self._metrics.values()]
+
+    def _handle_automation(self, state):
+        metric = self._metric(
+            "automation_triggered_count",
+            self.prometheus_cli.Counter,
+            "Count of times an automation has been triggered",
+        )
+
+        metric.labels(**self._labels(state)).set(self._changes[state.entity_id])
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
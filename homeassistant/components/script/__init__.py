@@ -5,6 +5,7 @@ from typing import List
 
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -32,6 +33,8 @@ from homeassistant.helpers.script import (
     CONF_MAX_EXCEEDED,
     SCRIPT_MODE_SINGLE,
     Script,
+    async_enable_metrics,
+    async_get_metrics,
     make_script_schema,
 )
 from homeassistant.helpers.service import async_set_service_schema
@@ -42,6 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "script"
 
 ATTR_LAST_ACTION = "last_action"
+ATTR_LAST_RUN_DURATION = "last_run_duration"
 ATTR_LAST_TRIGGERED = "last_triggered"
 ATTR_VARIABLES = "variables"
 
@@ -202,6 +206,9 @@ async def async_setup(hass, config):
         DOMAIN, SERVICE_TOGGLE, toggle_service, schema=SCRIPT_TURN_ONOFF_SCHEMA
     )
 
+    hass.components.websocket_api.async_register_command(websocket_metrics)
+    hass.components.websocket_api.async_register_command(websocket_enable_metrics)
+
     return True
 
 
@@ -291,6 +298,10 @@ class ScriptEntity(ToggleEntity):
             attrs[ATTR_MAX] = self.script.max_runs
         if self.script.last_action:
             attrs[ATTR_LAST_ACTION] = self.script.last_action
+        if self.script.metrics and self.script.metrics.run_duration.samples:
+            attrs[ATTR_LAST_RUN_DURATION] = round(
+                self.script.metrics.run_duration.samples[-1], 3
+            )
         return attrs
 
     @property
@@ -337,3 +348,21 @@ class ScriptEntity(ToggleEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.object_id)
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "script/metrics"})
+def websocket_metrics(hass, connection, msg):
+    """Return the run metrics of scripts and automations."""
+    connection.send_result(msg["id"], async_get_metrics(hass))
+
+
+@callback
+@websocket_api.websocket_command(
+    {vol.Required("type"): "script/metrics/enable", vol.Required("enabled"): bool}
+)
+@websocket_api.require_admin
+def websocket_enable_metrics(hass, connection, msg):
+    """Enable or disable recording run metrics of scripts and automations."""
+    async_enable_metrics(hass, msg["enabled"])
+    connection.send_result(msg["id"])
@@ -1 +1,26 @@
 """The sql component."""
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+
+DATA_SQL_SENSORS = "sql_sensors"
+
+
+async def async_setup(hass, config):
+    """Set up the SQL integration."""
+    hass.components.websocket_api.async_register_command(websocket_query_statistics)
+    return True
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "sql/query_statistics"})
+def websocket_query_statistics(hass, connection, msg):
+    """Return the statistics of the queries of the SQL sensors."""
+    connection.send_result(
+        msg["id"],
+        {
+            sensor.entity_id: sensor.query_statistics
+            for sensor in hass.data.get(DATA_SQL_SENSORS, [])
+        },
+    )
@@ -2,23 +2,40 @@
 import datetime
 import decimal
 import logging
+import threading
+from time import monotonic
 
 import sqlalchemy
 from sqlalchemy.orm import scoped_session, sessionmaker
 import voluptuous as vol
 
 from homeassistant.components.recorder import CONF_DB_URL, DEFAULT_DB_FILE, DEFAULT_URL
-from homeassistant.components.sensor import PLATFORM_SCHEMA
-from homeassistant.const import CONF_NAME, CONF_UNIT_OF_MEASUREMENT, CONF_VALUE_TEMPLATE
+from homeassistant.components.sensor import PLATFORM_SCHEMA, SCAN_INTERVAL
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_SCAN_INTERVAL,
+    CONF_UNIT_OF_MEASUREMENT,
+    CONF_VALUE_TEMPLATE,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
 
+from . import DATA_SQL_SENSORS
+
 _LOGGER = logging.getLogger(__name__)
 
 CONF_COLUMN_NAME = "column"
 CONF_QUERIES = "queries"
 CONF_QUERY = "query"
 
+DATA_SQL = "sql"
+
+# Results of a batch are used by the sensors updating within this many seconds,
+# and queries due within this many seconds are executed in the same batch
+MAX_RESULT_AGE = 2.0
+
+_DATABASES_LOCK = threading.Lock()
+
 
 def validate_sql_select(value):
     """Validate that value is a SQL SELECT query."""
@@ -42,12 +59,145 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 )
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
-    """Set up the SQL sensor platform."""
-    db_url = config.get(CONF_DB_URL)
-    if not db_url:
-        db_url = DEFAULT_URL.format(hass_config_path=hass.config.path(DEFAULT_DB_FILE))
+class QueryStatistics:
+    """Duration statistics of a query."""
+
+    __slots__ = ("executions", "last_duration", "max_duration", "total_duration")
+
+    def __init__(self):
+        """Initialize the statistics."""
+        self.executions = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def add(self, duration):
+        """Add the duration of an execution."""
+        self.executions += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    def as_dict(self):
+        """Return the statistics as a dictionary."""
+        return {
+            "executions": self.executions,
+            "last_duration": round(self.last_duration, 6),
+            "max_duration": round(self.max_duration, 6),
+            "mean_duration": round(self.total_duration / self.executions, 6)
+            if self.executions
+            else 0.0,
+        }
+
+
+class SQLDatabase:
+    """A database shared by the sensors using the same db_url."""
+
+    def __init__(self, db_url, sessmaker):
+        """Initialize the database."""
+        self.db_url = db_url
+        self.sessionmaker = sessmaker
 
+
+class QueryBatch:
+    """The queries of the sensors of a platform, polled together.
+
+    When a sensor updates, its query is executed along with the other
+    queries due in the same poll, in a single session. The sensors updating
+    next in that poll use those results instead of querying the database.
+    """
+
+    def __init__(self, database, scan_interval):
+        """Initialize the batch."""
+        self.database = database
+        self.scan_interval = scan_interval.total_seconds()
+        self._lock = threading.Lock()
+        self._queries = {}
+        self._results = {}
+
+    def register(self, query):
+        """Register a query executed every scan."""
+        with self._lock:
+            self._queries.setdefault(query, QueryStatistics())
+
+    def statistics(self, query):
+        """Return the duration statistics of a query."""
+        return self._queries[query].as_dict()
+
+    def execute(self, query, used_at=None):
+        """Return the rows of a query and when it was executed.
+
+        Rows are None if the query does not return rows. The error of the
+        query is raised instead. used_at is when the result last used by
+        the caller was executed, that result is not returned again.
+        """
+        with self._lock:
+            result = self._results.get(query)
+            if (
+                result is None
+                or result[0] == used_at
+                or monotonic() - result[0] > MAX_RESULT_AGE
+            ):
+                self._execute_due(query)
+                result = self._results[query]
+
+        executed_at, rows = result
+        if isinstance(rows, Exception):
+            raise rows
+        return rows, executed_at
+
+    def _execute_due(self, query):
+        """Execute a query and the queries due in the same poll."""
+        now = monotonic()
+        due = [
+            other
+            for other in self._queries
+            if other == query
+            or other not in self._results
+            or now - self._results[other][0] > self.scan_interval - MAX_RESULT_AGE
+        ]
+        results = {}
+        sess = self.database.sessionmaker()
+        try:
+            for other in due:
+                statistics = self._queries[other]
+                start = monotonic()
+                try:
+                    result = sess.execute(other)
+                    if result.returns_rows:
+                        results[other] = [dict(row.items()) for row in result]
+                    else:
+                        results[other] = None
+                except sqlalchemy.exc.SQLAlchemyError as err:
+                    # The session cannot be used until it is rolled back
+                    sess.rollback()
+                    results[other] = err
+                statistics.add(monotonic() - start)
+                _LOGGER.debug("Executed %s: %s", other, statistics.as_dict())
+        finally:
+            sess.close()
+
+        executed_at = monotonic()
+        for other, rows in results.items():
+            self._results[other] = (executed_at, rows)
+
+
+def get_database(hass, db_url):
+    """Return the shared database of db_url, connecting to it if needed."""
+    with _DATABASES_LOCK:
+        databases = hass.data.setdefault(DATA_SQL, {})
+        if db_url not in databases:
+            database = _connect(db_url)
+            if database is None:
+                return None
+            databases[db_url] = database
+        return databases[db_url]
+
+
+def _connect(db_url):
+    """Connect to a database."""
+    sess = None
     try:
         engine = sqlalchemy.create_engine(db_url)
         sessmaker = scoped_session(sessionmaker(bind=engine))
@@ -58,10 +208,25 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 
     except sqlalchemy.exc.SQLAlchemyError as err:
         _LOGGER.error("Couldn't connect using %s DB_URL: %s", db_url, err)
-        return
+        return None
     finally:
-        sess.close()
+        if sess is not None:
+            sess.close()
 
+    return SQLDatabase(db_url, sessmaker)
+
+
+def setup_platform(hass, config, add_entities, discovery_info=None):
+    """Set up the SQL sensor platform."""
+    db_url = config.get(CONF_DB_URL)
+    if not db_url:
+        db_url = DEFAULT_URL.format(hass_config_path=hass.config.path(DEFAULT_DB_FILE))
+
+    database = get_database(hass, db_url)
+    if database is None:
+        return
+
+    batch = QueryBatch(database, config.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL))
     queries = []
 
     for query in config.get(CONF_QUERIES):
@@ -82,9 +247,8 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
                 else query_str.replace(";", " LIMIT 1;")
             )
 
-        sensor = SQLSensor(
-            name, sessmaker, query_str, column_name, unit, value_template
-        )
+        batch.register(query_str)
+        sensor = SQLSensor(name, batch, query_str, column_name, unit, value_template)
         queries.append(sensor)
 
     add_entities(queries, True)
@@ -93,14 +257,15 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 class SQLSensor(Entity):
     """Representation of an SQL sensor."""
 
-    def __init__(self, name, sessmaker, query, column, unit, value_template):
+    def __init__(self, name, batch, query, column, unit, value_template):
         """Initialize the SQL sensor."""
         self._name = name
         self._query = query
         self._unit_of_measurement = unit
         self._template = value_template
         self._column_name = column
-        self.sessionmaker = sessmaker
+        self.batch = batch
+        self._executed_at = None
         self._state = None
         self._attributes = None
 
@@ -124,34 +289,45 @@ class SQLSensor(Entity):
         """Return the state attributes."""
         return self._attributes
 
+    @property
+    def query_statistics(self):
+        """Return the duration statistics of the query."""
+        return {"query": self._query, **self.batch.statistics(self._query)}
+
+    async def async_added_to_hass(self):
+        """Register the sensor for the query statistics."""
+        self.hass.data.setdefault(DATA_SQL_SENSORS, []).append(self)
+
+    async def async_will_remove_from_hass(self):
+        """Unregister the sensor from the query statistics."""
+        self.hass.data[DATA_SQL_SENSORS].remove(self)
+
     def update(self):
         """Retrieve sensor data from the query."""
 
         data = None
         try:
-            sess = self.sessionmaker()
-            result = sess.execute(self._query)
-            self._attributes = {}
-
-            if not result.returns_rows or result.rowcount == 0:
-                _LOGGER.warning("%s returned no results", self._query)
-                self._state = None
-                return
-
-            for res in result:
-                _LOGGER.debug("result = %s", res.items())
-                data = res[self._column_name]
-                for key, value in res.items():
-                    if isinstance(value, decimal.Decimal):
-                        value = float(value)
-                    if isinstance(value, datetime.date):
-                        value = str(value)
-                    self._attributes[key] = value
+            rows, self._executed_at = self.batch.execute(self._query, self._executed_at)
         except sqlalchemy.exc.SQLAlchemyError as err:
             _LOGGER.error("Error executing query %s: %s", self._query, err)
             return
-        finally:
-            sess.close()
+
+        self._attributes = {}
+
+        if not rows:
+            _LOGGER.warning("%s returned no results", self._query)
+            self._state = None
+            return
+
+        for res in rows:
+            _LOGGER.debug("result = %s", res)
+            data = res[self._column_name]
+            for key, value in res.items():
+                if isinstance(value, decimal.Decimal):
+                    value = float(value)
+                if isinstance(value, datetime.date):
+                    value = str(value)
+                self._attributes[key] = value
 
         if data is not None and self._template is not None:
             self._state = self._template.async_render_with_possible_json_value(
@@ -1,7 +1,5 @@
 """Support for statistics for sensor values."""
-from collections import deque
 import logging
-import statistics
 
 import voluptuous as vol
 
@@ -25,6 +23,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
+from homeassistant.util.sample_window import SampleWindow
 
 from . import DOMAIN, PLATFORMS
 
@@ -97,8 +96,7 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self.samples = SampleWindow(self._sampling_size)
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -150,12 +148,9 @@ class StatisticsSensor(Entity):
             return
 
         try:
-            if self.is_binary:
-                self.states.append(new_state.state)
-            else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+            # Only the number of samples of binary sensors is reported
+            value = 0.0 if self.is_binary else float(new_state.state)
+            self.samples.append(value, new_state.last_updated.timestamp())
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
@@ -220,23 +215,22 @@ class StatisticsSensor(Entity):
             self._max_age,
         )
 
-        while self.ages and (now - self.ages[0]) > self._max_age:
+        oldest = (now - self._max_age).timestamp()
+        while self.samples and self.samples.first[1] < oldest:
+            _, timestamp = self.samples.popleft()
             _LOGGER.debug(
-                "%s: purging record with datetime %s(%s)",
+                "%s: purging record with datetime %s",
                 self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
+                dt_util.as_local(dt_util.utc_from_timestamp(timestamp)),
             )
-            self.ages.popleft()
-            self.states.popleft()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._max_age:
-            # Take the oldest entry from the ages list and add the configured max_age.
+        if self.samples and self._max_age:
+            # Take the oldest sample and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._max_age
+            return dt_util.utc_from_timestamp(self.samples.first[1]) + self._max_age
         return None
 
     async def async_update(self):
@@ -245,39 +239,41 @@ class StatisticsSensor(Entity):
         if self._max_age is not None:
             self._purge_old()
 
-        self.count = len(self.states)
+        samples = self.samples
+        self.count = len(samples)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if samples:  # require only one data point
+                self.mean = round(samples.mean(), self._precision)
+                self.median = round(samples.median(), self._precision)
+            else:
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if len(samples) > 1:  # require at least two data points
+                self.stdev = round(samples.stdev(), self._precision)
+                self.variance = round(samples.variance(), self._precision)
+            else:
                 self.stdev = self.variance = STATE_UNKNOWN
 
-            if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+            if samples:
+                first_value, first_timestamp = samples.first
+                last_value, last_timestamp = samples.last
+
+                self.total = round(samples.total, self._precision)
+                self.min = round(samples.min(), self._precision)
+                self.max = round(samples.max(), self._precision)
 
-                self.min_age = self.ages[0]
-                self.max_age = self.ages[-1]
+                self.min_age = dt_util.utc_from_timestamp(first_timestamp)
+                self.max_age = dt_util.utc_from_timestamp(last_timestamp)
 
-                self.change = self.states[-1] - self.states[0]
+                self.change = last_value - first_value
                 self.average_change = self.change
                 self.change_rate = 0
 
-                if len(self.states) > 1:
-                    self.average_change /= len(self.states) - 1
+                if len(samples) > 1:
+                    self.average_change /= len(samples) - 1
 
-                    time_diff = (self.max_age - self.min_age).total_seconds()
+                    time_diff = last_timestamp - first_timestamp
                     if time_diff > 0:
                         self.change_rate = self.change / time_diff
 
@@ -26,6 +26,17 @@ DOMAIN = "system_log"
 
 EVENT_SYSTEM_LOG = "system_log_event"
 
+# Records with the same fingerprint are added to the entry of the record
+# their source was last resolved for. The source is resolved again for one
+# out of this many records, to pick up other call paths of the same line.
+SOURCE_SAMPLE_INTERVAL = 100
+
+# Seconds between two events for records with the same fingerprint
+EVENT_MIN_INTERVAL = 1
+
+# Largest number of fingerprints remembered
+MAX_FINGERPRINTS = 1000
+
 SERVICE_CLEAR = "clear"
 SERVICE_WRITE = "write"
 
@@ -88,6 +99,25 @@ def _figure_out_source(record, call_stack, hass):
     return (record.pathname, record.lineno)
 
 
+def _fingerprint(record):
+    """Return a key of the records logged the same way, without a stack."""
+    exc_source = None
+    if record.exc_info and record.exc_info[2] is not None:
+        tb = record.exc_info[2]  # pylint: disable=invalid-name
+        while tb.tb_next is not None:
+            tb = tb.tb_next  # pylint: disable=invalid-name
+        exc_source = (record.exc_info[0], tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+
+    return (
+        record.name,
+        record.levelno,
+        record.msg if isinstance(record.msg, str) else None,
+        record.pathname,
+        record.lineno,
+        exc_source,
+    )
+
+
 class LogEntry:
     """Store HA log entries."""
 
@@ -109,6 +139,13 @@ class LogEntry:
         self.count = 1
         self.hash = str([self.name, *self.source, self.root_cause])
 
+    def add_occurrence(self, timestamp, message):
+        """Count another occurrence of the entry."""
+        self.count += 1
+        self.timestamp = timestamp
+        if message not in self.message:
+            self.message.append(message)
+
     def to_dict(self):
         """Convert object into dict to maintain backward compatibility."""
         return {
@@ -132,31 +169,41 @@ class DedupStore(OrderedDict):
         self.maxlen = maxlen
 
     def add_entry(self, entry):
-        """Add a new entry."""
+        """Add a new entry and return the stored entry it was merged into."""
         key = entry.hash
 
         if key in self:
             # Update stored entry
             existing = self[key]
-            existing.count += 1
-            existing.timestamp = entry.timestamp
-
-            if entry.message[0] not in existing.message:
-                existing.message.append(entry.message[0])
-
+            existing.add_occurrence(entry.timestamp, entry.message[0])
             self.move_to_end(key)
-        else:
-            self[key] = entry
+            return existing
+
+        self[key] = entry
 
         if len(self) > self.maxlen:
             # Removes the first record which should also be the oldest
             self.popitem(last=False)
 
+        return entry
+
     def to_list(self):
         """Return reversed list of log entries - LIFO."""
         return [value.to_dict() for value in reversed(self.values())]
 
 
+class _Capture:
+    """Entry that records with the same fingerprint are added to."""
+
+    __slots__ = ("key", "unresolved", "last_event")
+
+    def __init__(self, key):
+        """Initialize the capture."""
+        self.key = key
+        self.unresolved = 0
+        self.last_event = None
+
+
 class LogErrorQueueHandler(logging.handlers.QueueHandler):
     """Process the log in another thread."""
 
@@ -177,6 +224,7 @@ class LogErrorHandler(logging.Handler):
         self.hass = hass
         self.records = DedupStore(maxlen=maxlen)
         self.fire_event = fire_event
+        self._captures = {}
 
     def emit(self, record):
         """Save error and warning logs.
@@ -184,15 +232,47 @@ class LogErrorHandler(logging.Handler):
         Everything logged with error or warning is saved in local buffer. A
         default upper limit is set to 50 (older entries are discarded) but can
         be changed if needed.
+
+        Figuring out the source of a record needs its stack, which is too slow
+        when an integration logs hundreds of records a second. Records logged
+        the same way are instead counted in the entry of the last record whose
+        source was resolved, and fire at most one event a second.
         """
-        stack = []
-        if not record.exc_info:
-            stack = [(f[0], f[1]) for f in traceback.extract_stack()]
-
-        entry = LogEntry(record, stack, _figure_out_source(record, stack, self.hass))
-        self.records.add_entry(entry)
-        if self.fire_event:
-            self.hass.bus.fire(EVENT_SYSTEM_LOG, entry.to_dict())
+        fingerprint = _fingerprint(record)
+        capture = self._captures.get(fingerprint)
+        entry = None
+        if capture is not None and capture.unresolved < SOURCE_SAMPLE_INTERVAL:
+            entry = self.records.get(capture.key)
+
+        if entry is not None:
+            capture.unresolved += 1
+            entry.add_occurrence(record.created, record.getMessage())
+            self.records.move_to_end(capture.key)
+        else:
+            stack = []
+            if not record.exc_info:
+                stack = [(f[0], f[1]) for f in traceback.extract_stack()]
+
+            entry = self.records.add_entry(
+                LogEntry(record, stack, _figure_out_source(record, stack, self.hass))
+            )
+            if capture is None:
+                if len(self._captures) >= MAX_FINGERPRINTS:
+                    self._captures.clear()
+                capture = self._captures[fingerprint] = _Capture(entry.hash)
+            capture.key = entry.hash
+            capture.unresolved = 0
+
+        if not self.fire_event or (
+            capture.last_event is not None
+            and record.created - capture.last_event < EVENT_MIN_INTERVAL
+        ):
+            return
+
+        capture.last_event = record.created
+        self.hass.bus.fire(
+            EVENT_SYSTEM_LOG, {**entry.to_dict(), "message": [record.getMessage()]}
+        )
 
 
 async def async_setup(hass, config):
@@ -1,4 +1,6 @@
 """Support for performing TensorFlow classification on images."""
+import asyncio
+from functools import partial
 import io
 import logging
 import os
@@ -18,6 +20,7 @@ from homeassistant.components.image_processing import (
     PLATFORM_SCHEMA,
     ImageProcessingEntity,
 )
+from homeassistant.components.image_processing.batch import InferenceQueue
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import split_entity_id
 from homeassistant.helpers import template
@@ -96,6 +99,65 @@ def get_model_detection_function(model):
     return detect_fn
 
 
+def decode_image(image):
+    """Decode an image to an RGB array, or return None if it is not an image."""
+    try:
+        import cv2  # pylint: disable=import-error, import-outside-toplevel
+
+        # pylint: disable=no-member
+        img = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+        if img is None:
+            _LOGGER.warning("Unable to process image, bad data")
+            return None
+        return img[:, :, 2::-1]  # BGR->RGB
+    except ImportError:
+        try:
+            img = Image.open(io.BytesIO(image)).convert("RGB")
+        except UnidentifiedImageError:
+            _LOGGER.warning("Unable to process image, bad data")
+            return None
+        img.thumbnail((460, 460), Image.ANTIALIAS)
+        return np.asarray(img)
+
+
+def detect_images(model_data, images):
+    """Run the model once for all images of the same size.
+
+    Returns the boxes, scores and classes detected in each image, or None for
+    the images that could not be processed.
+    """
+    model = model_data[CONF_MODEL]
+    if not model:
+        _LOGGER.debug("Model not yet ready.")
+        return [None] * len(images)
+
+    results = [None] * len(images)
+    batches = {}
+    for index, image in enumerate(images):
+        inp = decode_image(image)
+        if inp is not None:
+            batches.setdefault(inp.shape, []).append((index, inp))
+
+    for batch in batches.values():
+        if len(batch) == 1:
+            # The model expects a batch of images, so add an axis.
+            inp_batch = batch[0][1][np.newaxis, ...]
+        else:
+            inp_batch = np.stack([inp for _, inp in batch])
+
+        # The input needs to be a tensor, convert it using `tf.convert_to_tensor`.
+        input_tensor = tf.convert_to_tensor(inp_batch, dtype=tf.float32)
+
+        detections = model(input_tensor)
+        boxes = detections["detection_boxes"].numpy()
+        scores = detections["detection_scores"].numpy()
+        classes = detections["detection_classes"].numpy()
+        for position, (index, _) in enumerate(batch):
+            results[index] = (boxes[position], scores[position], classes[position])
+
+    return results
+
+
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the TensorFlow image processing platform."""
     model_config = config[CONF_MODEL]
@@ -144,7 +206,11 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
             "PIL at reduced resolution"
         )
 
-    hass.data[DOMAIN] = {CONF_MODEL: None}
+    hass.data[DOMAIN] = model_data = {CONF_MODEL: None}
+    # The cameras share the model, so their images are processed in batches
+    queue = InferenceQueue(
+        hass, model_config[CONF_GRAPH], partial(detect_images, model_data)
+    )
 
     def tensorflow_hass_start(_event):
         """Set up TensorFlow model on hass start."""
@@ -194,6 +260,7 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
                 camera.get(CONF_NAME),
                 category_index,
                 config,
+                queue,
             )
         )
 
@@ -210,6 +277,7 @@ class TensorFlowImageProcessor(ImageProcessingEntity):
         name,
         category_index,
         config,
+        queue,
     ):
         """Initialize the TensorFlow entity."""
         model_config = config.get(CONF_MODEL)
@@ -220,6 +288,7 @@ class TensorFlowImageProcessor(ImageProcessingEntity):
         else:
             self._name = "TensorFlow {}".format(split_entity_id(camera_entity)[1])
         self._category_index = category_index
+        self._queue = queue
         self._min_confidence = config.get(CONF_CONFIDENCE)
         self._file_out = config.get(CONF_FILE_OUT)
 
@@ -334,44 +403,24 @@ class TensorFlowImageProcessor(ImageProcessingEntity):
 
     def process_image(self, image):
         """Process the image."""
-        model = self.hass.data[DOMAIN][CONF_MODEL]
-        if not model:
-            _LOGGER.debug("Model not yet ready.")
-            return
+        asyncio.run_coroutine_threadsafe(
+            self.async_process_image(image), self.hass.loop
+        ).result()
 
+    async def async_process_image(self, image):
+        """Process the image along with the images of the other cameras."""
         start = time.perf_counter()
-        try:
-            import cv2  # pylint: disable=import-error, import-outside-toplevel
-
-            # pylint: disable=no-member
-            img = cv2.imdecode(np.asarray(bytearray(image)), cv2.IMREAD_UNCHANGED)
-            inp = img[:, :, [2, 1, 0]]  # BGR->RGB
-            inp_expanded = inp.reshape(1, inp.shape[0], inp.shape[1], 3)
-        except ImportError:
-            try:
-                img = Image.open(io.BytesIO(bytearray(image))).convert("RGB")
-            except UnidentifiedImageError:
-                _LOGGER.warning("Unable to process image, bad data")
-                return
-            img.thumbnail((460, 460), Image.ANTIALIAS)
-            img_width, img_height = img.size
-            inp = (
-                np.array(img.getdata())
-                .reshape((img_height, img_width, 3))
-                .astype(np.uint8)
-            )
-            inp_expanded = np.expand_dims(inp, axis=0)
-
-        # The input needs to be a tensor, convert it using `tf.convert_to_tensor`.
-        input_tensor = tf.convert_to_tensor(inp_expanded, dtype=tf.float32)
-
-        detections = model(input_tensor)
-        boxes = detections["detection_boxes"][0].numpy()
-        scores = detections["detection_scores"][0].numpy()
-        classes = (
-            detections["detection_classes"][0].numpy() + self._label_id_offset
-        ).astype(int)
+        detections = await self._queue.async_process(image)
+        if detections is None:
+            return
+        await self.hass.async_add_executor_job(
+            self._process_detections, image, detections, start
+        )
 
+    def _process_detections(self, image, detections, start):
+        """Filter the objects detected in the image and save it."""
+        boxes, scores, classes = detections
+        classes = (classes + self._label_id_offset).astype(int)
         matches = {}
         total_matches = 0
         for box, score, obj_class in zip(boxes, scores, classes):
@@ -1,5 +1,6 @@
 """Provide functionality for TTS."""
 import asyncio
+from collections import OrderedDict
 import functools as ft
 import hashlib
 import io
@@ -7,9 +8,9 @@ import logging
 import mimetypes
 import os
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import mutagen
 from mutagen.id3 import ID3, TextFrame as ID3Text
 import voluptuous as vol
@@ -25,6 +26,7 @@ from homeassistant.components.media_player.const import (
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     CONF_PLATFORM,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
 )
@@ -33,6 +35,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, discovery
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.network import get_url
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.setup import async_prepare_setup_platform
 
@@ -51,17 +54,27 @@ BASE_URL_KEY = "tts_base_url"
 CONF_BASE_URL = "base_url"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_SIZE = "cache_size"
 CONF_LANG = "language"
 CONF_SERVICE_NAME = "service_name"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_SIZE = 100  # MiB
 DEFAULT_TIME_MEMORY = 300
 DOMAIN = "tts"
 
 MEM_CACHE_FILENAME = "filename"
 MEM_CACHE_VOICE = "voice"
+MEM_CACHE_TIMER = "timer"
+
+# Largest number of bytes of speech kept in memory
+MAX_MEM_CACHE_SIZE = 10 * 1024 * 1024
+
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
 
 SERVICE_CLEAR_CACHE = "clear_cache"
 SERVICE_SAY = "say"
@@ -85,6 +98,9 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Required(CONF_PLATFORM): vol.All(cv.string, _deprecated_platform),
         vol.Optional(CONF_CACHE, default=DEFAULT_CACHE): cv.boolean,
         vol.Optional(CONF_CACHE_DIR, default=DEFAULT_CACHE_DIR): cv.string,
+        vol.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
@@ -116,10 +132,13 @@ async def async_setup(hass, config):
         use_cache = conf.get(CONF_CACHE, DEFAULT_CACHE)
         cache_dir = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
         time_memory = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+        cache_size = conf.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE)
         base_url = conf.get(CONF_BASE_URL)
         hass.data[BASE_URL_KEY] = base_url
 
-        await tts.async_init_cache(use_cache, cache_dir, time_memory, base_url)
+        await tts.async_init_cache(
+            use_cache, cache_dir, time_memory, base_url, cache_size
+        )
     except (HomeAssistantError, KeyError):
         _LOGGER.exception("Error on cache init")
         return False
@@ -232,7 +251,13 @@ def _hash_options(options: Dict) -> str:
 
 
 class SpeechManager:
-    """Representation of a speech store."""
+    """Representation of a speech store.
+
+    The speech files on disk are kept in an index ordered from the least to
+    the most recently used, persisted in storage so the cache directory is
+    only listed when there is no index yet. The least recently used files
+    are removed once the cache grows larger than its size limit.
+    """
 
     def __init__(self, hass):
         """Initialize a speech store."""
@@ -241,16 +266,28 @@ class SpeechManager:
 
         self.use_cache = DEFAULT_CACHE
         self.cache_dir = DEFAULT_CACHE_DIR
+        self.cache_size = DEFAULT_CACHE_SIZE * 1024 * 1024
         self.time_memory = DEFAULT_TIME_MEMORY
         self.base_url = None
-        self.file_cache = {}
-        self.mem_cache = {}
+        self.file_cache: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self.file_cache_size = 0
+        self.mem_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self.mem_cache_size = 0
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._order_changed = False
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_save_order
+        )
 
-    async def async_init_cache(self, use_cache, cache_dir, time_memory, base_url):
+    async def async_init_cache(
+        self, use_cache, cache_dir, time_memory, base_url, cache_size=None
+    ):
         """Init config folder and load file cache."""
         self.use_cache = use_cache
         self.time_memory = time_memory
         self.base_url = base_url
+        if cache_size is not None:
+            self.cache_size = cache_size * 1024 * 1024
 
         try:
             self.cache_dir = await self.hass.async_add_executor_job(
@@ -259,30 +296,108 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
-        try:
-            cache_files = await self.hass.async_add_executor_job(
-                _get_cache_files, self.cache_dir
-            )
-        except OSError as err:
-            raise HomeAssistantError(f"Can't read cache dir {err}") from err
+        index = await self._store.async_load()
+        if index is not None and index["cache_dir"] == self.cache_dir:
+            cache_files = {
+                key: (filename, size) for key, filename, size in index["files"]
+            }
+        else:
+            try:
+                cache_files = await self.hass.async_add_executor_job(
+                    _get_cache_files, self.cache_dir
+                )
+            except OSError as err:
+                raise HomeAssistantError(f"Can't read cache dir {err}") from err
+            self._async_schedule_save()
 
-        if cache_files:
-            self.file_cache.update(cache_files)
+        for key, (filename, size) in cache_files.items():
+            self.file_cache[key] = (filename, size)
+            self.file_cache_size += size
+        self._async_trim_file_cache()
 
     async def async_clear_cache(self):
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        for voice in self.mem_cache.values():
+            voice[MEM_CACHE_TIMER].cancel()
+        self.mem_cache = OrderedDict()
+        self.mem_cache_size = 0
 
         def remove_files():
             """Remove files from filesystem."""
-            for filename in self.file_cache.values():
+            for filename, _ in self.file_cache.values():
                 try:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
         await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+        self.file_cache = OrderedDict()
+        self.file_cache_size = 0
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self):
+        """Schedule saving the index of the file cache."""
+        self._order_changed = False
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def _async_save_order(self, _event):
+        """Save the order in which the files were last used on shutdown."""
+        if self._order_changed:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self):
+        """Return the index of the file cache, least recently used first."""
+        return {
+            "cache_dir": self.cache_dir,
+            "files": [
+                [key, filename, size]
+                for key, (filename, size) in self.file_cache.items()
+            ],
+        }
+
+    @callback
+    def _async_use_file(self, key):
+        """Mark a file of the file cache as the most recently used.
+
+        Only the order of the files changes, which is saved along with the
+        next change of the files or on shutdown rather than on every use.
+        """
+        if next(reversed(self.file_cache)) != key:
+            self.file_cache.move_to_end(key)
+            self._order_changed = True
+
+    @callback
+    def _async_remove_file(self, key):
+        """Forget a file of the file cache that cannot be read."""
+        _, size = self.file_cache.pop(key)
+        self.file_cache_size -= size
+        self._async_schedule_save()
+
+    @callback
+    def _async_trim_file_cache(self):
+        """Remove the least recently used files above the size limit."""
+        filenames = []
+        while self.file_cache_size > self.cache_size and len(self.file_cache) > 1:
+            _, (filename, size) = self.file_cache.popitem(last=False)
+            self.file_cache_size -= size
+            filenames.append(filename)
+
+        if not filenames:
+            return
+
+        def remove_files():
+            """Remove files from filesystem."""
+            for filename in filenames:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError as err:
+                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+        _LOGGER.debug("Removing %d files from the cache", len(filenames))
+        self.hass.async_add_executor_job(remove_files)
+        self._async_schedule_save()
 
     @callback
     def async_register_engine(self, engine, provider, config):
@@ -334,10 +449,11 @@ class SpeechManager:
         # Is speech already in memory
         if key in self.mem_cache:
             filename = self.mem_cache[key][MEM_CACHE_FILENAME]
-        # Is file store in file cache
+            self.mem_cache.move_to_end(key)
+        # Is file store in file cache, it is streamed from disk
         elif use_cache and key in self.file_cache:
-            filename = self.file_cache[key]
-            self.hass.async_create_task(self.async_file_to_mem(key))
+            filename = self.file_cache[key][0]
+            self._async_use_file(key)
         # Load speech from provider into memory
         else:
             filename = await self.async_get_tts_audio(
@@ -389,19 +505,27 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        if key in self.file_cache:
+            self.file_cache_size -= self.file_cache[key][1]
+        self.file_cache[key] = (filename, len(data))
+        self.file_cache_size += len(data)
+        self.file_cache.move_to_end(key)
+        self._async_schedule_save()
+        self._async_trim_file_cache()
 
     async def async_file_to_mem(self, key):
         """Load voice from file cache into memory.
 
         This method is a coroutine.
         """
-        filename = self.file_cache.get(key)
-        if not filename:
+        if key not in self.file_cache:
             raise HomeAssistantError(f"Key {key} not in file cache!")
 
+        filename = self.file_cache[key][0]
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech():
@@ -412,36 +536,78 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[key]
+            self._async_remove_file(key)
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(key, filename, data)
 
     @callback
     def _async_store_to_memcache(self, key, filename, data):
-        """Store data to memcache and set timer to remove it."""
-        self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        """Store data to memcache and set timer to remove it.
+
+        The least recently used speech is removed once the memcache holds
+        more than MAX_MEM_CACHE_SIZE bytes.
+        """
+        self._async_remove_from_memcache(key)
 
         @callback
         def async_remove_from_mem():
             """Cleanup memcache."""
-            self.mem_cache.pop(key, None)
-
-        self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
+            self._async_remove_from_memcache(key)
+
+        self.mem_cache[key] = {
+            MEM_CACHE_FILENAME: filename,
+            MEM_CACHE_VOICE: data,
+            MEM_CACHE_TIMER: self.hass.loop.call_later(
+                self.time_memory, async_remove_from_mem
+            ),
+        }
+        self.mem_cache_size += len(data)
+        while self.mem_cache_size > MAX_MEM_CACHE_SIZE and len(self.mem_cache) > 1:
+            self._async_remove_from_memcache(next(iter(self.mem_cache)))
 
-    async def async_read_tts(self, filename):
-        """Read a voice file and return binary.
-
-        This method is a coroutine.
-        """
+    @callback
+    def _async_remove_from_memcache(self, key):
+        """Remove speech from the memcache."""
+        voice = self.mem_cache.pop(key, None)
+        if voice is not None:
+            voice[MEM_CACHE_TIMER].cancel()
+            self.mem_cache_size -= len(voice[MEM_CACHE_VOICE])
+
+    def _key_from_filename(self, filename):
+        """Return the cache key of a voice filename."""
         record = _RE_VOICE_FILE.match(filename.lower())
         if not record:
             raise HomeAssistantError("Wrong tts file format!")
 
-        key = KEY_PATTERN.format(
+        return KEY_PATTERN.format(
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
+    async def async_get_tts_file(self, filename):
+        """Return the path of a voice file only cached on disk, or None.
+
+        This method is a coroutine.
+        """
+        key = self._key_from_filename(filename)
+        if key in self.mem_cache or key not in self.file_cache:
+            return None
+
+        voice_file = os.path.join(self.cache_dir, self.file_cache[key][0])
+        if not await self.hass.async_add_executor_job(os.path.isfile, voice_file):
+            self._async_remove_file(key)
+            raise HomeAssistantError(f"Can't read {voice_file}")
+
+        self._async_use_file(key)
+        return voice_file
+
+    async def async_read_tts(self, filename):
+        """Read a voice file and return binary.
+
+        This method is a coroutine.
+        """
+        key = self._key_from_filename(filename)
+
         if key not in self.mem_cache:
             if key not in self.file_cache:
                 raise HomeAssistantError(f"{key} not in cache!")
@@ -538,18 +704,25 @@ def _init_tts_cache_dir(hass, cache_dir):
 
 
 def _get_cache_files(cache_dir):
-    """Return a dict of given engine files."""
-    cache = {}
-
-    folder_data = os.listdir(cache_dir)
-    for file_data in folder_data:
-        record = _RE_VOICE_FILE.match(file_data)
-        if record:
-            key = KEY_PATTERN.format(
-                record.group(1), record.group(2), record.group(3), record.group(4)
-            )
-            cache[key.lower()] = file_data.lower()
-    return cache
+    """Return a dict of given engine files and their sizes.
+
+    The files are ordered from the least to the most recently modified.
+    """
+    files = []
+
+    with os.scandir(cache_dir) as folder_data:
+        for file_data in folder_data:
+            record = _RE_VOICE_FILE.match(file_data.name)
+            if record:
+                key = KEY_PATTERN.format(
+                    record.group(1), record.group(2), record.group(3), record.group(4)
+                )
+                stat = file_data.stat()
+                files.append(
+                    (stat.st_mtime, key.lower(), file_data.name.lower(), stat.st_size)
+                )
+
+    return {key: (filename, size) for _, key, filename, size in sorted(files)}
 
 
 class TextToSpeechUrlView(HomeAssistantView):
@@ -608,6 +781,13 @@ class TextToSpeechView(HomeAssistantView):
     async def get(self, request: web.Request, filename: str) -> web.Response:
         """Start a get request."""
         try:
+            voice_file = await self.tts.async_get_tts_file(filename)
+            if voice_file is not None:
+                content, _ = mimetypes.guess_type(filename)
+                return web.FileResponse(
+                    voice_file,
+                    headers={hdrs.CONTENT_TYPE: content or "application/octet-stream"},
+                )
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
@@ -15,9 +15,11 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity
 from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.polling import async_get_scheduler
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.template import Template
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline
 
 from . import const, decorators, messages
 
@@ -37,6 +39,8 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_setup_timeline)
+    async_reg(hass, handle_polling_statistics)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -234,6 +238,29 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "integration/setup_timeline",
+        vol.Optional("format", default="spans"): vol.In(["spans", "chrome"]),
+    }
+)
+def handle_setup_timeline(hass, connection, msg):
+    """Handle setup timeline command."""
+    timeline = async_get_setup_timeline(hass)
+    if msg["format"] == "chrome":
+        connection.send_result(msg["id"], timeline.as_chrome_trace())
+        return
+    connection.send_result(msg["id"], timeline.as_list())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "entity/polling_statistics"})
+def handle_polling_statistics(hass, connection, msg):
+    """Handle polling statistics command."""
+    connection.send_result(msg["id"], async_get_scheduler(hass).async_statistics())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
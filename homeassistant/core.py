@@ -965,9 +965,17 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
+        # States by domain, to answer domain filtered queries without a scan
+        self._domain_index: Dict[str, Dict[str, State]] = {}
         self._reservations: Set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Return a number that changes when an entity is added or removed."""
+        return self._generation
 
     def entity_ids(self, domain_filter: Optional[str] = None) -> List[str]:
         """List of entity ids that are being tracked."""
@@ -987,13 +995,10 @@ class StateMachine:
         if domain_filter is None:
             return list(self._states)
 
-        if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
-
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for domain_states in self._async_domain_states(domain_filter)
+            for entity_id in domain_states
         ]
 
     @callback
@@ -1007,11 +1012,9 @@ class StateMachine:
         if domain_filter is None:
             return len(self._states)
 
-        if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
-
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(domain_states)
+            for domain_states in self._async_domain_states(domain_filter)
         )
 
     def all(self, domain_filter: Optional[Union[str, Iterable]] = None) -> List[State]:
@@ -1031,11 +1034,28 @@ class StateMachine:
         if domain_filter is None:
             return list(self._states.values())
 
+        return [
+            state
+            for domain_states in self._async_domain_states(domain_filter)
+            for state in domain_states.values()
+        ]
+
+    @callback
+    def _async_domain_states(
+        self, domain_filter: Union[str, Iterable]
+    ) -> List[Dict[str, State]]:
+        """Return the states of each domain in the filter.
+
+        This method must be run in the event loop.
+        """
         if isinstance(domain_filter, str):
             domain_filter = (domain_filter.lower(),)
 
+        # dict.fromkeys drops duplicate domains while keeping the order
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            self._domain_index[domain]
+            for domain in dict.fromkeys(domain_filter)
+            if domain in self._domain_index
         ]
 
     def get(self, entity_id: str) -> Optional[State]:
@@ -1079,6 +1099,12 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+        self._generation += 1
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1184,6 +1210,9 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
+        if old_state is None:
+            self._generation += 1
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -2,9 +2,19 @@
 import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+from functools import partial
 from logging import Logger
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
 
 from homeassistant import config_entries
 from homeassistant.const import ATTR_RESTORED, DEVICE_DEFAULT_NAME
@@ -21,7 +31,13 @@ from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
+from .polling import (
+    POLL_SPREAD_FRACTION,
+    POLL_SPREAD_MIN_UPDATES,
+    async_track_polling,
+    poll_offset,
+)
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -69,6 +85,8 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
         self._process_updates: Optional[asyncio.Lock] = None
+        # Methods to cancel the spread updates of a poll, by entity or device
+        self._spread_updates: Dict[str, CALLBACK_TYPE] = {}
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -333,12 +351,21 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
+        self._async_unsub_polling = async_track_polling(
             self.hass,
             self._update_entity_states,
             self.scan_interval,
+            self._polling_key,
         )
 
+    @property
+    def _polling_key(self) -> str:
+        """Return the key used to spread the polls of this platform."""
+        key = f"{self.domain}.{self.platform_name}"
+        if self.config_entry is not None:
+            key = f"{key}.{self.config_entry.entry_id}"
+        return key
+
     async def _async_add_entity(  # type: ignore[no-untyped-def]
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -524,6 +551,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        self._async_cancel_spread_updates()
         self._setup_complete = False
 
     async def async_destroy(self) -> None:
@@ -544,6 +572,7 @@ class EntityPlatform:
         ):
             self._async_unsub_polling()
             self._async_unsub_polling = None
+            self._async_cancel_spread_updates()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -608,14 +637,106 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
-            tasks = []
+            update_device_entities = getattr(
+                self.platform, "async_update_device_entities", None
+            )
+            updates: Dict[str, Callable[[], Awaitable]] = {}
+            device_entities: Dict[str, List["Entity"]] = {}
             for entity in self.entities.values():
                 if not entity.should_poll:
                     continue
-                tasks.append(entity.async_update_ha_state(True))
+                if update_device_entities is not None and entity.registry_entry:
+                    device_id = entity.registry_entry.device_id
+                    if device_id is not None:
+                        device_entities.setdefault(device_id, []).append(entity)
+                        continue
+                updates[entity.entity_id] = partial(self._async_update_entity, entity)
+
+            for device_id, entities in device_entities.items():
+                updates[device_id] = partial(
+                    self._async_update_device_entities,
+                    update_device_entities,
+                    device_id,
+                    entities,
+                )
 
-            if tasks:
-                await asyncio.gather(*tasks)
+            if len(updates) < POLL_SPREAD_MIN_UPDATES:
+                if updates:
+                    await asyncio.gather(*(update() for update in updates.values()))
+                return
+
+            # Each update runs as its own job at the offset of its key
+            for key, update in updates.items():
+                if key in self._spread_updates:
+                    # The update of the previous poll did not finish yet
+                    continue
+                self._spread_updates[key] = async_call_later(
+                    self.hass,
+                    poll_offset(
+                        key, self.scan_interval, POLL_SPREAD_FRACTION
+                    ).total_seconds(),
+                    partial(self._async_run_spread_update, key, update),
+                )
+
+    async def _async_run_spread_update(
+        self, key: str, update: Callable[[], Awaitable], _now: datetime
+    ) -> None:
+        """Run an update spread over the scan interval."""
+        try:
+            await update()
+        finally:
+            self._spread_updates.pop(key, None)
+
+    @callback
+    def _async_cancel_spread_updates(self) -> None:
+        """Cancel the spread updates that did not run yet."""
+        for cancel in self._spread_updates.values():
+            cancel()
+        self._spread_updates.clear()
+
+    async def _async_update_entity(self, entity: "Entity") -> None:
+        """Update a polling entity unless it was removed meanwhile."""
+        if self.entities.get(entity.entity_id) is entity:
+            await entity.async_update_ha_state(True)
+
+    async def _async_update_device_entities(
+        self,
+        update_device_entities: Callable[..., Coroutine],
+        device_id: str,
+        entities: List["Entity"],
+    ) -> None:
+        """Update all polling entities of a device with a single call.
+
+        Platforms can implement async_update_device_entities(hass, device_id,
+        entities) to fetch the data of all entities of a device at once.
+        """
+        entities = [
+            entity
+            for entity in entities
+            if self.entities.get(entity.entity_id) is entity
+        ]
+        if not entities:
+            return
+
+        if self.parallel_updates:
+            await self.parallel_updates.acquire()
+
+        try:
+            await update_device_entities(self.hass, device_id, entities)
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception(
+                "Update for device %s of %s %s fails",
+                device_id,
+                self.platform_name,
+                self.domain,
+            )
+            return
+        finally:
+            if self.parallel_updates:
+                self.parallel_updates.release()
+
+        for entity in entities:
+            entity.async_write_ha_state()
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
@@ -1,7 +1,8 @@
 """Helper class to implement include/exclude of entities and domains."""
 import fnmatch
+from functools import lru_cache
 import re
-from typing import Callable, Dict, List, Pattern
+from typing import Callable, Dict, List, Optional, Pattern
 
 import voluptuous as vol
 
@@ -18,6 +19,9 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Largest number of entity ids a filter remembers the decision for
+MAX_CACHED_ENTITY_IDS = 4096
+
 
 def convert_filter(config: Dict[str, List[str]]) -> Callable[[str], bool]:
     """Convert the filter schema into a filter."""
@@ -102,18 +106,12 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
-
+def _convert_globs_to_pattern(globs: List[str]) -> Optional[Pattern[str]]:
+    """Translate and compile glob strings into a pattern matching any of them."""
+    if not globs:
+        return None
 
-def _test_against_patterns(patterns: List[Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
-
-    return False
+    return re.compile("|".join(fnmatch.translate(glob) for glob in globs))
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -126,15 +124,16 @@ def generate_filter(
     include_entity_globs: List[str] = [],
     exclude_entity_globs: List[str] = [],
 ) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
+    """Return a function that will filter entities based on the args.
+
+    Filters remember their decision for the entity ids they were called with.
+    """
     include_d = set(include_domains)
     include_e = set(include_entities)
     exclude_d = set(exclude_domains)
     exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
+    include_eg = _convert_globs_to_pattern(sorted(set(include_entity_globs)))
+    exclude_eg = _convert_globs_to_pattern(sorted(set(exclude_entity_globs)))
 
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
@@ -144,7 +143,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or bool(include_eg and include_eg.match(entity_id))
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -152,7 +151,7 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or bool(exclude_eg and exclude_eg.match(entity_id))
         )
 
     # Case 1 - no includes or excludes - pass all entities
@@ -162,6 +161,7 @@ def generate_filter(
     # Case 2 - includes, no excludes - only include specified entities
     if have_include and not have_exclude:
 
+        @lru_cache(maxsize=MAX_CACHED_ENTITY_IDS)
         def entity_filter_2(entity_id: str) -> bool:
             """Return filter function for case 2."""
             domain = split_entity_id(entity_id)[0]
@@ -172,6 +172,7 @@ def generate_filter(
     # Case 3 - excludes, no includes - only exclude specified entities
     if not have_include and have_exclude:
 
+        @lru_cache(maxsize=MAX_CACHED_ENTITY_IDS)
         def entity_filter_3(entity_id: str) -> bool:
             """Return filter function for case 3."""
             domain = split_entity_id(entity_id)[0]
@@ -188,17 +189,16 @@ def generate_filter(
     #   If glob matches then exclude domains and glob checked
     if include_d or include_eg:
 
+        @lru_cache(maxsize=MAX_CACHED_ENTITY_IDS)
         def entity_filter_4a(entity_id: str) -> bool:
             """Return filter function for case 4a."""
             domain = split_entity_id(entity_id)[0]
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or bool(exclude_eg and exclude_eg.match(entity_id))
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if include_eg and include_eg.match(entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
@@ -213,12 +213,11 @@ def generate_filter(
     #  - if domain is not excluded, pass if entity not excluded by ID
     if exclude_d or exclude_eg:
 
+        @lru_cache(maxsize=MAX_CACHED_ENTITY_IDS)
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or (exclude_eg and exclude_eg.match(entity_id)):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
@@ -0,0 +1,167 @@
+"""Schedule polling of entity platforms."""
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.singleton import singleton
+import homeassistant.util.dt as dt_util
+
+DATA_POLLING = "polling_scheduler"
+
+# The first poll of a platform is moved forward by up to this fraction of
+# its scan interval. The offset is derived from the platform so platforms
+# sharing a scan interval keep polling at different moments.
+POLL_JITTER_FRACTION = 0.5
+
+# A poll updating at least this many entities or devices spreads their
+# updates over a fraction of the scan interval, each delayed by an offset
+# derived from the entity or device.
+POLL_SPREAD_MIN_UPDATES = 10
+POLL_SPREAD_FRACTION = 0.5
+
+
+def poll_offset(
+    key: str, interval: timedelta, fraction: float = POLL_JITTER_FRACTION
+) -> timedelta:
+    """Return the deterministic offset of the polls identified by key."""
+    return interval * (fraction * zlib.crc32(key.encode()) / 0xFFFFFFFF)
+
+
+class PollStatistics:
+    """Duration and overrun statistics of the polls of a platform."""
+
+    __slots__ = (
+        "key",
+        "interval",
+        "offset",
+        "polls",
+        "overruns",
+        "running",
+        "last_duration",
+        "max_duration",
+        "total_duration",
+    )
+
+    def __init__(self, key: str, interval: timedelta, offset: timedelta) -> None:
+        """Initialize the statistics."""
+        self.key = key
+        self.interval = interval
+        self.offset = offset
+        self.polls = 0
+        self.overruns = 0
+        self.running = False
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a poll."""
+        self.polls += 1
+        self.last_duration = duration
+        self.total_duration += duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "key": self.key,
+            "interval": self.interval.total_seconds(),
+            "offset": round(self.offset.total_seconds(), 3),
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "last_duration": round(self.last_duration, 6),
+            "max_duration": round(self.max_duration, 6),
+            "mean_duration": round(self.total_duration / self.polls, 6)
+            if self.polls
+            else 0.0,
+        }
+
+
+class PollingScheduler:
+    """Schedule the polls of all entity platforms."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.statistics: List[PollStatistics] = []
+
+    @callback
+    def async_track(
+        self,
+        action: Callable[[datetime], Awaitable[None]],
+        interval: timedelta,
+        key: str,
+    ) -> CALLBACK_TYPE:
+        """Call action every interval, starting at the offset of key."""
+        hass = self.hass
+        stats = PollStatistics(key, interval, poll_offset(key, interval))
+        self.statistics.append(stats)
+        remove: Optional[CALLBACK_TYPE] = None
+
+        async def async_poll(now: datetime) -> None:
+            """Run and time a poll."""
+            if stats.running:
+                stats.overruns += 1
+                # Let the action decide how to handle the overrun
+                await action(now)
+                return
+
+            stats.running = True
+            start = monotonic()
+            try:
+                await action(now)
+            finally:
+                stats.running = False
+                stats.add(monotonic() - start)
+
+        poll_job = HassJob(async_poll)
+
+        @callback
+        def interval_listener(now: datetime) -> None:
+            """Schedule the next poll and run this one."""
+            nonlocal remove
+            remove = async_track_point_in_utc_time(
+                hass, interval_listener_job, dt_util.utcnow() + interval
+            )
+            hass.async_run_hass_job(poll_job, now)
+
+        interval_listener_job = HassJob(interval_listener)
+        remove = async_track_point_in_utc_time(
+            hass, interval_listener_job, dt_util.utcnow() + interval - stats.offset
+        )
+
+        @callback
+        def remove_listener() -> None:
+            """Stop polling."""
+            assert remove is not None
+            remove()
+            self.statistics.remove(stats)
+
+        return remove_listener
+
+    @callback
+    def async_statistics(self) -> List[Dict[str, Any]]:
+        """Return the statistics of all tracked polls."""
+        return [stats.as_dict() for stats in self.statistics]
+
+
+@callback
+@singleton(DATA_POLLING)
+def async_get_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler(hass)
+
+
+@callback
+def async_track_polling(
+    hass: HomeAssistant,
+    action: Callable[[datetime], Awaitable[None]],
+    interval: timedelta,
+    key: str,
+) -> CALLBACK_TYPE:
+    """Call action every interval, spread over the interval by key."""
+    return async_get_scheduler(hass).async_track(action, interval, key)
@@ -1,13 +1,17 @@
 """Helpers to execute scripts."""
 import asyncio
+from collections import Counter, deque
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
 import logging
+from statistics import mean
+from time import monotonic
 from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
@@ -44,6 +48,7 @@ from homeassistant.const import (
     CONF_REPEAT,
     CONF_SCENE,
     CONF_SEQUENCE,
+    CONF_SERVICE,
     CONF_TARGET,
     CONF_TIMEOUT,
     CONF_UNTIL,
@@ -98,6 +103,10 @@ ATTR_MAX = "max"
 ATTR_MODE = "mode"
 
 DATA_SCRIPTS = "helpers.script"
+DATA_SCRIPT_METRICS = "helpers.script.metrics"
+
+# Number of most recent samples kept per measurement
+METRICS_MAX_SAMPLES = 100
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -198,6 +207,109 @@ class _StopScript(Exception):
     """Throw if script needs to stop."""
 
 
+class _RollingHistogram:
+    """Keep the most recent samples of a duration."""
+
+    __slots__ = ("count", "samples")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.count = 0
+        self.samples: Deque[float] = deque(maxlen=METRICS_MAX_SAMPLES)
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.count += 1
+        self.samples.append(value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a summary of the samples."""
+        if not self.samples:
+            return {"count": self.count}
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "last": round(self.samples[-1], 6),
+            "min": round(ordered[0], 6),
+            "max": round(ordered[-1], 6),
+            "mean": round(mean(ordered), 6),
+            "p50": round(ordered[len(ordered) // 2], 6),
+            "p90": round(ordered[int(len(ordered) * 0.9)], 6),
+        }
+
+
+class ScriptMetrics:
+    """Timing of the runs of a script and of its steps."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.runs = 0
+        self.run_duration = _RollingHistogram()
+        self.queue_wait = _RollingHistogram()
+        self.steps: Dict[int, _RollingHistogram] = {}
+
+    def add_step(self, step: int, duration: float) -> None:
+        """Add the duration of a step."""
+        histogram = self.steps.get(step)
+        if histogram is None:
+            histogram = self.steps[step] = _RollingHistogram()
+        histogram.add(duration)
+
+    def as_dict(self, sequence: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        steps = []
+        for step, histogram in sorted(self.steps.items()):
+            action = sequence[step]
+            description = action.get(CONF_ALIAS)
+            if description is None and isinstance(action.get(CONF_SERVICE), str):
+                description = action[CONF_SERVICE]
+            steps.append(
+                {
+                    "step": step,
+                    "action": cv.determine_script_action(action),
+                    "description": description,
+                    **histogram.as_dict(),
+                }
+            )
+        return {
+            "runs": self.runs,
+            "run_duration": self.run_duration.as_dict(),
+            "queue_wait": self.queue_wait.as_dict(),
+            "steps": steps,
+        }
+
+
+@callback
+def async_enable_metrics(hass: HomeAssistant, enabled: bool = True) -> None:
+    """Enable or disable recording metrics of script runs."""
+    hass.data[DATA_SCRIPT_METRICS] = enabled
+
+
+@callback
+def async_get_metrics(hass: HomeAssistant) -> Dict[str, Any]:
+    """Return the metrics of all top level scripts."""
+    modes: Counter = Counter()
+    scripts = []
+    for script in hass.data.get(DATA_SCRIPTS, []):
+        instance = script["instance"]
+        if instance.metrics is None:
+            continue
+        modes[instance.script_mode] += instance.metrics.runs
+        scripts.append(
+            {
+                "name": instance.name,
+                "domain": instance.domain,
+                "mode": instance.script_mode,
+                **instance.metrics.as_dict(instance.sequence),
+            }
+        )
+    return {
+        "enabled": hass.data.get(DATA_SCRIPT_METRICS, False),
+        "runs": dict(modes),
+        "scripts": scripts,
+    }
+
+
 class _ScriptRun:
     """Manage Script sequence run."""
 
@@ -208,12 +320,14 @@ class _ScriptRun:
         variables: Dict[str, Any],
         context: Optional[Context],
         log_exceptions: bool,
+        metrics: Optional[ScriptMetrics] = None,
     ) -> None:
         self._hass = hass
         self._script = script
         self._variables = variables
         self._context = context
         self._log_exceptions = log_exceptions
+        self._metrics = metrics
         self._step = -1
         self._action: Optional[Dict[str, Any]] = None
         self._stop = asyncio.Event()
@@ -236,6 +350,8 @@ class _ScriptRun:
 
     async def async_run(self) -> None:
         """Run script."""
+        metrics = self._metrics
+        started = monotonic()
         try:
             if self._stop.is_set():
                 return
@@ -243,10 +359,19 @@ class _ScriptRun:
             for self._step, self._action in enumerate(self._script.sequence):
                 if self._stop.is_set():
                     break
-                await self._async_step(log_exceptions=False)
+                if metrics is None:
+                    await self._async_step(log_exceptions=False)
+                    continue
+                step_started = monotonic()
+                try:
+                    await self._async_step(log_exceptions=False)
+                finally:
+                    metrics.add_step(self._step, monotonic() - step_started)
         except _StopScript:
             pass
         finally:
+            if metrics is not None:
+                metrics.run_duration.add(monotonic() - started)
             self._finish()
 
     async def _async_step(self, log_exceptions):
@@ -690,6 +815,7 @@ class _QueuedScriptRun(_ScriptRun):
         """Run script."""
         # Wait for previous run, if any, to finish by attempting to acquire the script's
         # shared lock. At the same time monitor if we've been told to stop.
+        queued = monotonic()
         lock_task = self._hass.async_create_task(
             self._script._queue_lck.acquire()  # pylint: disable=protected-access
         )
@@ -705,6 +831,8 @@ class _QueuedScriptRun(_ScriptRun):
         finally:
             stop_task.cancel()
         self.lock_acquired = lock_task.done() and not lock_task.cancelled()
+        if self._metrics is not None:
+            self._metrics.queue_wait.add(monotonic() - queued)
 
         # If we've been told to stop, then just finish up. Otherwise, we've acquired the
         # lock so we can go ahead and start the run.
@@ -827,6 +955,7 @@ class Script:
 
         self.last_action = None
         self.last_triggered: Optional[datetime] = None
+        self.metrics: Optional[ScriptMetrics] = None
 
         self._runs: List[_ScriptRun] = []
         self.max_runs = max_runs
@@ -1016,12 +1145,25 @@ class Script:
         else:
             variables = cast(dict, run_variables)
 
+        if self._top_level and self._hass.data.get(DATA_SCRIPT_METRICS):
+            if self.metrics is None:
+                self.metrics = ScriptMetrics()
+            self.metrics.runs += 1
+            metrics = self.metrics
+        else:
+            metrics = None
+
         if self.script_mode != SCRIPT_MODE_QUEUED:
             cls = _ScriptRun
         else:
             cls = _QueuedScriptRun
         run = cls(
-            self._hass, self, cast(dict, variables), context, self._log_exceptions
+            self._hass,
+            self,
+            cast(dict, variables),
+            context,
+            self._log_exceptions,
+            metrics,
         )
         self._runs.append(run)
         if started_action:
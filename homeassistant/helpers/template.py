@@ -8,10 +8,20 @@ from functools import partial, wraps
 import json
 import logging
 import math
-from operator import attrgetter
 import random
 import re
-from typing import Any, Dict, Generator, Iterable, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -46,6 +56,7 @@ DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
 _ENVIRONMENT = "template.environment"
+_SORTED_STATES = "template.sorted_states"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -759,10 +770,57 @@ def _collect_state(hass: HomeAssistantType, entity_id: str) -> None:
         entity_collect.entities.add(entity_id)
 
 
+class _SortedStates:
+    """Sorted entity ids and state wrappers reused across renders.
+
+    The entity ids are sorted once per domain and kept until an entity is
+    added or removed. The wrappers are kept until their state changes.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the sorted states."""
+        self._hass = hass
+        self._generation = hass.states.generation
+        self._entity_ids: Dict[Optional[str], List[str]] = {}
+        self._wrappers: Dict[str, Tuple[State, TemplateState]] = {}
+
+    def async_entity_ids(self, domain: Optional[str]) -> List[str]:
+        """Return the sorted entity ids of a domain or all entities."""
+        generation = self._hass.states.generation
+        if generation != self._generation:
+            self._generation = generation
+            self._entity_ids.clear()
+            self._wrappers.clear()
+
+        entity_ids = self._entity_ids.get(domain)
+        if entity_ids is None:
+            entity_ids = self._entity_ids[domain] = sorted(
+                self._hass.states.async_entity_ids(domain)
+            )
+        return entity_ids
+
+    def async_wrap(self, state: State) -> TemplateState:
+        """Return the not collecting wrapper of a state."""
+        cached = self._wrappers.get(state.entity_id)
+        if cached is not None and cached[0] is state:
+            return cached[1]
+        wrapper = TemplateState(self._hass, state, collect=False)
+        self._wrappers[state.entity_id] = (state, wrapper)
+        return wrapper
+
+
 def _state_generator(hass: HomeAssistantType, domain: Optional[str]) -> Generator:
     """State generator for a domain or all states."""
-    for state in sorted(hass.states.async_all(domain), key=attrgetter("entity_id")):
-        yield TemplateState(hass, state, collect=False)
+    sorted_states: Optional[_SortedStates] = hass.data.get(_SORTED_STATES)
+    if sorted_states is None:
+        sorted_states = hass.data[_SORTED_STATES] = _SortedStates(hass)
+
+    get_state = hass.states.get
+    for entity_id in sorted_states.async_entity_ids(domain):
+        state = get_state(entity_id)
+        # The entity was removed while iterating
+        if state is not None:
+            yield sorted_states.async_wrap(state)
 
 
 def _get_state_if_valid(
@@ -2,8 +2,11 @@
 import asyncio
 from collections import ChainMap
 import logging
-from typing import Any, Dict, List, Optional, Set
+import os
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from homeassistant.const import __version__
 from homeassistant.core import callback
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
@@ -15,14 +18,23 @@ from homeassistant.loader import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.json import load_json
 
+from .storage import Store
 from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_LOAD_LOCK = "translation_load_lock"
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
+TRANSLATION_BUNDLES = "translation_bundles"
 LOCALE_EN = "en"
 
+BUNDLE_STORAGE_VERSION = 1
+BUNDLE_STORAGE_KEY = "core.translations"
+BUNDLE_SAVE_DELAY = 10
+
+# Languages are part of the bundle file name
+_VALID_LANGUAGE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 def recursive_flatten(prefix: Any, data: Dict) -> Dict[str, Any]:
     """Return a flattened representation of dict data."""
@@ -89,6 +101,103 @@ def load_translations_files(
     return loaded
 
 
+def load_bundled_translations_files(
+    translation_files: Dict[str, str], bundled: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Load translation files, taking the unchanged ones from a bundle.
+
+    Returns the translations and the bundle entries of the files loaded.
+    """
+    loaded = {}
+    modified_times = {}
+    for component, translation_file in translation_files.items():
+        try:
+            modified_time = os.path.getmtime(translation_file)
+        except OSError:
+            modified_time = None
+
+        entry = bundled.get(component)
+        if (
+            modified_time is not None
+            and entry is not None
+            and entry["path"] == translation_file
+            and entry["mtime"] == modified_time
+        ):
+            loaded[component] = dict(entry["translations"])
+        else:
+            modified_times[component] = modified_time
+
+    new_entries = {}
+    for component, loaded_json in load_translations_files(
+        {component: translation_files[component] for component in modified_times}
+    ).items():
+        loaded[component] = loaded_json
+        if modified_times[component] is not None:
+            new_entries[component] = {
+                "path": translation_files[component],
+                "mtime": modified_times[component],
+                "translations": dict(loaded_json),
+            }
+
+    return loaded, new_entries
+
+
+class _TranslationBundle:
+    """Translation files of a language persisted in a single file.
+
+    The bundle is read once, its entries are used for as long as their file
+    is not modified.
+    """
+
+    def __init__(self, hass: HomeAssistantType, language: str) -> None:
+        """Initialize the bundle."""
+        self._store = Store(
+            hass, BUNDLE_STORAGE_VERSION, f"{BUNDLE_STORAGE_KEY}.{language}"
+        )
+        self.files: Optional[Dict[str, Dict[str, Any]]] = None
+
+    async def async_load(self) -> Dict[str, Dict[str, Any]]:
+        """Return the bundled files, reading them on first use."""
+        if self.files is None:
+            data = await self._store.async_load()
+            files = {}
+            if isinstance(data, dict) and data.get("version") == __version__:
+                files = data["files"]
+            if self.files is None:
+                self.files = files
+        return self.files
+
+    @callback
+    def async_update(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Add loaded files to the bundle."""
+        assert self.files is not None
+        self.files.update(entries)
+        self._store.async_delay_save(self._data_to_save, BUNDLE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data of the bundle to store."""
+        # The files are written in the executor, while translations load
+        return {"version": __version__, "files": dict(self.files or {})}
+
+
+@callback
+def _async_get_bundle(
+    hass: HomeAssistantType, language: str
+) -> Optional[_TranslationBundle]:
+    """Return the translation bundle of a language."""
+    if not _VALID_LANGUAGE.match(language):
+        return None
+
+    bundles: Dict[str, _TranslationBundle] = hass.data.setdefault(
+        TRANSLATION_BUNDLES, {}
+    )
+    bundle = bundles.get(language)
+    if bundle is None:
+        bundle = bundles[language] = _TranslationBundle(hass, language)
+    return bundle
+
+
 def _merge_resources(
     translation_strings: Dict[str, Dict[str, Any]],
     components: Set[str],
@@ -180,11 +289,19 @@ async def async_get_component_strings(
         return translations
 
     # Load files
-    load_translations_job = hass.async_add_executor_job(
-        load_translations_files, files_to_load
-    )
-    assert load_translations_job is not None
-    loaded_translations = await load_translations_job
+    bundle = _async_get_bundle(hass, language)
+    if bundle is None:
+        load_translations_job = hass.async_add_executor_job(
+            load_translations_files, files_to_load
+        )
+        assert load_translations_job is not None
+        loaded_translations = await load_translations_job
+    else:
+        loaded_translations, new_entries = await hass.async_add_executor_job(
+            load_bundled_translations_files, files_to_load, await bundle.async_load()
+        )
+        if new_entries:
+            bundle.async_update(new_entries)
 
     # Translations that miss "title" will get integration put in.
     for loaded, loaded_translation in loaded_translations.items():
@@ -4,11 +4,17 @@ import asyncio
 import collections
 from contextlib import suppress
 from datetime import datetime
+import gzip
 import json
 import logging
+from pathlib import Path
+import tempfile
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
+from aiohttp import ClientSession, hdrs, web
+from aiohttp.test_utils import TestServer
+
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
@@ -185,6 +191,46 @@ async def state_changed_event_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_domain_queries(hass):
+    """Run 10k domain filtered queries against 12k states."""
+    domains = ["sensor", "binary_sensor", "light", "switch", "zone", "person"]
+    for idx in range(12000):
+        hass.states.async_set(f"{domains[idx % 6]}.entity_{idx}", "on")
+
+    start = timer()
+
+    for _ in range(10 ** 4):
+        hass.states.async_all("light")
+        hass.states.async_entity_ids("zone")
+        hass.states.async_entity_ids_count("sensor")
+        hass.states.async_all(["switch", "person"])
+
+    return timer() - start
+
+
+@benchmark
+async def template_domain_states(hass):
+    """Render a template iterating 2k of 12k states a thousand times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    domains = ["sensor", "binary_sensor", "light", "switch", "zone", "person"]
+    for idx in range(12000):
+        hass.states.async_set(f"{domains[idx % 6]}.entity_{idx}", "on")
+
+    tmpl = Template(
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+
+    start = timer()
+
+    for _ in range(1000):
+        tmpl.async_render()
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -290,17 +336,85 @@ async def filtering_entity_id(hass):
         "sun.sun",
     ]
 
+    return _filtering_entity_id(config, entity_ids)
+
+
+@benchmark
+async def filtering_entity_id_many_globs(hass):
+    """Run a million state changes of 1000 entities through 500 globs."""
+    config = {
+        "include": {
+            "domains": ["automation", "script"],
+            "entity_globs": [
+                f"{domain}.*_{idx}_*_{kind}"
+                for domain in ("sensor", "binary_sensor")
+                for kind in ("temperature", "humidity", "motion", "door", "window")
+                for idx in range(50)
+            ],
+            "entities": [],
+        },
+        "exclude": {
+            "domains": [],
+            "entity_globs": ["sensor.*_old_*", "binary_sensor.*_test_*"],
+            "entities": [],
+        },
+    }
+
+    entity_ids = [
+        f"{domain}.room_{idx % 60}_{place}_{kind}"
+        for domain, kind in (
+            ("sensor", "temperature"),
+            ("sensor", "humidity"),
+            ("binary_sensor", "motion"),
+            ("binary_sensor", "door"),
+            ("light", "light"),
+        )
+        for place in ("new", "old", "test", "main")
+        for idx in range(50)
+    ]
+
+    return _filtering_entity_id(config, entity_ids, 10 ** 6)
+
+
+def _filtering_entity_id(config, entity_ids, count=10 ** 5):
+    """Run count state changes of the entity ids through the filter."""
     entities_filter = convert_include_exclude_filter(config)
     size = len(entity_ids)
 
     start = timer()
 
-    for i in range(10 ** 5):
+    for i in range(count):
         entities_filter(entity_ids[i % size])
 
     return timer() - start
 
 
+@benchmark
+async def sample_window_statistics(hass):
+    """Run 100k samples through statistics over a 100k sample window."""
+    # pylint: disable=import-outside-toplevel
+    import random
+
+    from homeassistant.util.sample_window import SampleWindow
+
+    rnd = random.Random(0)
+    window = SampleWindow(10 ** 5)
+    for idx in range(10 ** 5):
+        window.append(rnd.gauss(20, 5), idx)
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        window.append(rnd.gauss(20, 5), idx)
+        window.mean()
+        window.median()
+        window.stdev()
+        window.min()
+        window.max()
+
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -323,6 +437,565 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def static_file_requests(hass):
+    """Serve 10k requests for a frontend bundle of 200 precompressed files."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.http.static import CachingStaticResource
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        names = [f"chunk.{idx}.js" for idx in range(200)]
+        content = b"console.log('benchmark');" * 1000
+        for name in names:
+            Path(tmp_dir, name).write_bytes(content)
+            Path(tmp_dir, f"{name}.gz").write_bytes(gzip.compress(content))
+
+        app = web.Application()
+        app.router.register_resource(CachingStaticResource("/static", tmp_dir))
+        server = TestServer(app)
+        await server.start_server()
+
+        async with ClientSession(auto_decompress=False) as session:
+
+            async def fetch(idx):
+                async with session.get(
+                    server.make_url(f"/static/{names[idx % len(names)]}"),
+                    headers={hdrs.ACCEPT_ENCODING: "gzip, deflate, br"},
+                ) as resp:
+                    await resp.read()
+
+            start = timer()
+            for batch in range(100):
+                await asyncio.gather(*(fetch(batch * 100 + idx) for idx in range(100)))
+            runtime = timer() - start
+
+        await server.close()
+
+    print(f"{10 ** 4 / runtime:.0f} requests/second")
+    return runtime
+
+
+@benchmark
+async def authenticated_requests(hass):
+    """Serve 10k requests authenticated with the access tokens of 100 users."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components.http.auth import setup_auth
+    from homeassistant.components.http.const import KEY_AUTHENTICATED
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        access_tokens = []
+        for idx in range(100):
+            user = await hass.auth.async_create_user(f"User {idx}")
+            refresh_token = await hass.auth.async_create_refresh_token(
+                user, "http://localhost:8123/"
+            )
+            access_tokens.append(hass.auth.async_create_access_token(refresh_token))
+
+        async def handler(request):
+            return web.Response(status=200 if request[KEY_AUTHENTICATED] else 401)
+
+        app = web.Application()
+        app.router.add_get("/api/", handler)
+        setup_auth(hass, app)
+        server = TestServer(app)
+        await server.start_server()
+
+        async with ClientSession() as session:
+
+            async def fetch(idx):
+                token = access_tokens[idx % len(access_tokens)]
+                async with session.get(
+                    server.make_url("/api/"),
+                    headers={hdrs.AUTHORIZATION: f"Bearer {token}"},
+                ) as resp:
+                    assert resp.status == 200
+
+            start = timer()
+            for batch in range(100):
+                await asyncio.gather(*(fetch(batch * 100 + idx) for idx in range(100)))
+            runtime = timer() - start
+
+        await server.close()
+
+    print(f"{10 ** 4 / runtime:.0f} requests/second")
+    return runtime
+
+
+@benchmark
+async def ingress_streaming(hass):
+    """Proxy 1 GiB of uploads and downloads to a local add-on through ingress."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.hassio.ingress import HassIOIngress
+    from homeassistant.components.http.const import KEY_HASS
+
+    chunk = b"x" * 2 ** 20
+
+    async def upload(request):
+        size = 0
+        async for data in request.content.iter_any():
+            size += len(data)
+        return web.Response(text=str(size))
+
+    async def download(request):
+        response = web.StreamResponse()
+        response.content_length = 64 * len(chunk)
+        await response.prepare(request)
+        for _ in range(64):
+            await response.write(chunk)
+        return response
+
+    addon_app = web.Application()
+    addon_app.router.add_post("/ingress/{token}/upload", upload)
+    addon_app.router.add_get("/ingress/{token}/download", download)
+    addon_server = TestServer(addon_app)
+    await addon_server.start_server()
+
+    async with ClientSession() as session:
+        app = web.Application()
+        app[KEY_HASS] = hass
+        ingress = HassIOIngress(f"127.0.0.1:{addon_server.port}", session)
+        ingress.register(app, app.router)
+        server = TestServer(app)
+        await server.start_server()
+
+        async def body():
+            for _ in range(64):
+                yield chunk
+
+        headers = {hdrs.HOST: "homeassistant.local"}
+
+        start = timer()
+        for _ in range(8):
+            async with session.post(
+                server.make_url("/api/hassio_ingress/token/upload"),
+                data=body(),
+                headers=headers,
+            ) as resp:
+                assert await resp.text() == str(64 * len(chunk))
+            async with session.get(
+                server.make_url("/api/hassio_ingress/token/download"), headers=headers
+            ) as resp:
+                size = 0
+                async for data in resp.content.iter_any():
+                    size += len(data)
+                assert size == 64 * len(chunk)
+        runtime = timer() - start
+
+        await server.close()
+    await addon_server.close()
+
+    print(f"{2 * 8 * 64 / runtime:.0f} MiB/second")
+    return runtime
+
+
+@benchmark
+async def system_log_storm(hass):
+    """Capture 100k errors logged from five places with events enabled."""
+    # pylint: disable=import-outside-toplevel
+    import sys
+
+    from homeassistant.components.system_log import LogErrorHandler
+
+    hass.config.config_dir = tempfile.gettempdir()
+    logger = logging.getLogger("benchmark.flaky")
+    handler = LogErrorHandler(hass, 50, True)
+    count = 0
+
+    @core.callback
+    def listener(_):
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen("system_log_event", listener)
+
+    try:
+        raise ValueError("flaky")
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    records = [
+        logger.makeRecord(
+            logger.name,
+            logging.ERROR,
+            __file__,
+            lineno,
+            "Error updating %s",
+            (lineno,),
+            exc_info if lineno % 2 else None,
+        )
+        for lineno in range(5)
+    ]
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        handler.emit(records[idx % 5])
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def mobile_app_sensor_updates(hass):
+    """Handle 2k encrypted webhooks updating 30 sensors of one of 40 phones."""
+    # pylint: disable=import-outside-toplevel
+    from nacl.encoding import Base64Encoder
+    from nacl.secret import SecretBox
+
+    from homeassistant.components.mobile_app import const as mobile_app
+    from homeassistant.components.mobile_app.sensor import MobileAppSensor
+    from homeassistant.components.mobile_app.webhook import handle_webhook
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.storage import Store
+
+    class MockRequest:
+        def __init__(self, data):
+            self.data = data
+
+        async def json(self):
+            return self.data
+
+    hass.config.config_dir = tempfile.gettempdir()
+    data = hass.data[mobile_app.DOMAIN] = {
+        mobile_app.DATA_BINARY_SENSOR: {},
+        mobile_app.DATA_CONFIG_ENTRIES: {},
+        mobile_app.DATA_DELETED_IDS: [],
+        mobile_app.DATA_DEVICES: {},
+        mobile_app.DATA_SENSOR: {},
+        mobile_app.DATA_STORE: Store(hass, 1, "benchmark.mobile_app"),
+    }
+
+    requests = []
+    for phone in range(40):
+        webhook_id = f"webhook_{phone}"
+        secret = f"{phone:032}"
+        entry = ConfigEntry(
+            1,
+            mobile_app.DOMAIN,
+            f"Phone {phone}",
+            {
+                mobile_app.ATTR_APP_ID: "benchmark",
+                mobile_app.ATTR_DEVICE_ID: f"device_{phone}",
+                mobile_app.ATTR_DEVICE_NAME: f"Phone {phone}",
+                mobile_app.ATTR_MANUFACTURER: "benchmark",
+                mobile_app.ATTR_MODEL: "benchmark",
+                mobile_app.ATTR_OS_VERSION: "1.0",
+                mobile_app.ATTR_SUPPORTS_ENCRYPTION: True,
+                mobile_app.CONF_SECRET: secret,
+                "webhook_id": webhook_id,
+            },
+            "user",
+            "local_push",
+            {},
+        )
+        data[mobile_app.DATA_CONFIG_ENTRIES][webhook_id] = entry
+
+        for idx in range(30):
+            config = {
+                mobile_app.ATTR_SENSOR_ATTRIBUTES: {},
+                mobile_app.ATTR_SENSOR_ICON: "mdi:cellphone",
+                mobile_app.ATTR_SENSOR_NAME: f"Sensor {idx}",
+                mobile_app.ATTR_SENSOR_STATE: None,
+                mobile_app.ATTR_SENSOR_TYPE: "sensor",
+                mobile_app.ATTR_SENSOR_UNIQUE_ID: f"sensor_{idx}",
+                "webhook_id": webhook_id,
+            }
+            data[mobile_app.DATA_SENSOR][f"{webhook_id}_sensor_{idx}"] = config
+            entity = MobileAppSensor(config, None, entry)
+            entity.hass = hass
+            entity.entity_id = f"sensor.phone_{phone}_sensor_{idx}"
+            await entity.async_added_to_hass()
+            entity.async_write_ha_state()
+
+        # Alternate between two payloads, so every update changes the states
+        box = SecretBox(secret.encode())
+        for state in range(2):
+            payload = json.dumps(
+                [
+                    {
+                        mobile_app.ATTR_SENSOR_STATE: state,
+                        mobile_app.ATTR_SENSOR_TYPE: "sensor",
+                        mobile_app.ATTR_SENSOR_UNIQUE_ID: f"sensor_{idx}",
+                    }
+                    for idx in range(30)
+                ]
+            )
+            requests.append(
+                (
+                    webhook_id,
+                    {
+                        "type": "update_sensor_states",
+                        "encrypted": True,
+                        "encrypted_data": box.encrypt(
+                            payload.encode(), encoder=Base64Encoder
+                        ).decode(),
+                    },
+                )
+            )
+
+    start = timer()
+
+    for idx in range(2000):
+        webhook_id, request = requests[(idx % 40) * 2 + (idx // 40) % 2]
+        await handle_webhook(hass, webhook_id, MockRequest(request))
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def emulated_hue_lights_poll(hass):
+    """Poll the lights of an emulated Hue bridge exposing 300 lights 5k times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.emulated_hue import Config
+    from homeassistant.components.emulated_hue.hue_api import HueAllLightsStateView
+
+    class MockRequest:
+        remote = "127.0.0.1"
+        app = {"hass": hass}
+
+    attributes = {
+        "brightness": 128,
+        "hs_color": (30, 50),
+        "color_temp": 300,
+        "supported_features": 19,
+    }
+    for idx in range(300):
+        hass.states.async_set(f"light.light_{idx}", "on", attributes)
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.sensor_{idx}", idx)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        view = HueAllLightsStateView(
+            Config(hass, {"host_ip": "127.0.0.1", "expose_by_default": True})
+        )
+        view.get(MockRequest(), "nouser")
+
+        start = timer()
+
+        for idx in range(5000):
+            # A few lights change between two polls
+            hass.states.async_set(
+                f"light.light_{idx % 300}", "off" if idx % 2 else "on", attributes
+            )
+            view.get(MockRequest(), "nouser")
+
+        return timer() - start
+
+
+@benchmark
+async def alexa_change_reports(hass):
+    """Report 3 changes of 1000 lights to a local stand-in Alexa gateway."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.alexa import config, state_report
+
+    requests = 0
+
+    async def gateway(request):
+        """Accept a ChangeReport after a round-trip delay."""
+        nonlocal requests
+        requests += 1
+        await request.json()
+        await asyncio.sleep(0.005)
+        return web.Response(status=202)
+
+    app = web.Application()
+    app.router.add_post("/v3/events", gateway)
+    server = TestServer(app)
+    await server.start_server()
+
+    class BenchmarkConfig(config.AbstractConfig):
+        """Alexa config reporting to the local gateway."""
+
+        endpoint = str(server.make_url("/v3/events"))
+        locale = "en-US"
+        supports_auth = True
+
+        def user_identifier(self):
+            """Return the user."""
+            return "benchmark"
+
+        def should_expose(self, entity_id):
+            """Expose all entities."""
+            return True
+
+        async def async_get_access_token(self):
+            """Return an access token."""
+            return "token"
+
+    entity_ids = [f"light.kitchen_{idx}" for idx in range(1000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+
+    hass.state = core.CoreState.running
+    unsub = await state_report.async_enable_proactive_mode(hass, BenchmarkConfig(hass))
+
+    start = timer()
+    for state in ("on", "off", "on"):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, state)
+    await hass.async_block_till_done()
+    await asyncio.sleep(state_report.CHANGE_REPORT_DELAY)
+    await hass.async_block_till_done()
+    # The time spent waiting for more changes is not part of the work
+    runtime = timer() - start - state_report.CHANGE_REPORT_DELAY
+
+    unsub()
+    await server.close()
+
+    print(f"{requests} requests for 3000 state changes")
+    return runtime
+
+
+@benchmark
+async def prometheus_event_metrics(hass):
+    """Update Prometheus metrics on 3 changes of 10k sensors, then scrape."""
+    return await _prometheus_metrics(hass, False)
+
+
+@benchmark
+async def prometheus_scrape_metrics(hass):
+    """Compute Prometheus metrics of 10k sensors changed 3 times on scrape."""
+    return await _prometheus_metrics(hass, True)
+
+
+async def _prometheus_metrics(hass, scrape):
+    """Time state changes and a scrape with either Prometheus collector."""
+    # pylint: disable=import-outside-toplevel
+    from functools import partial
+    from types import SimpleNamespace
+
+    import prometheus_client
+
+    from homeassistant.components import prometheus
+    from homeassistant.helpers.entity_values import EntityValues
+    from homeassistant.helpers.entityfilter import generate_filter
+
+    registry = prometheus_client.CollectorRegistry()
+    args = (
+        generate_filter([], [], [], []),
+        None,
+        "°C",
+        EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+    if scrape:
+        collector = prometheus.PrometheusCollector(hass, *args)
+        registry.register(collector)
+        listener = collector.async_count_change
+    else:
+        metrics = prometheus.PrometheusMetrics(
+            SimpleNamespace(
+                Counter=partial(prometheus_client.Counter, registry=registry),
+                Gauge=partial(prometheus_client.Gauge, registry=registry),
+            ),
+            *args,
+        )
+        # Runs in the executor, as it does for the component
+        listener = metrics.handle_event
+
+    entity_ids = [f"sensor.power_{idx}" for idx in range(10000)]
+    attributes = {"unit_of_measurement": "W", "battery_level": 90}
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+
+    start = timer()
+    for value in range(3):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, value, attributes)
+    await hass.async_block_till_done()
+    events_done = timer()
+    prometheus_client.generate_latest(registry)
+    end = timer()
+
+    print(
+        f"State changes took {events_done - start:.3f}s, "
+        f"the scrape took {end - events_done:.3f}s"
+    )
+    return end - start
+
+
+@benchmark
+async def camera_proxy_tokens(hass):
+    """Sign an hour of tokens for 100 cameras and proxy 10k images."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.camera import (
+        TOKEN_VALIDITY,
+        Camera,
+        CameraImageView,
+    )
+    from homeassistant.components.http import KEY_AUTHENTICATED
+    from homeassistant.components.http.auth import async_sign_entity_token
+
+    class MockCamera(Camera):
+        async def async_camera_image(self):
+            return b"image"
+
+    class MockComponent:
+        def __init__(self, entities):
+            self.entities = entities
+
+        def get_entity(self, entity_id):
+            return cameras.get(entity_id)
+
+    class MockRequest(dict):
+        app = {"hass": hass}
+
+        def __init__(self, token):
+            super().__init__({KEY_AUTHENTICATED: False})
+            self.query = {"token": token}
+
+    cameras = {}
+    for idx in range(100):
+        camera = MockCamera()
+        camera.hass = hass
+        camera.entity_id = f"camera.camera_{idx}"
+        camera.async_write_ha_state()
+        cameras[camera.entity_id] = camera
+
+    count = 0
+
+    @core.callback
+    def listener(_):
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    view = CameraImageView(MockComponent(list(cameras.values())))
+
+    start = timer()
+
+    # Tokens are requested by the clients, one per camera every 5 minutes
+    requests = []
+    for _ in range(12):
+        requests = [
+            (
+                MockRequest(async_sign_entity_token(hass, entity_id, TOKEN_VALIDITY)),
+                entity_id,
+            )
+            for entity_id in cameras
+        ]
+    await hass.async_block_till_done()
+    tokens_done = timer()
+
+    for idx in range(10 ** 4):
+        await view.get(*requests[idx % 100])
+
+    end = timer()
+
+    print(
+        f"{count} state changes for an hour of tokens, "
+        f"{10 ** 4 / (end - tokens_done):.0f} requests/second"
+    )
+    return end - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -1,9 +1,13 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+from collections import deque
+import contextlib
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import Any, Awaitable, Callable, Deque, Dict, Generator, Optional, Set
+
+import attr
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,10 +24,140 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+# Maximum number of spans kept by the setup timeline
+MAX_TIMELINE_SPANS = 5000
+
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_IMPORT = "import"
+PHASE_CONFIG = "config"
+PHASE_SETUP = "setup"
+PHASE_CONFIG_ENTRIES = "config_entries"
+
+
+@attr.s(slots=True, frozen=True)
+class TimelineSpan:
+    """A timed phase of setting up an integration.
+
+    Times are in seconds relative to the start of the timeline.
+    """
+
+    domain: str = attr.ib()
+    phase: str = attr.ib()
+    start: float = attr.ib()
+    end: float = attr.ib()
+    executor_queue: int = attr.ib()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the span."""
+        return {
+            "domain": self.domain,
+            "phase": self.phase,
+            "start": round(self.start, 6),
+            "end": round(self.end, 6),
+            "duration": round(self.end - self.start, 6),
+            "executor_queue": self.executor_queue,
+        }
+
+
+class SetupTimeline:
+    """Record the phases of setting up integrations."""
+
+    def __init__(self) -> None:
+        """Initialize the timeline."""
+        self.started = timer()
+        self.spans: Deque[TimelineSpan] = deque(maxlen=MAX_TIMELINE_SPANS)
+
+    @contextlib.contextmanager
+    def async_phase(
+        self, hass: core.HomeAssistant, domain: str, phase: str
+    ) -> Generator[None, None, None]:
+        """Time a phase of the setup of domain."""
+        executor_queue = _executor_queue_size(hass)
+        start = timer()
+        try:
+            yield
+        finally:
+            self.spans.append(
+                TimelineSpan(
+                    domain,
+                    phase,
+                    start - self.started,
+                    timer() - self.started,
+                    executor_queue,
+                )
+            )
+
+    def as_list(self) -> list:
+        """Return all recorded spans as dictionaries."""
+        return [span.as_dict() for span in self.spans]
+
+    def as_chrome_trace(self) -> Dict[str, Any]:
+        """Return the timeline in the Chrome trace event format.
+
+        Every integration gets its own row so the critical path can be
+        followed in chrome://tracing or Perfetto.
+        """
+        threads: Dict[str, int] = {}
+        events = []
+        for span in self.spans:
+            tid = threads.setdefault(span.domain, len(threads) + 1)
+            events.append(
+                {
+                    "name": span.phase,
+                    "cat": "setup",
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": int(span.start * 1_000_000),
+                    "dur": int((span.end - span.start) * 1_000_000),
+                    "args": {"domain": span.domain},
+                }
+            )
+            events.append(
+                {
+                    "name": "executor_queue",
+                    "ph": "C",
+                    "pid": 1,
+                    "ts": int(span.start * 1_000_000),
+                    "args": {"queued": span.executor_queue},
+                }
+            )
+        for domain, tid in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": domain},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _executor_queue_size(hass: core.HomeAssistant) -> int:
+    """Return the number of jobs waiting for a thread in the default executor."""
+    executor = getattr(hass.loop, "_default_executor", None)
+    work_queue = getattr(executor, "_work_queue", None)
+    if work_queue is None:
+        return 0
+    return work_queue.qsize()  # type: ignore
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> SetupTimeline:
+    """Return the setup timeline, creating it if needed."""
+    timeline: Optional[SetupTimeline] = hass.data.get(DATA_SETUP_TIMELINE)
+    if timeline is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = SetupTimeline()
+    return timeline
+
 
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str]) -> None:
@@ -105,10 +239,12 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    timeline = async_get_setup_timeline(hass)
+    with timeline.async_phase(hass, integration.domain, PHASE_DEPENDENCIES):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -160,10 +296,13 @@ async def _async_setup_component(
         log_error(str(err), integration.documentation)
         return False
 
+    timeline = async_get_setup_timeline(hass)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with timeline.async_phase(hass, domain, PHASE_IMPORT):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -171,9 +310,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with timeline.async_phase(hass, domain, PHASE_CONFIG):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -209,8 +349,9 @@ async def _async_setup_component(
             hass.data[DATA_SETUP_STARTED].pop(domain)
             return False
 
-        async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-            result = await task
+        with timeline.async_phase(hass, domain, PHASE_SETUP):
+            async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                result = await task
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -247,12 +388,12 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    entries = hass.config_entries.async_entries(domain)
+    if entries:
+        with timeline.async_phase(hass, domain, PHASE_CONFIG_ENTRIES):
+            await asyncio.gather(
+                *[entry.async_setup(hass, integration=integration) for entry in entries]
+            )
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -339,10 +480,12 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        timeline = async_get_setup_timeline(hass)
+        with timeline.async_phase(hass, integration.domain, PHASE_REQUIREMENTS):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -0,0 +1,172 @@
+"""Sliding window of numeric samples with incremental statistics."""
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+import math
+from typing import Deque, List, Optional, Tuple
+
+
+class SampleWindow:
+    """Last maxlen numeric samples and their timestamps.
+
+    Values and timestamps are kept in fixed size ring buffers of doubles.
+    The sum of the values and of their squares are kept as exact integers
+    scaled by a power of two and updated on every append and removal, so mean
+    and variance match the statistics module without rounding errors building
+    up. Min and max are tracked with monotonic
+    queues and the median with a sorted copy of the values, so none of the
+    statistics iterate the window.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the window."""
+        if maxlen < 1:
+            raise ValueError("maxlen must be at least 1")
+        self.maxlen = maxlen
+        self._values = array("d", bytes(8 * maxlen))
+        self._timestamps = array("d", bytes(8 * maxlen))
+        # Sequence number of the oldest sample and the next one appended
+        self._first = 0
+        self._next = 0
+        # Sums of the values and their squares times 2**shift and 2**(2*shift)
+        self._shift = 0
+        self._total = 0
+        self._squares = 0
+        self._sorted: List[float] = []
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return self._next - self._first
+
+    def __bool__(self) -> bool:
+        """Return if the window holds samples."""
+        return self._next != self._first
+
+    def append(self, value: float, timestamp: float = 0.0) -> None:
+        """Add a sample, removing the oldest one if the window is full."""
+        if not math.isfinite(value):
+            raise ValueError(f"Sample {value} is not a finite number")
+        if len(self) == self.maxlen:
+            self.popleft()
+
+        seq = self._next
+        self._next += 1
+        self._values[seq % self.maxlen] = value
+        self._timestamps[seq % self.maxlen] = timestamp
+
+        scaled = self._scale(value)
+        self._total += scaled
+        self._squares += scaled * scaled
+
+        insort(self._sorted, value)
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+    def popleft(self) -> Tuple[float, float]:
+        """Remove the oldest sample and return its value and timestamp."""
+        if not self:
+            raise IndexError("pop from an empty window")
+
+        seq = self._first
+        self._first += 1
+        value = self._values[seq % self.maxlen]
+        timestamp = self._timestamps[seq % self.maxlen]
+
+        scaled = self._scale(value)
+        self._total -= scaled
+        self._squares -= scaled * scaled
+
+        del self._sorted[bisect_left(self._sorted, value)]
+        if self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max[0][0] == seq:
+            self._max.popleft()
+
+        return value, timestamp
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._first = self._next
+        self._shift = self._total = self._squares = 0
+        self._sorted.clear()
+        self._min.clear()
+        self._max.clear()
+
+    def _scale(self, value: float) -> int:
+        """Return value times 2**shift, raising shift if needed."""
+        numerator, denominator = float(value).as_integer_ratio()
+        exponent = denominator.bit_length() - 1
+        if exponent > self._shift:
+            self._total <<= exponent - self._shift
+            self._squares <<= 2 * (exponent - self._shift)
+            self._shift = exponent
+        return numerator << (self._shift - exponent)
+
+    @property
+    def first(self) -> Tuple[float, float]:
+        """Return the value and timestamp of the oldest sample."""
+        if not self:
+            raise IndexError("window is empty")
+        idx = self._first % self.maxlen
+        return self._values[idx], self._timestamps[idx]
+
+    @property
+    def last(self) -> Tuple[float, float]:
+        """Return the value and timestamp of the newest sample."""
+        if not self:
+            raise IndexError("window is empty")
+        idx = (self._next - 1) % self.maxlen
+        return self._values[idx], self._timestamps[idx]
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the values."""
+        return self._total / (1 << self._shift)
+
+    def mean(self) -> Optional[float]:
+        """Return the mean, None if the window is empty."""
+        if not self:
+            return None
+        return self._total / (len(self) << self._shift)
+
+    def variance(self) -> Optional[float]:
+        """Return the sample variance, None for less than two samples."""
+        count = len(self)
+        if count < 2:
+            return None
+        # Integer division rounds correctly, exactly like the statistics module
+        return (count * self._squares - self._total * self._total) / (
+            count * (count - 1) << 2 * self._shift
+        )
+
+    def stdev(self) -> Optional[float]:
+        """Return the sample standard deviation, None for less than two samples."""
+        variance = self.variance()
+        if variance is None:
+            return None
+        return math.sqrt(variance)
+
+    def median(self) -> Optional[float]:
+        """Return the median, None if the window is empty."""
+        values = self._sorted
+        count = len(values)
+        if not count:
+            return None
+        middle = count // 2
+        if count % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def min(self) -> Optional[float]:
+        """Return the smallest value, None if the window is empty."""
+        return self._min[0][1] if self._min else None
+
+    def max(self) -> Optional[float]:
+        """Return the largest value, None if the window is empty."""
+        return self._max[0][1] if self._max else None
@@ -1,5 +1,6 @@
 """Tests for the Home Assistant auth module."""
 from datetime import timedelta
+import time
 from unittest.mock import Mock, patch
 
 import jwt
@@ -530,6 +531,36 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validated_access_token_cache(mock_hass):
+    """Test validated access tokens are not decoded again until revoked."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+        await manager.async_deactivate_user(user)
+        assert await manager.async_validate_access_token(access_token) is None
+        await manager.async_activate_user(user)
+
+    assert not mock_decode.called
+
+    # Expired tokens are validated again
+    with patch("homeassistant.auth.time.time", return_value=time.time() + 3600), patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is None
+
+    assert mock_decode.called
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -1,11 +1,27 @@
 """Test report state."""
+import asyncio
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant import core
 from homeassistant.components.alexa import state_report
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.common import async_fire_time_changed
+from tests.test_util.aiohttp import AiohttpClientMockResponse
+
+
+async def async_send_change_reports(hass):
+    """Wait for the queued ChangeReports to be sent."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.CHANGE_REPORT_DELAY)
+    )
+    await hass.async_block_till_done()
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -26,7 +42,7 @@ async def test_report_state(hass, aioclient_mock):
     )
 
     # To trigger event listener
-    await hass.async_block_till_done()
+    await async_send_change_reports(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -72,7 +88,7 @@ async def test_report_state_instance(hass, aioclient_mock):
     )
 
     # To trigger event listener
-    await hass.async_block_till_done()
+    await async_send_change_reports(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -238,3 +254,182 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
     await hass.async_block_till_done()
     await hass.async_block_till_done()
     assert len(aioclient_mock.mock_calls) == 0
+
+
+async def test_report_state_exposed_updated(hass, aioclient_mock):
+    """Test only the state changes of exposed entities are listened to."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    exposed = {"binary_sensor.test_contact"}
+
+    for entity_id in ("binary_sensor.test_contact", "binary_sensor.test_window"):
+        hass.states.async_set(
+            entity_id,
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+
+    with patch.object(
+        DEFAULT_CONFIG,
+        "should_expose",
+        side_effect=lambda entity_id: entity_id in exposed,
+    ) as mock_expose:
+        unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+        mock_expose.reset_mock()
+
+        hass.states.async_set(
+            "binary_sensor.test_window",
+            "off",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await async_send_change_reports(hass)
+        assert len(mock_expose.mock_calls) == 0
+        assert len(aioclient_mock.mock_calls) == 0
+
+        exposed.add("binary_sensor.test_window")
+        async_dispatcher_send(hass, state_report.SIGNAL_ALEXA_EXPOSED_UPDATED)
+
+        hass.states.async_set(
+            "binary_sensor.test_window",
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await async_send_change_reports(hass)
+        assert len(aioclient_mock.mock_calls) == 1
+
+        # An entity added later is listened to when exposed
+        exposed.add("binary_sensor.test_door")
+        hass.states.async_set(
+            "binary_sensor.test_door",
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await async_send_change_reports(hass)
+        hass.states.async_set(
+            "binary_sensor.test_door",
+            "off",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await async_send_change_reports(hass)
+        assert len(aioclient_mock.mock_calls) == 3
+
+        unsub()
+        hass.states.async_set(
+            "binary_sensor.test_door",
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await async_send_change_reports(hass)
+        assert len(aioclient_mock.mock_calls) == 3
+
+
+async def test_report_state_latest_change(hass, aioclient_mock):
+    """Test only the latest state of an entity in the window is reported."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    for state in ("off", "on", "off"):
+        hass.states.async_set(
+            "binary_sensor.test_contact",
+            state,
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+        await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 0
+
+    await async_send_change_reports(hass)
+
+    assert len(aioclient_mock.mock_calls) == 1
+    call_json = aioclient_mock.mock_calls[0][2]
+    assert (
+        call_json["event"]["payload"]["change"]["properties"][0]["value"]
+        == "NOT_DETECTED"
+    )
+
+
+async def test_report_state_parallel(hass, aioclient_mock):
+    """Test ChangeReports are sent concurrently with bounded parallelism."""
+    active = 0
+    max_active = 0
+
+    async def gateway(method, url, data):
+        """Accept a report after a while."""
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return AiohttpClientMockResponse(method, url, status=202, text="")
+
+    aioclient_mock.post(TEST_URL, side_effect=gateway)
+
+    for index in range(12):
+        hass.states.async_set(
+            f"binary_sensor.test_contact_{index}",
+            "on",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    for index in range(12):
+        hass.states.async_set(
+            f"binary_sensor.test_contact_{index}",
+            "off",
+            {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+        )
+
+    await async_send_change_reports(hass)
+
+    assert len(aioclient_mock.mock_calls) == 12
+    assert max_active == state_report.MAX_PARALLEL_REPORTS
+
+
+async def test_report_state_retry_invalid_token(hass, aioclient_mock):
+    """Test a ChangeReport is sent again with a new token."""
+    responses = [
+        {
+            "status": 401,
+            "json": {
+                "payload": {
+                    "code": "INVALID_ACCESS_TOKEN_EXCEPTION",
+                    "description": "Token expired",
+                }
+            },
+        },
+        {"status": 202, "text": ""},
+    ]
+
+    async def gateway(method, url, data):
+        """Reject the first report."""
+        return AiohttpClientMockResponse(method, url, **responses.pop(0))
+
+    aioclient_mock.post(TEST_URL, side_effect=gateway)
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "on",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set(
+        "binary_sensor.test_contact",
+        "off",
+        {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+    )
+
+    with patch.object(DEFAULT_CONFIG, "async_invalidate_access_token") as mock_inv:
+        await async_send_change_reports(hass)
+
+    assert len(aioclient_mock.mock_calls) == 2
+    assert len(mock_inv.mock_calls) == 1
+    assert responses == []
@@ -10,7 +10,7 @@ from tests.components.august.mocks import (
 )
 
 
-async def test_create_doorbell(hass, aiohttp_client):
+async def test_create_doorbell(hass, hass_client):
     """Test creation of a doorbell."""
     doorbell_one = await _mock_doorbell_from_fixture(hass, "get_doorbell.json")
 
@@ -28,7 +28,7 @@ async def test_create_doorbell(hass, aiohttp_client):
             "entity_picture"
         ]
 
-        client = await aiohttp_client(hass.http.app)
+        client = await hass_client()
         resp = await client.get(url)
         assert resp.status == 200
         body = await resp.text()
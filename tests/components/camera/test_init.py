@@ -1,6 +1,7 @@
 """The tests for the camera component."""
 import asyncio
 import base64
+from datetime import timedelta
 import io
 from unittest.mock import Mock, PropertyMock, mock_open, patch
 
@@ -9,12 +10,15 @@ import pytest
 from homeassistant.components import camera
 from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
 from homeassistant.components.camera.prefs import CameraEntityPreferences
+from homeassistant.components.http.auth import async_sign_entity_token
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import ATTR_ENTITY_ID, EVENT_HOMEASSISTANT_START
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
+from tests.common import async_fire_time_changed
 from tests.components.camera import common
 
 
@@ -70,6 +74,45 @@ async def test_get_image_from_camera(hass, image_mock_url):
     assert image.content == b"Test"
 
 
+async def test_camera_proxy_signed_token(hass, aiohttp_client, mock_camera):
+    """Test the camera proxy accepts unexpired tokens signed for the camera."""
+    client = await aiohttp_client(hass.http.app)
+    url = "/api/camera_proxy/camera.demo_camera?token={}"
+
+    token = async_sign_entity_token(hass, "camera.demo_camera", timedelta(minutes=5))
+    resp = await client.get(url.format(token))
+    assert resp.status == 200
+    assert await resp.read() == b"Test"
+
+    for token in (
+        async_sign_entity_token(hass, "camera.other", timedelta(minutes=5)),
+        async_sign_entity_token(hass, "camera.demo_camera", timedelta(minutes=-5)),
+        f"{token}0",
+        "invalid",
+    ):
+        resp = await client.get(url.format(token))
+        assert resp.status == 401
+
+
+async def test_no_token_in_state(hass, aiohttp_client, mock_camera):
+    """Test the state of a camera holds no token and is not written for one."""
+    client = await aiohttp_client(hass.http.app)
+    state = hass.states.get("camera.demo_camera")
+    assert "access_token" not in state.attributes
+    assert state.attributes["entity_picture"] == "/api/camera_proxy/camera.demo_camera"
+
+    resp = await client.get(state.attributes["entity_picture"])
+    assert resp.status == 401
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=1))
+    await hass.async_block_till_done()
+    assert hass.states.get("camera.demo_camera") is state
+
+    resp = await client.get(camera.async_sign_image_url(hass, "camera.demo_camera"))
+    assert resp.status == 200
+    assert await resp.read() == b"Test"
+
+
 async def test_get_stream_source_from_camera(hass, mock_camera):
     """Fetch stream source from camera entity."""
 
@@ -152,6 +195,38 @@ async def test_websocket_camera_thumbnail(hass, hass_ws_client, mock_camera):
     assert msg["result"]["content"] == base64.b64encode(b"Test").decode("utf-8")
 
 
+async def test_websocket_access_token(
+    hass, hass_ws_client, aiohttp_client, mock_camera
+):
+    """Test camera/access_token websocket command."""
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {"id": 5, "type": "camera/access_token", "entity_id": "camera.demo_camera"}
+    )
+    msg = await client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+    token = msg["result"]["access_token"]
+    assert msg["result"]["url"] == f"/api/camera_proxy/camera.demo_camera?token={token}"
+
+    http_client = await aiohttp_client(hass.http.app)
+    resp = await http_client.get(msg["result"]["url"])
+    assert resp.status == 200
+    resp = await http_client.get(f"/api/camera_proxy/camera.demo_camera?token={token}0")
+    assert resp.status == 401
+
+    await client.send_json(
+        {"id": 6, "type": "camera/access_token", "entity_id": "camera.missing"}
+    )
+    msg = await client.receive_json()
+
+    assert msg["id"] == 6
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
 async def test_websocket_stream_no_source(
     hass, hass_ws_client, mock_camera, mock_stream
 ):
@@ -3,7 +3,7 @@ import asyncio
 from datetime import timedelta
 from ipaddress import ip_address
 import json
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from aiohttp.hdrs import CONTENT_TYPE
 import pytest
@@ -39,6 +39,7 @@ from homeassistant.components.emulated_hue.hue_api import (
 )
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
     CONTENT_TYPE_JSON,
     HTTP_NOT_FOUND,
     HTTP_OK,
@@ -48,7 +49,7 @@ from homeassistant.const import (
     STATE_OFF,
     STATE_ON,
 )
-from homeassistant.core import callback
+from homeassistant.core import State, callback
 import homeassistant.util.dt as dt_util
 
 from tests.common import async_fire_time_changed, get_test_instance_port
@@ -288,6 +289,59 @@ async def test_light_without_brightness_supported(hass_hue, hue_client):
     assert light_without_brightness_json["type"] == "On/Off light"
 
 
+def test_entity_to_json_cached():
+    """Test the Hue representation is reused until the entity changes."""
+    config = Config(None, {})
+    state = State("light.ceiling", STATE_ON, {ATTR_SUPPORTED_FEATURES: 0})
+
+    state_json = hue_api.entity_to_json(config, state)
+    assert state_json["state"][HUE_API_STATE_ON] is True
+    assert hue_api.entity_to_json(config, state) is state_json
+
+    new_state = State("light.ceiling", STATE_OFF, {ATTR_SUPPORTED_FEATURES: 0})
+    new_state_json = hue_api.entity_to_json(config, new_state)
+    assert new_state_json["state"][HUE_API_STATE_ON] is False
+    assert hue_api.entity_to_json(config, new_state) is new_state_json
+
+    # States just set through the API are not from the cache
+    config.cached_states["light.ceiling"] = [
+        {
+            hue_api.STATE_ON: True,
+            hue_api.STATE_BRIGHTNESS: None,
+            hue_api.STATE_HUE: None,
+            hue_api.STATE_SATURATION: None,
+            hue_api.STATE_COLOR_TEMP: None,
+        },
+        None,
+    ]
+    assert hue_api.entity_to_json(config, new_state)["state"][HUE_API_STATE_ON]
+
+
+def test_list_of_entities_cached():
+    """Test the cached lights follow their number and exposure."""
+    config = Config(None, {emulated_hue.CONF_EXPOSE_BY_DEFAULT: True})
+    config.numbers = {"1": "light.ceiling", "2": "light.desk"}
+    ceiling = State("light.ceiling", STATE_ON, {ATTR_SUPPORTED_FEATURES: 0})
+    desk = State("light.desk", STATE_ON, {ATTR_SUPPORTED_FEATURES: 0})
+    request = Mock(app={"hass": Mock()})
+    request.app["hass"].states.async_all.return_value = [ceiling, desk]
+
+    lights = json.loads(hue_api.create_list_of_entities(config, request))
+    assert set(lights) == {"1", "2"}
+    assert set(config.cached_json) == {"light.ceiling", "light.desk"}
+
+    # The serialized light is updated when the number of the entity changes
+    config.numbers = {"3": "light.ceiling", "2": "light.desk"}
+    lights = json.loads(hue_api.create_list_of_entities(config, request))
+    assert set(lights) == {"3", "2"}
+
+    # Entities no longer exposed are removed from the cache
+    request.app["hass"].states.async_all.return_value = [desk]
+    lights = json.loads(hue_api.create_list_of_entities(config, request))
+    assert set(lights) == {"2"}
+    assert set(config.cached_json) == {"light.desk"}
+
+
 async def test_lights_all_dimmable(hass, aiohttp_client):
     """Test CONF_LIGHTS_ALL_DIMMABLE."""
     # create a lamp without brightness support
@@ -50,6 +50,20 @@ async def test_setup_fail(hass):
         await hass.async_block_till_done()
 
 
+async def test_setup_invalid_window_size(hass):
+    """Test if a window size below one is rejected."""
+    config = {
+        "sensor": {
+            "platform": "filter",
+            "entity_id": "sensor.test_monitored",
+            "filters": [{"filter": "outlier", "window_size": 0}],
+        }
+    }
+    with assert_setup_component(0):
+        assert await async_setup_component(hass, "sensor", config)
+        await hass.async_block_till_done()
+
+
 async def test_chain(hass, values):
     """Test if filter chaining works."""
     config = {
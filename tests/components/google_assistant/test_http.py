@@ -2,7 +2,10 @@
 from datetime import datetime, timedelta, timezone
 from unittest.mock import ANY, patch
 
-from homeassistant.components.google_assistant import GOOGLE_ASSISTANT_SCHEMA
+from homeassistant.components.google_assistant import (
+    GOOGLE_ASSISTANT_SCHEMA,
+    report_state,
+)
 from homeassistant.components.google_assistant.const import (
     HOMEGRAPH_TOKEN_URL,
     REPORT_STATE_BASE_URL,
@@ -12,6 +15,9 @@ from homeassistant.components.google_assistant.http import (
     _get_homegraph_jwt,
     _get_homegraph_token,
 )
+from homeassistant.util.dt import utcnow
+
+from tests.common import async_fire_time_changed
 
 DUMMY_CONFIG = GOOGLE_ASSISTANT_SCHEMA(
     {
@@ -159,3 +165,38 @@ async def test_report_state(hass, aioclient_mock, hass_storage):
             REPORT_STATE_BASE_URL,
             {"requestId": ANY, "agentUserId": agent_user_id, "payload": message},
         )
+
+
+async def test_report_state_aggregated(
+    hass, aioclient_mock, hass_storage, legacy_patchable_time
+):
+    """Test state changes of several entities are sent in one request."""
+    config = GoogleConfig(hass, DUMMY_CONFIG)
+    await config.async_initialize()
+    await config.async_connect_agent_user("user")
+    aioclient_mock.post(REPORT_STATE_BASE_URL, status=200, json={})
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch(
+        "homeassistant.components.google_assistant.http._get_homegraph_token",
+        return_value=MOCK_TOKEN,
+    ), patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, config)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+        for index in range(10):
+            hass.states.async_set(f"light.bulb_{index}", "on")
+        await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+    # One request for the initial report and one for the changes
+    assert aioclient_mock.call_count == 2
+    payload = aioclient_mock.mock_calls[1][2]["payload"]
+    assert len(payload["devices"]["states"]) == 10
+    assert config.report_state_aggregator.reports == 2
+
+    unsub()
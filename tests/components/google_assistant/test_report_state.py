@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.google_assistant import error, report_state
@@ -40,6 +41,12 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -52,6 +59,10 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
 
@@ -64,6 +75,10 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -77,3 +92,56 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_aggregated(hass, legacy_patchable_time):
+    """Test state changes within the window are reported together."""
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    aggregator = BASIC_CONFIG.report_state_aggregator
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "MAX_REPORT_STATE_ENTITIES", 3):
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.ceiling", "off")
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(
+            hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+        )
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 1
+        assert mock_report.mock_calls[0][1][0] == {
+            "devices": {
+                "states": {
+                    "light.ceiling": {"on": False, "online": True},
+                    "light.kitchen": {"on": True, "online": True},
+                }
+            }
+        }
+
+        # Reaching the maximum size reports without waiting
+        for index in range(3):
+            hass.states.async_set(f"light.bulb_{index}", "on")
+        await hass.async_block_till_done()
+
+        assert len(mock_report.mock_calls) == 2
+        assert len(mock_report.mock_calls[1][1][0]["devices"]["states"]) == 3
+
+    assert aggregator.reports == 3
+    assert aggregator.states == 6
+    assert aggregator.merged == 1
+
+    unsub()
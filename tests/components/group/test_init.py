@@ -168,6 +168,60 @@ async def test_allgroup_turn_on_if_last_turns_on(hass):
     assert STATE_ON == group_state.state
 
 
+async def test_allgroup_follows_transitions(hass):
+    """Group with all: true, follow members turning on and off."""
+    entity_ids = [f"light.bulb_{idx}" for idx in range(10)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    test_group = await group.Group.async_create_group(
+        hass, "init_group", entity_ids, False, mode=True
+    )
+
+    for entity_id in entity_ids:
+        assert hass.states.get(test_group.entity_id).state == STATE_OFF
+        hass.states.async_set(entity_id, STATE_ON)
+        await hass.async_block_till_done()
+
+    assert hass.states.get(test_group.entity_id).state == STATE_ON
+
+    # Repeating a state does not count a member twice
+    hass.states.async_set(entity_ids[0], STATE_ON, {"brightness": 10})
+    hass.states.async_set(entity_ids[1], STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+
+    hass.states.async_set(entity_ids[1], STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get(test_group.entity_id).state == STATE_ON
+
+
+async def test_allgroup_member_removed(hass):
+    """Group with all: true, stop counting a member that is removed."""
+    hass.states.async_set("light.bowl", STATE_ON)
+    hass.states.async_set("light.ceiling", STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    test_group = await group.Group.async_create_group(
+        hass, "init_group", ["light.bowl", "light.ceiling"], False, mode=True
+    )
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+
+    with patch.object(test_group, "_reset_tracked_state") as mock_reset:
+        hass.states.async_remove("light.ceiling")
+        await hass.async_block_till_done()
+
+    assert not mock_reset.called
+    assert hass.states.get(test_group.entity_id).state == STATE_ON
+
+    hass.states.async_set("light.ceiling", STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get(test_group.entity_id).state == STATE_OFF
+
+
 async def test_expand_entity_ids(hass):
     """Test expand_entity_ids method."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -0,0 +1,36 @@
+"""The tests for the group utilities."""
+from homeassistant.components.group.util import StateCounter
+
+
+def test_state_counter():
+    """Test counting members per key."""
+    counter = StateCounter()
+    assert len(counter) == 0
+    assert not counter.any(True)
+    assert counter.all(True)
+
+    counter.set("light.one", True)
+    counter.set("light.two", False)
+    assert len(counter) == 2
+    assert counter.any(True)
+    assert not counter.all(True)
+    assert counter.count(False) == 1
+
+    counter.set("light.two", True)
+    counter.set("light.two", True)
+    assert counter.count(True) == 2
+    assert not counter.any(False)
+    assert counter.all(True)
+
+    assert counter.get("light.one") is True
+    assert counter.get("light.not_counted") is None
+    assert set(counter.keys()) == {True}
+
+    counter.remove("light.one")
+    counter.remove("light.not_counted")
+    assert len(counter) == 1
+    assert counter.count(True) == 1
+
+    counter.clear()
+    assert len(counter) == 0
+    assert not counter.any(True)
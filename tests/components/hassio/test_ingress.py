@@ -1,8 +1,19 @@
 """The tests for the hassio component."""
+from unittest.mock import patch
 
-from aiohttp.hdrs import X_FORWARDED_FOR, X_FORWARDED_HOST, X_FORWARDED_PROTO
+from aiohttp.hdrs import (
+    CONTENT_LENGTH,
+    X_FORWARDED_FOR,
+    X_FORWARDED_HOST,
+    X_FORWARDED_PROTO,
+)
+from aiohttp.streams import StreamReader
 import pytest
 
+from homeassistant.components.http import MAX_CLIENT_SIZE
+
+from tests.test_util.aiohttp import AiohttpClientMockResponse
+
 
 @pytest.mark.parametrize(
     "build_type",
@@ -238,6 +249,92 @@ async def test_ingress_request_options(hassio_client, build_type, aioclient_mock
     assert aioclient_mock.mock_calls[-1][3][X_FORWARDED_PROTO]
 
 
+async def test_ingress_request_stream(hassio_client, aioclient_mock):
+    """Test request and response bodies are streamed."""
+    content = b"x" * 2 ** 20
+    aioclient_mock.post(
+        "http://127.0.0.1/ingress/core/upload",
+        content=content,
+        headers={CONTENT_LENGTH: str(len(content))},
+    )
+
+    resp = await hassio_client.post("/api/hassio_ingress/core/upload", data=b"backup")
+
+    assert resp.status == 200
+    assert resp.headers[CONTENT_LENGTH] == str(len(content))
+    assert await resp.read() == content
+
+    assert len(aioclient_mock.mock_calls) == 1
+    assert aioclient_mock.mock_calls[-1][3][CONTENT_LENGTH] == "6"
+
+
+def _mock_upload(aioclient_mock, received):
+    """Mock an add-on reading the uploaded body into received."""
+
+    async def upload(method, url, data):
+        """Read the upload."""
+        if isinstance(data, StreamReader):
+            data = data.iter_any()
+        async for chunk in data:
+            received.append(chunk)
+        return AiohttpClientMockResponse(method, url, text="ok")
+
+    aioclient_mock.post("http://127.0.0.1/ingress/core/upload", side_effect=upload)
+
+
+async def test_ingress_request_large(hassio_client, aioclient_mock):
+    """Test request bodies larger than the http client limit are streamed."""
+    received = []
+    _mock_upload(aioclient_mock, received)
+    body = b"x" * (MAX_CLIENT_SIZE + 1)
+
+    resp = await hassio_client.post("/api/hassio_ingress/core/upload", data=body)
+
+    assert resp.status == 200
+    assert b"".join(received) == body
+    assert aioclient_mock.mock_calls[-1][3][CONTENT_LENGTH] == str(len(body))
+
+
+async def test_ingress_request_chunked(hassio_client, aioclient_mock):
+    """Test chunked request bodies are streamed."""
+    received = []
+    _mock_upload(aioclient_mock, received)
+
+    async def body():
+        for _ in range(4):
+            yield b"x" * (MAX_CLIENT_SIZE // 2)
+
+    resp = await hassio_client.post("/api/hassio_ingress/core/upload", data=body())
+
+    assert resp.status == 200
+    assert len(b"".join(received)) == MAX_CLIENT_SIZE * 2
+    assert CONTENT_LENGTH not in aioclient_mock.mock_calls[-1][3]
+
+
+async def test_ingress_request_too_large(hassio_client, aioclient_mock):
+    """Test request bodies above the size limit are not forwarded."""
+    received = []
+    _mock_upload(aioclient_mock, received)
+
+    with patch("homeassistant.components.hassio.ingress.MAX_REQUEST_BODY_SIZE", 4):
+        resp = await hassio_client.post(
+            "/api/hassio_ingress/core/upload", data=b"backup"
+        )
+
+    assert resp.status == 413
+    assert len(aioclient_mock.mock_calls) == 0
+
+    async def body():
+        for _ in range(4):
+            yield b"back"
+
+    with patch("homeassistant.components.hassio.ingress.MAX_REQUEST_BODY_SIZE", 6):
+        resp = await hassio_client.post("/api/hassio_ingress/core/upload", data=body())
+
+    assert resp.status == 413
+    assert len(b"".join(received)) <= 6
+
+
 @pytest.mark.parametrize(
     "build_type",
     [
@@ -9,7 +9,10 @@ import pytest
 import pytz
 
 from homeassistant import config as hass_config
-from homeassistant.components.history_stats import DOMAIN
+from homeassistant.components.history_stats import (
+    DOMAIN,
+    sensor as history_stats_sensor,
+)
 from homeassistant.components.history_stats.sensor import HistoryStatsSensor
 from homeassistant.const import SERVICE_RELOAD, STATE_UNKNOWN
 import homeassistant.core as ha
@@ -417,5 +420,123 @@ async def test_reload(hass):
     assert hass.states.get("sensor.second_test")
 
 
+async def test_measure_from_state_changes(hass):
+    """Test the window is loaded once and updated from state changes."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass
+    )  # force in memory db
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+    t2 = dt_util.utcnow() - timedelta(minutes=10)
+
+    # Start     t0        t1        t2        End
+    # |--20min--|--20min--|--10min--|--10min--|
+    # |---off---|---on----|---off---|---on----|
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ha.State("binary_sensor.test_id", "on", last_changed=t2),
+        ]
+    }
+    hass.states.async_set("binary_sensor.test_id", "on")
+
+    with patch(
+        "homeassistant.components.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.history.get_state", return_value=None
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "test",
+                    "state": "on",
+                    "type": "count",
+                    "start": "{{ as_timestamp(now()) - 3600 }}",
+                    "duration": "01:00",
+                },
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.test").state == "2"
+
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.test").state == "3"
+        assert mock_changes.call_count == 1
+
+
+async def test_state_changes_before_load(hass):
+    """Test changes before the window is loaded are kept, and folded later."""
+    await hass.async_add_executor_job(
+        init_recorder_component, hass
+    )  # force in memory db
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+    t1 = t0 + timedelta(minutes=20)
+    t2 = dt_util.utcnow() - timedelta(minutes=10)
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+            ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ha.State("binary_sensor.test_id", "on", last_changed=t2),
+        ]
+    }
+    hass.states.async_set("binary_sensor.test_id", "on")
+
+    with patch(
+        "homeassistant.components.history.state_changes_during_period",
+        return_value=fake_states,
+    ) as mock_changes, patch(
+        "homeassistant.components.history.get_state", return_value=None
+    ), patch.object(
+        history_stats_sensor, "MAX_KEPT_CHANGES", 3
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "history_stats",
+                    "entity_id": "binary_sensor.test_id",
+                    "name": "test",
+                    "state": "on",
+                    "type": "count",
+                    "start": "{{ 0 }}",
+                    "end": "{{ now() }}",
+                },
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.test").state == "2"
+
+        # A change before the window is loaded, that the database misses
+        sensor = hass.data["sensor"].get_entity("sensor.test")
+        sensor._history = None
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        assert mock_changes.call_count == 2
+
+        for state in ("on", "off", "on"):
+            hass.states.async_set("binary_sensor.test_id", state)
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.test").state == "4"
+        assert len(sensor._history[1]) <= 3
+        assert mock_changes.call_count == 2
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
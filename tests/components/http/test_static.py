@@ -0,0 +1,178 @@
+"""The tests for the static file handling of the HTTP component."""
+import gzip
+from pathlib import Path
+from unittest.mock import patch
+
+from aiohttp import hdrs, web
+import pytest
+
+from homeassistant.components.http.static import CachingStaticResource
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Return a directory with static files."""
+    (tmp_path / "app.js").write_text("console.log('hello')")
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(b"console.log('hello')"))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "style.css").write_text("body {}")
+    (tmp_path / "sub").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def client(loop, aiohttp_client, static_dir):
+    """Return a client for an app serving the static files."""
+    app = web.Application()
+    app.router.register_resource(CachingStaticResource("/static", str(static_dir)))
+    return loop.run_until_complete(aiohttp_client(app, auto_decompress=False))
+
+
+async def test_serve_file(client):
+    """Test serving a file without compression."""
+    resp = await client.get("/static/style.css", skip_auto_headers=["Accept-Encoding"])
+    assert resp.status == 200
+    assert await resp.text() == "body {}"
+    assert resp.headers[hdrs.CONTENT_TYPE] == "text/css"
+    assert resp.headers[hdrs.CACHE_CONTROL].startswith("public, max-age=")
+    assert hdrs.VARY not in resp.headers
+    assert hdrs.ETAG in resp.headers
+
+
+async def test_serve_precompressed(client):
+    """Test serving precompressed variants."""
+    resp = await client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.CONTENT_TYPE].endswith("/javascript")
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    br_etag = resp.headers[hdrs.ETAG]
+
+    resp = await client.get("/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert gzip.decompress(await resp.read()) == b"console.log('hello')"
+    assert resp.headers[hdrs.ETAG] != br_etag
+
+    resp = await client.get("/static/app.js", skip_auto_headers=["Accept-Encoding"])
+    assert resp.status == 200
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.text() == "console.log('hello')"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,encoding",
+    [
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0.5, br;q=0.0", "gzip"),
+        ("GZIP", "gzip"),
+        ("*", "br"),
+        ("*;q=1, br;q=0", "gzip"),
+        ("gzip;q=0, br;q=0", None),
+        ("identity", None),
+        ("gzipped", None),
+    ],
+)
+async def test_accept_encoding_quality(client, accept_encoding, encoding):
+    """Test content codings with a zero quality are not served."""
+    resp = await client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: accept_encoding}
+    )
+    assert resp.status == 200
+    assert resp.headers.get(hdrs.CONTENT_ENCODING) == encoding
+
+
+async def test_not_modified(client):
+    """Test a matching ETag results in a 304."""
+    resp = await client.get("/static/style.css")
+    etag = resp.headers[hdrs.ETAG]
+
+    resp = await client.get(
+        "/static/style.css", headers={hdrs.IF_NONE_MATCH: f'"other", {etag}'}
+    )
+    assert resp.status == 304
+    assert resp.headers[hdrs.ETAG] == etag
+
+    resp = await client.get("/static/style.css", headers={hdrs.IF_NONE_MATCH: '"a"'})
+    assert resp.status == 200
+
+    resp = await client.get(
+        "/static/style.css",
+        headers={hdrs.IF_MODIFIED_SINCE: resp.headers[hdrs.LAST_MODIFIED]},
+    )
+    assert resp.status == 304
+
+
+async def test_files_resolved_once(client, static_dir):
+    """Test files are only resolved on the first request."""
+    resp = await client.get("/static/style.css")
+    assert resp.status == 200
+    resp = await client.get("/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"})
+    assert resp.status == 200
+
+    with patch.object(
+        CachingStaticResource, "_resolve_file", side_effect=AssertionError
+    ), patch.object(Path, "is_file", side_effect=AssertionError):
+        resp = await client.get("/static/style.css")
+        assert resp.status == 200
+        assert await resp.text() == "body {}"
+        assert int(resp.headers[hdrs.CONTENT_LENGTH]) == len("body {}")
+        assert hdrs.LAST_MODIFIED in resp.headers
+
+        resp = await client.get(
+            "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+        )
+        assert resp.status == 200
+        assert gzip.decompress(await resp.read()) == b"console.log('hello')"
+
+
+async def test_file_changed(client, static_dir):
+    """Test a file changed after it was resolved is served as it is now."""
+    resp = await client.get("/static/style.css")
+    assert await resp.text() == "body {}"
+    etag = resp.headers[hdrs.ETAG]
+
+    (static_dir / "style.css").write_text("body { color: red; }")
+    resp = await client.get("/static/style.css", headers={hdrs.IF_NONE_MATCH: etag})
+    assert resp.status == 200
+    assert await resp.text() == "body { color: red; }"
+    assert resp.headers[hdrs.ETAG] != etag
+
+    (static_dir / "style.css").unlink()
+    resp = await client.get("/static/style.css")
+    assert resp.status == 404
+
+    (static_dir / "style.css").write_text("body {}")
+    resp = await client.get("/static/style.css")
+    assert resp.status == 200
+    assert await resp.text() == "body {}"
+
+
+async def test_range(client):
+    """Test a range of a file is served."""
+    resp = await client.get("/static/style.css", headers={hdrs.RANGE: "bytes=0-3"})
+    assert resp.status == 206
+    assert await resp.text() == "body"
+    assert resp.headers[hdrs.CONTENT_RANGE] == "bytes 0-3/7"
+
+
+async def test_head(client):
+    """Test a HEAD request has the headers of the file without its content."""
+    resp = await client.head("/static/style.css")
+    assert resp.status == 200
+    assert int(resp.headers[hdrs.CONTENT_LENGTH]) == len("body {}")
+    assert await resp.read() == b""
+
+
+async def test_not_found(client):
+    """Test missing files and paths outside the directory."""
+    resp = await client.get("/static/missing.js")
+    assert resp.status == 404
+
+    resp = await client.get("/static/../test_static.py")
+    assert resp.status == 404
+
+    resp = await client.get("/static/sub")
+    assert resp.status == 403
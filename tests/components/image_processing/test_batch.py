@@ -0,0 +1,86 @@
+"""The tests for the image processing batch queue."""
+import asyncio
+
+import pytest
+
+from homeassistant.components.image_processing.batch import InferenceQueue
+from homeassistant.setup import async_setup_component
+
+
+async def test_batch_by_delay(hass):
+    """Test images queued within the delay are processed at once."""
+    batches = []
+
+    def process_batch(images):
+        batches.append(list(images))
+        return [image * 2 for image in images]
+
+    queue = InferenceQueue(hass, "model", process_batch, batch_delay=0.01)
+    results = await asyncio.gather(*(queue.async_process(idx) for idx in range(3)))
+
+    assert results == [0, 2, 4]
+    assert batches == [[0, 1, 2]]
+
+    assert await queue.async_process(5) == 10
+    assert batches == [[0, 1, 2], [5]]
+
+    statistics = queue.async_statistics()
+    assert statistics["batches"] == 2
+    assert statistics["images"] == 4
+    assert statistics["mean_batch_size"] == 2.0
+    assert statistics["mean_queue_time"] > 0
+
+
+async def test_batch_by_size(hass):
+    """Test a full batch is processed without waiting for the delay."""
+    batches = []
+
+    def process_batch(images):
+        batches.append(list(images))
+        return images
+
+    queue = InferenceQueue(
+        hass, "model", process_batch, batch_delay=60, max_batch_size=2
+    )
+    results = await asyncio.wait_for(
+        asyncio.gather(*(queue.async_process(idx) for idx in range(4))), 5
+    )
+
+    assert results == [0, 1, 2, 3]
+    assert batches == [[0, 1], [2, 3]]
+
+
+async def test_batch_error(hass):
+    """Test an error processing a batch is raised for all its images."""
+
+    def process_batch(images):
+        raise ValueError
+
+    queue = InferenceQueue(hass, "model", process_batch, batch_delay=0.01)
+    results = await asyncio.gather(
+        queue.async_process(1), queue.async_process(2), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert queue.async_statistics()["batches"] == 0
+
+    with pytest.raises(ValueError):
+        await queue.async_process(3)
+
+
+async def test_websocket_inference_statistics(hass, hass_ws_client):
+    """Test the statistics of the queues are available over the websocket."""
+    assert await async_setup_component(hass, "image_processing", {})
+
+    queue = InferenceQueue(hass, "model", lambda images: images, batch_delay=0.01)
+    await asyncio.gather(*(queue.async_process(idx) for idx in range(2)))
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "image_processing/inference_statistics"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"] == [
+        {"name": "model", **queue.async_statistics()},
+    ]
+    assert msg["result"][0]["images"] == 2
@@ -0,0 +1,110 @@
+"""The tests for the media player image cache."""
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.components.media_player import image_cache
+from homeassistant.components.media_player.image_cache import async_get_image_cache
+from homeassistant.setup import async_setup_component
+
+URL = "http://example.com/image.jpg"
+
+
+async def test_fetch_once(hass, aioclient_mock):
+    """Test concurrent requests for an image share a fetch."""
+    aioclient_mock.get(
+        URL, content=b"image", headers={"Content-Type": "image/jpeg; charset=utf-8"}
+    )
+    cache = async_get_image_cache(hass)
+
+    results = await asyncio.gather(*(cache.async_get(URL) for _ in range(3)))
+    assert results == [(b"image", "image/jpeg")] * 3
+    assert await cache.async_get(URL) == (b"image", "image/jpeg")
+
+    assert aioclient_mock.call_count == 1
+    statistics = cache.async_statistics()
+    assert statistics["misses"] == 1
+    assert statistics["coalesced"] == 2
+    assert statistics["hits"] == 1
+    assert statistics["size"] == 5
+
+
+async def test_fetch_error_not_cached(hass, aioclient_mock):
+    """Test failed fetches are retried."""
+    aioclient_mock.get(URL, status=404)
+    cache = async_get_image_cache(hass)
+
+    assert await cache.async_get(URL) == (None, None)
+    assert await cache.async_get(URL) == (None, None)
+    assert aioclient_mock.call_count == 2
+
+
+async def test_evict_least_recently_used(hass, aioclient_mock):
+    """Test the least recently used images are evicted above the size limit."""
+    for name in ("one", "two", "three"):
+        aioclient_mock.get(f"http://example.com/{name}.jpg", content=b"x" * 10)
+    cache = async_get_image_cache(hass)
+    cache.max_size = 20
+
+    await cache.async_get("http://example.com/one.jpg")
+    await cache.async_get("http://example.com/two.jpg")
+    await cache.async_get("http://example.com/one.jpg")
+    await cache.async_get("http://example.com/three.jpg")
+    assert aioclient_mock.call_count == 3
+
+    await cache.async_get("http://example.com/one.jpg")
+    assert aioclient_mock.call_count == 3
+    await cache.async_get("http://example.com/two.jpg")
+    assert aioclient_mock.call_count == 4
+
+    statistics = cache.async_statistics()
+    assert statistics["images"] == 2
+    assert statistics["size"] == 20
+    assert statistics["evictions"] == 2
+
+
+async def test_revalidate(hass, aioclient_mock):
+    """Test images with validators are revalidated once stale."""
+    aioclient_mock.get(
+        URL,
+        content=b"image",
+        headers={"Content-Type": "image/jpeg", "Etag": '"v1"'},
+    )
+    cache = async_get_image_cache(hass)
+    assert await cache.async_get(URL) == (b"image", "image/jpeg")
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(URL, status=304)
+
+    with patch.object(image_cache, "REVALIDATE_AFTER", -1):
+        assert await cache.async_get(URL) == (b"image", "image/jpeg")
+
+    assert aioclient_mock.call_count == 1
+    assert aioclient_mock.mock_calls[0][3] == {"If-None-Match": '"v1"'}
+    assert cache.async_statistics()["revalidations"] == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        URL,
+        content=b"new image",
+        headers={"Content-Type": "image/png", "Etag": '"v2"'},
+    )
+
+    with patch.object(image_cache, "REVALIDATE_AFTER", -1):
+        assert await cache.async_get(URL) == (b"new image", "image/png")
+    assert await cache.async_get(URL) == (b"new image", "image/png")
+    assert aioclient_mock.call_count == 1
+
+
+async def test_websocket_statistics(hass, aioclient_mock, hass_ws_client):
+    """Test the statistics of the cache are available over the websocket."""
+    aioclient_mock.get(URL, content=b"image")
+    assert await async_setup_component(hass, "media_player", {})
+    await async_get_image_cache(hass).async_get(URL)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "media_player/image_cache_statistics"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert msg["result"]["misses"] == 1
+    assert msg["result"]["size"] == 5
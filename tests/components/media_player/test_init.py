@@ -1,10 +1,13 @@
 """Test the base functions of the media player."""
 import base64
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant.components import media_player
+from homeassistant.components.http.auth import async_sign_entity_token
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 
 async def test_get_image(hass, hass_ws_client, caplog):
@@ -63,6 +66,39 @@ async def test_get_image_http(hass, aiohttp_client):
     assert content == b"image"
 
 
+async def test_get_image_http_signed_token(hass, aiohttp_client):
+    """Test get image via http with a signed token."""
+    await async_setup_component(
+        hass, "media_player", {"media_player": {"platform": "demo"}}
+    )
+    await hass.async_block_till_done()
+
+    client = await aiohttp_client(hass.http.app)
+    url = "/api/media_player_proxy/media_player.bedroom?token={}"
+
+    with patch(
+        "homeassistant.components.media_player.MediaPlayerEntity."
+        "async_get_media_image",
+        return_value=(b"image", "image/jpeg"),
+    ):
+        token = async_sign_entity_token(
+            hass, "media_player.bedroom", timedelta(minutes=5)
+        )
+        resp = await client.get(url.format(token))
+        assert resp.status == 200
+        assert await resp.read() == b"image"
+
+        for token in (
+            async_sign_entity_token(hass, "media_player.walkman", timedelta(minutes=5)),
+            async_sign_entity_token(
+                hass, "media_player.bedroom", timedelta(minutes=-5)
+            ),
+            "invalid",
+        ):
+            resp = await client.get(url.format(token))
+            assert resp.status == 401
+
+
 async def test_get_image_http_remote(hass, aiohttp_client):
     """Test get image url via http command."""
     with patch(
@@ -116,6 +152,15 @@ async def test_get_async_get_browse_image(hass, aiohttp_client, hass_ws_client):
         content = await resp.read()
 
     assert content == b"image"
+    assert player.access_token not in url
+
+    # The signed token of the url expires
+    with patch(
+        "homeassistant.components.http.auth.dt_util.utcnow",
+        return_value=dt_util.utcnow() + media_player.BROWSE_IMAGE_TOKEN_VALIDITY * 2,
+    ):
+        resp = await client.get(url)
+    assert resp.status == 401
 
 
 def test_deprecated_base_class(caplog):
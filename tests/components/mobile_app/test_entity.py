@@ -1,6 +1,10 @@
 """Entity tests for mobile_app."""
+from unittest.mock import patch
+
+from homeassistant.components.mobile_app.const import SIGNAL_SENSOR_UPDATE
 from homeassistant.const import PERCENTAGE, STATE_UNKNOWN
 from homeassistant.helpers import device_registry
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 
 async def test_sensor(hass, create_registrations, webhook_client):
@@ -71,6 +75,61 @@ async def test_sensor(hass, create_registrations, webhook_client):
     assert len(dev_reg.devices) == len(create_registrations)
 
 
+async def test_update_sensor_states_batched(hass, create_registrations, webhook_client):
+    """Test that all sensors of an update are written at once."""
+    webhook_id = create_registrations[1]["webhook_id"]
+    webhook_url = f"/api/webhook/{webhook_id}"
+
+    for unique_id, sensor_type in (
+        ("battery_state", "sensor"),
+        ("is_charging", "binary_sensor"),
+    ):
+        reg_resp = await webhook_client.post(
+            webhook_url,
+            json={
+                "type": "register_sensor",
+                "data": {
+                    "name": unique_id,
+                    "state": None,
+                    "type": sensor_type,
+                    "unique_id": unique_id,
+                },
+            },
+        )
+        assert reg_resp.status == 201
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.mobile_app.webhook.async_dispatcher_send"
+    ) as mock_send:
+        update_resp = await webhook_client.post(
+            webhook_url,
+            json={
+                "type": "update_sensor_states",
+                "data": [
+                    {"state": 50, "type": "sensor", "unique_id": "battery_state"},
+                    {
+                        "state": True,
+                        "type": "binary_sensor",
+                        "unique_id": "is_charging",
+                    },
+                ],
+            },
+        )
+        assert update_resp.status == 200
+
+    assert len(mock_send.mock_calls) == 1
+    _, signal, updates = mock_send.mock_calls[0][1]
+    assert signal == SIGNAL_SENSOR_UPDATE.format(webhook_id)
+    assert set(updates) == {f"{webhook_id}_battery_state", f"{webhook_id}_is_charging"}
+
+    async_dispatcher_send(hass, signal, updates)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.test_1_battery_state").state == "50"
+    assert hass.states.get("binary_sensor.test_1_is_charging").state == "on"
+
+
 async def test_sensor_must_register(hass, create_registrations, webhook_client):
     """Test that sensors must be registered before updating."""
     webhook_id = create_registrations[1]["webhook_id"]
@@ -1,7 +1,13 @@
 """Tests for the mobile app integration."""
-from homeassistant.components.mobile_app.const import DATA_DELETED_IDS, DOMAIN
+from homeassistant.components.mobile_app.const import (
+    CONF_SECRET,
+    DATA_DELETED_IDS,
+    DATA_SECRET_BOXES,
+    DOMAIN,
+)
 
-from .const import CALL_SERVICE
+from .const import CALL_SERVICE, RENDER_TEMPLATE
+from .test_webhook import encrypt_payload
 
 from tests.common import async_mock_service
 
@@ -24,6 +30,23 @@ async def test_unload_unloads(hass, create_registrations, webhook_client):
     assert len(calls) == 1
 
 
+async def test_unload_drops_secret_box(hass, create_registrations, webhook_client):
+    """Test the secret box of an entry is kept until it unloads."""
+    # First config entry is the one with encryption
+    config_entry = hass.config_entries.async_entries("mobile_app")[0]
+    webhook_id = config_entry.data["webhook_id"]
+    data = encrypt_payload(config_entry.data[CONF_SECRET], RENDER_TEMPLATE["data"])
+    container = {"type": "render_template", "encrypted": True, "encrypted_data": data}
+
+    resp = await webhook_client.post(f"/api/webhook/{webhook_id}", json=container)
+    assert resp.status == 200
+    assert webhook_id in hass.data[DOMAIN][DATA_SECRET_BOXES]
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+    assert webhook_id not in hass.data[DOMAIN][DATA_SECRET_BOXES]
+
+
 async def test_remove_entry(hass, create_registrations):
     """Test we clean up when we remove entry."""
     for config_entry in hass.config_entries.async_entries("mobile_app"):
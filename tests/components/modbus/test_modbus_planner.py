@@ -0,0 +1,186 @@
+"""The tests for the Modbus read planner."""
+from pymodbus.client.common import ModbusClientMixin
+from pymodbus.datastore import ModbusSequentialDataBlock, ModbusSlaveContext
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+import pytest
+
+from homeassistant.components.modbus import ModbusHub
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_COIL,
+    CALL_TYPE_REGISTER_HOLDING,
+    DEFAULT_HUB,
+)
+from homeassistant.components.modbus.planner import plan_blocks
+from homeassistant.const import (
+    CONF_DELAY,
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_TIMEOUT,
+    CONF_TYPE,
+)
+
+
+class SimulatorClient(ModbusClientMixin):
+    """Answer requests from a local pymodbus datastore."""
+
+    def __init__(self, slaves):
+        """Initialize the simulator."""
+        self.slaves = slaves
+        self.requests = []
+        self.errors = []
+
+    def execute(self, request):
+        """Execute a request against the datastore of its unit."""
+        self.requests.append(
+            (request.unit_id, request.address, getattr(request, "count", None))
+        )
+        if self.errors:
+            return self.errors.pop(0)
+        return request.execute(self.slaves[request.unit_id])
+
+
+@pytest.fixture
+def simulator():
+    """Return a simulator with 150 holding registers and coils for unit 1."""
+    return SimulatorClient(
+        {
+            1: ModbusSlaveContext(
+                co=ModbusSequentialDataBlock(0, [i % 2 for i in range(200)]),
+                hr=ModbusSequentialDataBlock(0, list(range(150))),
+                zero_mode=True,
+            )
+        }
+    )
+
+
+@pytest.fixture
+def hub(simulator):
+    """Return a hub talking to the simulator."""
+    hub = ModbusHub(
+        {
+            CONF_NAME: DEFAULT_HUB,
+            CONF_TYPE: "tcp",
+            CONF_HOST: "localhost",
+            CONF_PORT: 502,
+            CONF_TIMEOUT: 3,
+            CONF_DELAY: 0,
+        }
+    )
+    hub._client = simulator  # pylint: disable=protected-access
+    return hub
+
+
+def test_plan_blocks():
+    """Test ranges are grouped into bounded blocks."""
+    blocks = plan_blocks(
+        CALL_TYPE_REGISTER_HOLDING, {(0, 2), (2, 1), (10, 2), (30, 1), (40, 120)}
+    )
+    assert [(block.address, block.count, block.direct) for block in blocks] == [
+        (0, 12, False),
+        (30, 1, True),
+        (40, 120, True),
+    ]
+
+    blocks = plan_blocks(CALL_TYPE_COIL, {(0, 1), (30, 1), (1999, 1)})
+    assert [(block.address, block.count, block.direct) for block in blocks] == [
+        (0, 31, False),
+        (1999, 1, True),
+    ]
+
+
+def test_read_cycles(hub, simulator):
+    """Test each block is read once per cycle."""
+    for address in range(150):
+        hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, address, 1)
+    hub.register_read(CALL_TYPE_COIL, 1, 3, 1)
+    hub.register_read(CALL_TYPE_COIL, 1, 8, 1)
+
+    for _ in range(2):
+        for address in range(150):
+            result = hub.read_holding_registers(1, address, 1)
+            assert result.registers == [address]
+        assert hub.read_coils(1, 3, 1).bits == [True]
+        assert hub.read_coils(1, 8, 1).bits == [False]
+
+    assert (
+        simulator.requests
+        == [
+            (1, 0, 125),
+            (1, 125, 25),
+            (1, 3, 6),
+        ]
+        * 2
+    )
+
+    # Ranges not registered are read directly
+    assert hub.read_holding_registers(1, 5, 3).registers == [5, 6, 7]
+    assert simulator.requests[-1] == (1, 5, 3)
+
+
+def test_read_after_write(hub, simulator):
+    """Test writing forgets the blocks read."""
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 0, 1)
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 1, 1)
+
+    assert hub.read_holding_registers(1, 0, 1).registers == [0]
+    hub.write_register(1, 1, 42)
+    assert hub.read_holding_registers(1, 1, 1).registers == [42]
+    assert simulator.requests[0] == simulator.requests[-1] == (1, 0, 2)
+
+
+def test_read_block_not_allowed(hub, simulator):
+    """Test ranges are read directly if their block cannot be read."""
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 148, 1)
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 152, 1)
+
+    assert hub.read_holding_registers(1, 148, 1).registers == [148]
+    assert isinstance(hub.read_holding_registers(1, 152, 1), ExceptionResponse)
+    assert hub.read_holding_registers(1, 148, 1).registers == [148]
+
+    assert simulator.requests == [
+        (1, 148, 5),
+        (1, 148, 1),
+        (1, 152, 1),
+        (1, 148, 1),
+    ]
+
+
+def test_read_block_transient_error(hub, simulator):
+    """Test a failed block read only reads the range directly once."""
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 0, 1)
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 1, 1)
+
+    simulator.errors.append(ModbusIOException("timeout"))
+    assert hub.read_holding_registers(1, 0, 1).registers == [0]
+    assert hub.read_holding_registers(1, 0, 1).registers == [0]
+    assert hub.read_holding_registers(1, 1, 1).registers == [1]
+
+    assert simulator.requests == [(1, 0, 2), (1, 0, 1), (1, 0, 2)]
+
+
+def test_unregister_read(hub, simulator):
+    """Test ranges no longer read are removed from their block."""
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 0, 1)
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 4, 1)
+    hub.register_read(CALL_TYPE_REGISTER_HOLDING, 1, 4, 1)
+
+    assert hub.read_holding_registers(1, 0, 1).registers == [0]
+    hub.unregister_read(CALL_TYPE_REGISTER_HOLDING, 1, 4, 1)
+    assert hub.read_holding_registers(1, 4, 1).registers == [4]
+
+    hub.unregister_read(CALL_TYPE_REGISTER_HOLDING, 1, 4, 1)
+    hub.unregister_read(CALL_TYPE_REGISTER_HOLDING, 1, 4, 1)
+    assert hub.read_holding_registers(1, 0, 1).registers == [0]
+    assert hub.read_holding_registers(1, 4, 1).registers == [4]
+
+    hub.unregister_read(CALL_TYPE_REGISTER_HOLDING, 1, 0, 1)
+    assert hub.read_holding_registers(1, 0, 1).registers == [0]
+
+    assert simulator.requests == [
+        (1, 0, 5),
+        (1, 0, 1),
+        (1, 4, 1),
+        (1, 0, 1),
+    ]
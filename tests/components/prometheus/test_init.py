@@ -31,9 +31,11 @@ class FilterTest:
     should_pass: bool
 
 
-async def prometheus_client(hass, hass_client):
+async def prometheus_client(hass, hass_client, config=None):
     """Initialize an hass_client with Prometheus component."""
-    await async_setup_component(hass, prometheus.DOMAIN, {prometheus.DOMAIN: {}})
+    await async_setup_component(
+        hass, prometheus.DOMAIN, {prometheus.DOMAIN: config or {}}
+    )
 
     await async_setup_component(hass, sensor.DOMAIN, {"sensor": [{"platform": "demo"}]})
 
@@ -201,6 +203,59 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_scrape_collector(hass, hass_client):
+    """Test prometheus metrics view computing the metrics when scraped."""
+    client = await prometheus_client(
+        hass, hass_client, {"collector": prometheus.COLLECTOR_SCRAPE}
+    )
+
+    attributes = {
+        "friendly_name": "Scraped Energy",
+        "unit_of_measurement": ENERGY_KILO_WATT_HOUR,
+    }
+    hass.states.async_set("sensor.scraped_energy", 3, attributes)
+    hass.states.async_set("sensor.scraped_energy", 5, attributes)
+    hass.states.async_set("automation.scraped", "on", {"friendly_name": "Scraped"})
+    await hass.async_block_till_done()
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+
+    assert resp.status == 200
+    body = await resp.text()
+    body = body.split("\n")
+
+    assert (
+        'sensor_unit_kwh{domain="sensor",'
+        'entity="sensor.scraped_energy",'
+        'friendly_name="Scraped Energy"} 5.0' in body
+    )
+
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.scraped_energy",'
+        'friendly_name="Scraped Energy"} 2.0' in body
+    )
+
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.scraped_energy",'
+        'friendly_name="Scraped Energy"} 1.0' in body
+    )
+
+    assert (
+        'automation_triggered_count_total{domain="automation",'
+        'entity="automation.scraped",'
+        'friendly_name="Scraped"} 1.0' in body
+    )
+
+    hass.states.async_remove("sensor.scraped_energy")
+    await hass.async_block_till_done()
+
+    resp = await client.get(prometheus.API_ENDPOINT)
+    body = await resp.text()
+    assert "sensor.scraped_energy" not in body
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -706,3 +706,32 @@ async def test_script_variables(hass, caplog):
 
     assert len(mock_calls) == 4
     assert mock_calls[3].data["value"] == 1
+
+
+async def test_websocket_metrics(hass, hass_ws_client):
+    """Test enabling and fetching script metrics over the websocket API."""
+    assert await async_setup_component(
+        hass,
+        "script",
+        {"script": {"test": {"sequence": [{"event": "test_event"}]}}},
+    )
+    client = await hass_ws_client(hass)
+
+    await client.send_json({"id": 5, "type": "script/metrics/enable", "enabled": True})
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    await hass.services.async_call(DOMAIN, "test", blocking=True)
+    await hass.async_block_till_done()
+    assert "last_run_duration" in hass.states.get(ENTITY_ID).attributes
+
+    await client.send_json({"id": 6, "type": "script/metrics"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["enabled"]
+    assert msg["result"]["runs"] == {"single": 1}
+    result = msg["result"]["scripts"][0]
+    assert result["name"] == "test"
+    assert result["domain"] == "script"
+    assert result["steps"][0]["action"] == "event"
+    assert result["steps"][0]["count"] == 1
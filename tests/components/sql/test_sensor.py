@@ -1,8 +1,20 @@
 """The test for the sql sensor platform."""
+from datetime import timedelta
+import logging
+from time import monotonic
+from unittest.mock import MagicMock, patch
+
 import pytest
+import sqlalchemy
+from sqlalchemy.orm import scoped_session, sessionmaker
 import voluptuous as vol
 
-from homeassistant.components.sql.sensor import validate_sql_select
+from homeassistant.components.sql.sensor import (
+    DATA_SQL,
+    QueryBatch,
+    SQLDatabase,
+    validate_sql_select,
+)
 from homeassistant.const import STATE_UNKNOWN
 from homeassistant.setup import async_setup_component
 
@@ -55,3 +67,120 @@ async def test_invalid_query(hass):
 
     state = hass.states.get("sensor.count_tables")
     assert state.state == STATE_UNKNOWN
+
+
+async def test_queries_share_database(hass):
+    """Test sensors using the same db_url share an engine."""
+    config = {
+        "sensor": [
+            {
+                "platform": "sql",
+                "db_url": "sqlite://",
+                "queries": [
+                    {"name": "five", "query": "SELECT 5 as value", "column": "value"},
+                    {"name": "six", "query": "SELECT 6 as value", "column": "value"},
+                ],
+            },
+            {
+                "platform": "sql",
+                "db_url": "sqlite://",
+                "queries": [
+                    {"name": "seven", "query": "SELECT 7 as value", "column": "value"}
+                ],
+            },
+        ]
+    }
+
+    with patch(
+        "homeassistant.components.sql.sensor.sqlalchemy.create_engine",
+        wraps=sqlalchemy.create_engine,
+    ) as create_engine:
+        assert await async_setup_component(hass, "sensor", config)
+        await hass.async_block_till_done()
+
+    assert create_engine.call_count == 1
+    assert hass.states.get("sensor.five").state == "5"
+    assert hass.states.get("sensor.six").state == "6"
+    assert hass.states.get("sensor.seven").state == "7"
+
+    assert hass.data[DATA_SQL]["sqlite://"].db_url == "sqlite://"
+
+
+async def test_query_statistics(hass, hass_ws_client):
+    """Test the statistics of the queries of the sensors over the websocket."""
+    config = {
+        "sensor": {
+            "platform": "sql",
+            "db_url": "sqlite://",
+            "queries": [
+                {"name": "five", "query": "SELECT 5 as value", "column": "value"},
+                {"name": "six", "query": "SELECT 6 as value", "column": "value"},
+            ],
+        }
+    }
+    assert await async_setup_component(hass, "sensor", config)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 5, "type": "sql/query_statistics"})
+    msg = await client.receive_json()
+
+    assert msg["success"]
+    assert set(msg["result"]) == {"sensor.five", "sensor.six"}
+    statistics = msg["result"]["sensor.five"]
+    assert statistics["query"] == "SELECT 5 as value"
+    assert statistics["executions"] == 1
+    assert statistics["max_duration"] >= statistics["mean_duration"] > 0
+
+    await hass.helpers.entity_component.async_update_entity("sensor.five")
+    await client.send_json({"id": 6, "type": "sql/query_statistics"})
+    msg = await client.receive_json()
+
+    assert msg["result"]["sensor.five"]["executions"] == 2
+    assert msg["result"]["sensor.six"]["executions"] == 1
+
+
+def test_execute_due_queries(caplog):
+    """Test the queries due in the same poll are executed in a single session."""
+    caplog.set_level(logging.DEBUG)
+    sessmaker = MagicMock(
+        wraps=scoped_session(sessionmaker(bind=sqlalchemy.create_engine("sqlite://")))
+    )
+    batch = QueryBatch(SQLDatabase("sqlite://", sessmaker), timedelta(seconds=30))
+    batch.register("SELECT * value FROM sqlite_master;")
+    batch.register("SELECT 1 as value")
+    batch.register("SELECT 2 as value, 'two' as name")
+
+    with pytest.raises(sqlalchemy.exc.SQLAlchemyError):
+        batch.execute("SELECT * value FROM sqlite_master;")
+    rows, executed_at = batch.execute("SELECT 1 as value")
+    assert rows == [{"value": 1}]
+    assert batch.execute("SELECT 2 as value, 'two' as name")[0] == [
+        {"value": 2, "name": "two"}
+    ]
+    assert sessmaker.call_count == 1
+    assert "Executed SELECT 2 as value, 'two' as name: {'executions': 1" in caplog.text
+
+    # A sensor updating again before the next poll only executes its query
+    caplog.clear()
+    rows, executed_at = batch.execute("SELECT 1 as value", executed_at)
+    assert rows == [{"value": 1}]
+    assert sessmaker.call_count == 2
+    assert "Executed SELECT 1 as value: {'executions': 2" in caplog.text
+    assert "Executed SELECT 2" not in caplog.text
+
+    # Another sensor with the same query uses that result
+    assert batch.execute("SELECT 1 as value")[1] == executed_at
+    assert sessmaker.call_count == 2
+
+    # Once the next poll is due, all its queries are executed again
+    with patch(
+        "homeassistant.components.sql.sensor.monotonic",
+        return_value=monotonic() + 30,
+    ):
+        batch.execute("SELECT 1 as value", executed_at)
+        assert batch.execute("SELECT 2 as value, 'two' as name")[0] == [
+            {"value": 2, "name": "two"}
+        ]
+    assert sessmaker.call_count == 3
+    assert "Executed SELECT 2 as value, 'two' as name: {'executions': 2" in caplog.text
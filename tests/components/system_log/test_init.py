@@ -330,3 +330,44 @@ async def test_config_path(hass, simple_queue, hass_client):
         )
         log = (await get_error_log(hass, hass_client, 1))[0]
     assert log["source"] == ["custom_component/test.py", 5]
+
+
+async def test_log_storm_aggregated(hass, simple_queue, hass_client):
+    """Test records logged the same way resolve their source once."""
+    await async_setup_component(
+        hass, system_log.DOMAIN, {"system_log": {"max_entries": 2, "fire_event": True}}
+    )
+    events = []
+
+    @callback
+    def event_listener(event):
+        """Listen to events of type system_log_event."""
+        events.append(event)
+
+    hass.bus.async_listen(system_log.EVENT_SYSTEM_LOG, event_listener)
+
+    with patch(
+        "traceback.extract_stack", wraps=system_log.traceback.extract_stack
+    ) as mock_extract_stack:
+        for idx in range(250):
+            log_msg(idx)
+        await _async_block_until_queue_empty(hass, simple_queue)
+
+    assert mock_extract_stack.call_count == 3
+
+    log = (await get_error_log(hass, hass_client, 1))[0]
+    assert log["count"] == 250
+    assert log["message"] == [f"error message {idx}" for idx in range(245, 250)]
+    assert log["timestamp"] > log["first_occurred"]
+
+    assert len(events) == 1
+    assert events[0].data["message"] == ["error message 0"]
+
+    with patch.object(system_log, "EVENT_MIN_INTERVAL", 0):
+        log_msg()
+        await _async_block_until_queue_empty(hass, simple_queue)
+
+    await get_error_log(hass, hass_client, 1)
+    assert len(events) == 2
+    assert events[1].data["count"] == 251
+    assert events[1].data["message"] == ["error message 2"]
@@ -1,4 +1,5 @@
 """The tests for the TTS component."""
+from datetime import timedelta
 from unittest.mock import PropertyMock, patch
 
 import pytest
@@ -15,10 +16,15 @@ from homeassistant.components.media_player.const import (
 import homeassistant.components.tts as tts
 from homeassistant.components.tts import _get_cache_files
 from homeassistant.config import async_process_ha_core_config
-from homeassistant.const import HTTP_NOT_FOUND
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
-from tests.common import assert_setup_component, async_mock_service
+from tests.common import (
+    assert_setup_component,
+    async_fire_time_changed,
+    async_mock_service,
+)
 
 
 def relative_url(url):
@@ -685,6 +691,230 @@ async def test_setup_component_load_cache_retrieve_without_mem_cache(
     assert await req.read() == demo_data
 
 
+async def test_setup_component_load_cache_unknown_content_type(
+    hass, demo_provider, empty_cache_dir, hass_client
+):
+    """Set up component and get a cached file of unknown type."""
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+    cache_file = (
+        empty_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.zzz"
+    )
+
+    with open(cache_file, "wb") as voice_file:
+        voice_file.write(demo_data)
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    client = await hass_client()
+
+    url = "/api/tts_proxy/42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.zzz"
+
+    req = await client.get(url)
+    assert req.status == 200
+    assert req.content_type == "application/octet-stream"
+    assert await req.read() == demo_data
+
+
+async def test_setup_component_load_cache_index(
+    hass,
+    hass_storage,
+    demo_provider,
+    empty_cache_dir,
+    mock_get_cache_files,
+    hass_client,
+):
+    """Set up component and load the cache from its index."""
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    (empty_cache_dir / filename).write_bytes(demo_data)
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(empty_cache_dir),
+            "files": [[filename[:-4], filename, len(demo_data)]],
+        },
+    }
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    assert not mock_get_cache_files.called
+
+    client = await hass_client()
+
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == 200
+    assert await req.read() == demo_data
+
+
+async def test_setup_component_cache_size(hass, hass_storage, empty_cache_dir):
+    """Set up component and remove the least recently used files."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    old_filename = "0000000000000000000000000000000000000000_en_-_demo.mp3"
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    (empty_cache_dir / old_filename).write_bytes(b"old")
+    (empty_cache_dir / filename).write_bytes(b"new")
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(empty_cache_dir),
+            "files": [
+                [filename[:-4], filename, 512 * 1024],
+                [old_filename[:-4], old_filename, 512 * 1024],
+            ],
+        },
+    }
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True, "cache_size": 1}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    # Using the cached speech makes the other file the least recently used
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "demo_say",
+        {
+            "entity_id": "media_player.something",
+            tts.ATTR_MESSAGE: "There is someone at the door.",
+        },
+        blocking=True,
+    )
+    assert len(calls) == 1
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "demo_say",
+        {
+            "entity_id": "media_player.something",
+            tts.ATTR_MESSAGE: "There is someone at the window.",
+        },
+        blocking=True,
+    )
+    assert len(calls) == 2
+    await hass.async_block_till_done()
+
+    assert not (empty_cache_dir / old_filename).is_file()
+    assert (empty_cache_dir / filename).is_file()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=tts.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    files = hass_storage[tts.STORAGE_KEY]["data"]["files"]
+    assert [filename for _, filename, _ in files] == [
+        filename,
+        "48738c102ac491b4114c15b3680f3a16ac9c8ee4_en_-_demo.mp3",
+    ]
+
+
+async def test_setup_component_cache_order_saved(hass, hass_storage, empty_cache_dir):
+    """Test using a cached file saves the new order on shutdown only."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    old_filename = "0000000000000000000000000000000000000000_en_-_demo.mp3"
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    (empty_cache_dir / old_filename).write_bytes(b"old")
+    (empty_cache_dir / filename).write_bytes(b"new")
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(empty_cache_dir),
+            "files": [
+                [filename[:-4], filename, 3],
+                [old_filename[:-4], old_filename, 3],
+            ],
+        },
+    }
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    with patch.object(tts.Store, "async_delay_save") as mock_delay_save:
+        await hass.services.async_call(
+            tts.DOMAIN,
+            "demo_say",
+            {
+                "entity_id": "media_player.something",
+                tts.ATTR_MESSAGE: "There is someone at the door.",
+            },
+            blocking=True,
+        )
+    assert len(calls) == 1
+    assert not mock_delay_save.called
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    files = hass_storage[tts.STORAGE_KEY]["data"]["files"]
+    assert [filename for _, filename, _ in files] == [old_filename, filename]
+
+
+async def test_setup_component_mem_cache_size(hass, hass_client):
+    """Set up component and remove the least recently used speech from memory."""
+    config = {tts.DOMAIN: {"platform": "demo", "cache": False}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    client = await hass_client()
+
+    with patch("homeassistant.components.tts.MAX_MEM_CACHE_SIZE", 1):
+        first = await client.post(
+            "/api/tts_get_url",
+            json={"platform": "demo", "message": "There is someone at the door."},
+        )
+        second = await client.post(
+            "/api/tts_get_url",
+            json={"platform": "demo", "message": "There is someone at the window."},
+        )
+
+    req = await client.get((await first.json())["path"])
+    assert req.status == HTTP_NOT_FOUND
+    req = await client.get((await second.json())["path"])
+    assert req.status == 200
+
+
+async def test_setup_component_mem_cache_timer(hass, hass_client):
+    """Set up component and cancel the memory timer of removed speech."""
+    config = {tts.DOMAIN: {"platform": "demo", "cache": False}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    client = await hass_client()
+    timers = []
+
+    def call_later(*args):
+        timers.append(call_later.orig(*args))
+        return timers[-1]
+
+    call_later.orig = hass.loop.call_later
+
+    with patch("homeassistant.components.tts.MAX_MEM_CACHE_SIZE", 1), patch.object(
+        hass.loop, "call_later", call_later
+    ):
+        for _ in range(2):
+            await client.post(
+                "/api/tts_get_url",
+                json={"platform": "demo", "message": "There is someone at the door."},
+            )
+            await client.post(
+                "/api/tts_get_url",
+                json={"platform": "demo", "message": "There is someone at the window."},
+            )
+
+    assert len(timers) == 4
+    assert [timer.cancelled() for timer in timers] == [True, True, True, False]
+
+
 async def test_setup_component_and_web_get_url(hass, hass_client):
     """Set up the demo platform and receive file from web."""
     config = {tts.DOMAIN: {"platform": "demo"}}
@@ -747,6 +747,58 @@ async def test_manifest_get(hass, websocket_client):
     assert msg["error"]["code"] == "not_found"
 
 
+async def test_setup_timeline(hass, websocket_client):
+    """Test getting the setup timeline."""
+    await websocket_client.send_json({"id": 5, "type": "integration/setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert {"http", "websocket_api"} <= {span["domain"] for span in msg["result"]}
+    span = msg["result"][0]
+    assert span["duration"] == round(span["end"] - span["start"], 6)
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "integration/setup_timeline", "format": "chrome"}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert msg["result"]["displayTimeUnit"] == "ms"
+    assert {"http", "websocket_api"} <= {
+        event["args"]["name"]
+        for event in msg["result"]["traceEvents"]
+        if event["ph"] == "M"
+    }
+
+
+async def test_polling_statistics(hass, websocket_client):
+    """Test getting the polling statistics."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([MockEntity(name="Polling", should_poll=True)])
+
+    await websocket_client.send_json({"id": 5, "type": "entity/polling_statistics"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "key": "test_domain.test_platform",
+            "interval": 15,
+            "offset": msg["result"][0]["offset"],
+            "polls": 0,
+            "overruns": 0,
+            "last_duration": 0.0,
+            "max_duration": 0.0,
+            "mean_duration": 0.0,
+        }
+    ]
+
+
 async def test_entity_source_admin(hass, websocket_client, hass_admin_user):
     """Check that we fetch sources correctly."""
     platform = MockEntityPlatform(hass)
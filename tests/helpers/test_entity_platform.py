@@ -15,6 +15,11 @@ from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
     EntityComponent,
 )
+from homeassistant.helpers.polling import (
+    POLL_SPREAD_FRACTION,
+    POLL_SPREAD_MIN_UPDATES,
+    poll_offset,
+)
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -135,7 +140,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_track_polling")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -759,6 +764,118 @@ async def test_device_info_called(hass):
     assert device.via_device_id == via.id
 
 
+async def test_polling_updates_devices_in_batch(hass):
+    """Test polling entities of a device with a single platform call."""
+    device_updates = []
+
+    async def async_update_device_entities(hass, device_id, entities):
+        """Mock updating all entities of a device."""
+        device_updates.append((device_id, {entity.unique_id for entity in entities}))
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        device_info = {"identifiers": {("hue", "1234")}, "name": "test-name"}
+        async_add_entities(
+            [
+                MockEntity(unique_id="abcd", should_poll=True, device_info=device_info),
+                MockEntity(unique_id="qwer", should_poll=True, device_info=device_info),
+                MockEntity(unique_id="zxcv", should_poll=True),
+            ]
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    platform.async_update_device_entities = async_update_device_entities
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    entity_platform = MockEntityPlatform(
+        hass,
+        platform_name=config_entry.domain,
+        platform=platform,
+        scan_interval=timedelta(seconds=20),
+    )
+
+    assert await entity_platform.async_setup_entry(config_entry)
+    await hass.async_block_till_done()
+
+    no_device = next(
+        entity
+        for entity in entity_platform.entities.values()
+        if entity.unique_id == "zxcv"
+    )
+    no_device.async_update = Mock()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    registry = await hass.helpers.device_registry.async_get_registry()
+    device = registry.async_get_device({("hue", "1234")})
+    assert device_updates == [(device.id, {"abcd", "qwer"})]
+    assert no_device.async_update.called
+
+
+async def test_polling_spreads_updates(hass):
+    """Test a poll updating many entities spreads them over the interval."""
+    scan_interval = timedelta(seconds=20)
+    entity_platform = MockEntityPlatform(hass, scan_interval=scan_interval)
+    updates = []
+
+    class UpdateEntity(MockEntity):
+        """Record its updates."""
+
+        async def async_update(self):
+            """Record an update."""
+            updates.append(self.entity_id)
+
+    entities = [
+        UpdateEntity(name=f"poll_{idx}", should_poll=True)
+        for idx in range(POLL_SPREAD_MIN_UPDATES + 1)
+    ]
+    await entity_platform.async_add_entities(entities)
+    removed = entities.pop()
+    offsets = {
+        entity.entity_id: poll_offset(
+            entity.entity_id, scan_interval, POLL_SPREAD_FRACTION
+        )
+        for entity in entities
+    }
+    assert len(set(offsets.values())) == len(entities)
+    assert all(offset <= scan_interval / 2 for offset in offsets.values())
+
+    now = dt_util.utcnow()
+    with patch("homeassistant.util.dt.utcnow", return_value=now + scan_interval):
+        async_fire_time_changed(hass, now + scan_interval)
+        await hass.async_block_till_done()
+    # The poll finished without waiting for the updates
+    assert not updates
+    assert set(entity_platform._spread_updates) == {*offsets, removed.entity_id}
+
+    # An entity removed before its update is not updated
+    await entity_platform.async_remove_entity(removed.entity_id)
+    for offset in sorted(offsets.values()):
+        point = now + scan_interval + offset + timedelta(milliseconds=1)
+        with patch("homeassistant.util.dt.utcnow", return_value=point):
+            async_fire_time_changed(hass, point)
+            await hass.async_block_till_done()
+        assert sorted(updates) == sorted(
+            entity_id for entity_id, due in offsets.items() if due <= offset
+        )
+
+    assert sorted(updates) == sorted(offsets)
+    assert not entity_platform._spread_updates
+
+    # Resetting the platform cancels the updates of a running poll
+    later = now + scan_interval * 2 + timedelta(seconds=1)
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        async_fire_time_changed(hass, later)
+        await hass.async_block_till_done()
+    assert set(entity_platform._spread_updates) == set(offsets)
+    await entity_platform.async_reset()
+    assert not entity_platform._spread_updates
+    async_fire_time_changed(hass, later + scan_interval)
+    await hass.async_block_till_done()
+    assert sorted(updates) == sorted(offsets)
+
+
 async def test_device_info_not_overrides(hass):
     """Test device info is forwarded correctly."""
     registry = await hass.helpers.device_registry.async_get_registry()
@@ -248,3 +248,18 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_many_globs():
+    """Test any of many globs, also with several wildcards, can match."""
+    incl_glob = {f"sensor.room_{idx}_*_temperature" for idx in range(200)}
+    excl_glob = {"sensor.*_old_*", "sensor.room_?_hall_*"}
+    testfilter = generate_filter({}, {}, {}, {}, incl_glob, excl_glob)
+
+    for _ in range(2):
+        assert testfilter("sensor.room_150_kitchen_temperature")
+        assert testfilter("sensor.room_10_hall_temperature")
+        assert testfilter("sensor.room_1_hall_temperature") is False
+        assert testfilter("sensor.room_150_old_temperature") is False
+        assert testfilter("sensor.room_200_kitchen_temperature") is False
+        assert testfilter("sensor.room_150_kitchen_humidity") is False
@@ -0,0 +1,60 @@
+"""Tests for the polling helper."""
+from datetime import timedelta
+
+from homeassistant.helpers import polling
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+def test_poll_offset():
+    """Test offsets are deterministic and within the jitter window."""
+    interval = timedelta(seconds=30)
+    offset = polling.poll_offset("sensor.demo", interval)
+
+    assert offset == polling.poll_offset("sensor.demo", interval)
+    assert offset != polling.poll_offset("sensor.other", interval)
+    assert timedelta(0) <= offset <= interval * polling.POLL_JITTER_FRACTION
+
+    spread = polling.poll_offset("sensor.demo", interval, 0.25)
+    assert spread == offset / 2
+
+
+async def test_track_polling(hass):
+    """Test polls are spread and tracked in the statistics."""
+    interval = timedelta(seconds=30)
+    offset = polling.poll_offset("sensor.demo", interval)
+    polls = []
+
+    async def async_poll(now):
+        """Record a poll."""
+        polls.append(now)
+
+    start = dt_util.utcnow()
+    remove = polling.async_track_polling(hass, async_poll, interval, "sensor.demo")
+
+    async_fire_time_changed(hass, start + interval - offset - timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(polls) == 0
+
+    async_fire_time_changed(hass, start + interval - offset + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(polls) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + interval)
+    await hass.async_block_till_done()
+    assert len(polls) == 2
+
+    statistics = polling.async_get_scheduler(hass).async_statistics()
+    assert len(statistics) == 1
+    assert statistics[0]["key"] == "sensor.demo"
+    assert statistics[0]["interval"] == 30
+    assert statistics[0]["polls"] == 2
+    assert statistics[0]["overruns"] == 0
+
+    remove()
+    assert polling.async_get_scheduler(hass).async_statistics() == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + interval * 2)
+    await hass.async_block_till_done()
+    assert len(polls) == 2
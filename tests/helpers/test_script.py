@@ -2097,3 +2097,74 @@ async def test_embedded_wait_for_trigger_in_automation(hass):
     await hass.async_block_till_done()
 
     assert len(mock_calls) == 1
+
+
+async def test_metrics_disabled(hass):
+    """Test no metrics are recorded unless enabled."""
+    sequence = cv.SCRIPT_SCHEMA({"event": "test_event"})
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert script_obj.metrics is None
+    assert script.async_get_metrics(hass) == {
+        "enabled": False,
+        "runs": {},
+        "scripts": [],
+    }
+
+
+async def test_metrics(hass):
+    """Test recording step durations and queue wait of runs."""
+    script.async_enable_metrics(hass)
+    service_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def blocking_service(call):
+        service_started.set()
+        await release.wait()
+
+    hass.services.async_register("test", "script", blocking_service)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"service": "test.script"},
+            {"alias": "fire", "event": "test_event"},
+        ]
+    )
+    script_obj = script.Script(
+        hass,
+        sequence,
+        "Test Name",
+        "test_domain",
+        script_mode="queued",
+    )
+
+    hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.wait_for(service_started.wait(), 1)
+    hass.async_create_task(script_obj.async_run(context=Context()))
+    await asyncio.sleep(0.01)
+    release.set()
+    await hass.async_block_till_done()
+
+    metrics = script.async_get_metrics(hass)
+    assert metrics["enabled"]
+    assert metrics["runs"] == {"queued": 2}
+    assert len(metrics["scripts"]) == 1
+    result = metrics["scripts"][0]
+    assert result["name"] == "Test Name"
+    assert result["runs"] == 2
+    assert result["run_duration"]["count"] == 2
+    assert result["queue_wait"]["count"] == 2
+    assert result["queue_wait"]["max"] >= 0.01
+    assert [
+        (step["action"], step["description"], step["count"]) for step in result["steps"]
+    ] == [
+        ("call_service", "test.script", 2),
+        ("event", "fire", 2),
+    ]
+    assert result["steps"][0]["max"] >= 0.01
+
+    script.async_enable_metrics(hass, False)
+    await script_obj.async_run(context=Context())
+    assert script_obj.metrics.runs == 2
@@ -190,6 +190,33 @@ def test_iterating_domain_states(hass):
     )
 
 
+def test_iterating_domain_states_cached(hass):
+    """Test iterating domain states follows changes to the states."""
+    tmpl = template.Template(
+        "{% for state in states.sensor %}{{ state.entity_id }}={{ state.state }} "
+        "{% endfor %}",
+        hass,
+    )
+
+    hass.states.async_set("sensor.b", "1")
+    hass.states.async_set("sensor.a", "2")
+    assert tmpl.async_render() == "sensor.a=2 sensor.b=1"
+
+    wrappers = list(template.DomainStates(hass, "sensor"))
+    assert list(template.DomainStates(hass, "sensor")) == wrappers
+    assert all(
+        first is second
+        for first, second in zip(wrappers, template.DomainStates(hass, "sensor"))
+    )
+
+    hass.states.async_set("sensor.b", "3")
+    assert tmpl.async_render() == "sensor.a=2 sensor.b=3"
+
+    hass.states.async_set("sensor.c", "4")
+    hass.states.async_remove("sensor.a")
+    assert tmpl.async_render() == "sensor.b=3 sensor.c=4"
+
+
 def test_float(hass):
     """Test float."""
     hass.states.async_set("sensor.temperature", "12")
@@ -1,5 +1,6 @@
 """Test the translation helper."""
 import asyncio
+from datetime import timedelta
 from os import path
 import pathlib
 from unittest.mock import Mock, patch
@@ -10,6 +11,9 @@ from homeassistant.generated import config_flows
 from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component, setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture
@@ -382,3 +386,46 @@ async def test_custom_component_translations(hass):
     hass.config.components.add("test_embedded")
     hass.config.components.add("test_package")
     assert await translation.async_get_translations(hass, "en", "state") == {}
+
+
+async def test_translation_bundle(hass, hass_storage):
+    """Test unchanged translation files are loaded from the bundle."""
+    hass.config.components.add("light")
+    translations = await translation.async_get_translations(hass, "en", "title")
+    assert translations["component.light.title"] == "Light"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=translation.BUNDLE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    bundled = hass_storage["core.translations.en"]["data"]["files"]
+    assert bundled["light"]["translations"]["title"] == "Light"
+
+    # Start over with only the stored bundle
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+    hass.data.pop(translation.TRANSLATION_BUNDLES)
+
+    with patch(
+        "homeassistant.helpers.translation.load_translations_files",
+        side_effect=translation.load_translations_files,
+    ) as mock_load:
+        assert (
+            await translation.async_get_translations(hass, "en", "title")
+            == translations
+        )
+    assert mock_load.call_args[0][0] == {}
+
+    # Modified files are loaded again
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+
+    with patch(
+        "homeassistant.helpers.translation.load_translations_files",
+        side_effect=translation.load_translations_files,
+    ) as mock_load, patch(
+        "homeassistant.helpers.translation.os.path.getmtime", return_value=0
+    ):
+        assert (
+            await translation.async_get_translations(hass, "en", "title")
+            == translations
+        )
+    assert "light" in mock_load.call_args[0][0]
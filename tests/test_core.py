@@ -1462,6 +1462,29 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_domain_filter_after_remove(hass):
+    """Test domain filtered queries follow added and removed states."""
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.frog", "on")
+
+    assert hass.states.async_entity_ids(["light", "switch", "light"]) == [
+        "light.bowl",
+        "light.frog",
+        "switch.link",
+    ]
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("switch.link")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.frog", "light.bowl"]
+    assert [state.state for state in hass.states.async_all("light")] == ["on", "off"]
+    assert hass.states.async_entity_ids_count("switch") == 0
+    assert hass.states.async_all(["switch", "vacuum"]) == []
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
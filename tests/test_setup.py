@@ -3,7 +3,7 @@
 import asyncio
 import os
 import threading
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import voluptuous as vol
@@ -596,3 +596,42 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of setting up an integration are recorded."""
+    MockConfigEntry(domain="comp", data={}).add_to_hass(hass)
+    mock_integration(hass, MockModule("dep"))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp",
+            dependencies=["dep"],
+            async_setup_entry=AsyncMock(return_value=True),
+        ),
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = [(span.domain, span.phase) for span in timeline.spans]
+    assert ("comp", setup.PHASE_DEPENDENCIES) in phases
+    assert ("dep", setup.PHASE_SETUP) in phases
+    assert phases[-3:] == [
+        ("comp", setup.PHASE_CONFIG),
+        ("comp", setup.PHASE_SETUP),
+        ("comp", setup.PHASE_CONFIG_ENTRIES),
+    ]
+    for span in timeline.spans:
+        assert 0 <= span.start <= span.end
+
+    trace = timeline.as_chrome_trace()
+    names = {
+        event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"
+    }
+    assert names == {"comp", "dep"}
+    assert [
+        event["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "X" and event["args"]["domain"] == "comp"
+    ] == [span[1] for span in phases if span[0] == "comp"]
@@ -0,0 +1,92 @@
+"""Test Home Assistant sample window."""
+import random
+import statistics
+
+import pytest
+
+from homeassistant.util.sample_window import SampleWindow
+
+
+def test_empty_window():
+    """Test an empty window has no statistics."""
+    window = SampleWindow(3)
+
+    assert not window
+    assert len(window) == 0
+    assert window.total == 0
+    assert window.mean() is None
+    assert window.median() is None
+    assert window.variance() is None
+    assert window.stdev() is None
+    assert window.min() is None
+    assert window.max() is None
+
+    with pytest.raises(IndexError):
+        window.first
+    with pytest.raises(IndexError):
+        window.popleft()
+
+    with pytest.raises(ValueError):
+        SampleWindow(0)
+
+
+def test_invalid_value():
+    """Test values without statistics are rejected."""
+    window = SampleWindow(3)
+    window.append(1)
+
+    for value in (float("nan"), float("inf")):
+        with pytest.raises(ValueError):
+            window.append(value)
+
+    assert len(window) == 1
+    assert window.mean() == 1
+
+
+def test_sliding_window():
+    """Test the oldest samples are removed once the window is full."""
+    window = SampleWindow(3)
+    for idx, value in enumerate((1, 5, 3, 2)):
+        window.append(value, 100 + idx)
+
+    assert len(window) == 3
+    assert window.first == (5, 101)
+    assert window.last == (2, 103)
+    assert window.total == 10
+    assert window.mean() == pytest.approx(10 / 3)
+    assert window.median() == 3
+    assert window.variance() == pytest.approx(statistics.variance([5, 3, 2]))
+    assert window.stdev() == pytest.approx(statistics.stdev([5, 3, 2]))
+    assert window.min() == 2
+    assert window.max() == 5
+
+    assert window.popleft() == (5, 101)
+    assert window.median() == 2.5
+    assert window.max() == 3
+
+    window.clear()
+    assert not window
+    window.append(4)
+    assert window.mean() == window.median() == window.min() == window.max() == 4
+
+
+def test_matches_statistics():
+    """Test the incremental statistics match the statistics module."""
+    rnd = random.Random(0)
+    window = SampleWindow(50)
+    values = []
+
+    for _ in range(1000):
+        value = rnd.gauss(1e6, 10)
+        window.append(value)
+        values = (values + [value])[-50:]
+        if rnd.random() < 0.1:
+            window.popleft()
+            values.pop(0)
+
+        assert window.mean() == statistics.mean(values)
+        assert window.median() == statistics.median(values)
+        assert window.min() == min(values)
+        assert window.max() == max(values)
+        if len(values) > 1:
+            assert window.variance() == statistics.variance(values)